@@ -0,0 +1,34 @@
+"""Inputs that make backtracking lexers take more than linear time.
+
+Each case builds a script of about ``size`` characters by repeating a
+pattern. Most of them are not valid Puppet: they are what a lexer may be
+given by an untrusted source before it gets the chance to reject it.
+"""
+from typing import Callable, Dict
+
+
+def _repeat(prefix: str, pattern: str, suffix: str = "") -> Callable[[int], str]:
+    def build(size: int) -> str:
+        return prefix + pattern * max(size // len(pattern), 1) + suffix
+
+    return build
+
+
+CASES: Dict[str, Callable[[int], str]] = {
+    # Used to take exponential time in the type name rule
+    "type_colons": _repeat("$a = ", "::", "a"),
+    # Used to take quadratic time, the type name rule scanned to the end of
+    # the expression from every dash
+    "dashes": _repeat("$a = ", "0-", "0\n"),
+    "namespaces": _repeat("$a = ", "a::", "\n"),
+    "blanks": _repeat("", " \t\n", "^"),
+    "unterminated_single_quote": _repeat("$a = '", "a\\'"),
+    "unterminated_double_quote": _repeat('$a = "', '\\"\\\\'),
+    "unterminated_comment": _repeat("/*", "*"),
+    "unterminated_regex": _repeat("if $a =~ /", "\\a"),
+    "unterminated_heredoc": _repeat("$a = @(END)\n", "text\n"),
+    # Quadratic in skim, whose regex was searched again from every position
+    "lone_colons": _repeat("$a = 1", " " * 50 + ":"),
+    "escaped_quotes": _repeat("", "\\'"),
+    "heredoc_openings": _repeat("", "@("),
+}
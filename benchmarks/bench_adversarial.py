@@ -0,0 +1,65 @@
+"""Time per byte of the lexers on the adversarial inputs.
+
+Every case is parsed with both lexers and skimmed, at ``--size`` characters
+and at a tenth of it. The benchmark fails if any of them takes more than
+``--max-us`` microseconds per byte, or if the time per byte of the larger
+input grows more than ``--max-growth`` times, as it would for a lexer that
+is not linear.
+
+    python -m benchmarks.bench_adversarial --size 100000
+"""
+import argparse
+import sys
+import time
+from typing import Callable
+
+from benchmarks.adversarial import CASES
+from puppetparser.parser import InvalidPuppetScript, Parser
+from puppetparser.skim import skim
+
+
+def per_byte(run: Callable[[str], object], script: str) -> float:
+    start = time.perf_counter()
+    try:
+        run(script)
+    except InvalidPuppetScript:
+        pass
+    return (time.perf_counter() - start) / len(script) * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, default=100_000)
+    ap.add_argument("--max-us", type=float, default=20.0)
+    ap.add_argument("--max-growth", type=float, default=4.0)
+    args = ap.parse_args()
+
+    parser = Parser()
+    runs = {
+        "ply": lambda s: parser.parse(s, lexer="ply"),
+        "scanner": lambda s: parser.parse(s, lexer="scanner"),
+        "skim": skim,
+    }
+    failures = []
+    print(f"{'case':>26} {'run':>8}  us/byte at {args.size // 10} and {args.size}")
+    for name, build in CASES.items():
+        small, large = build(args.size // 10), build(args.size)
+        for run_name, run in runs.items():
+            # Best of three, the small inputs are quick to time. Below a tenth
+            # of a microsecond, cache effects make up most of the growth.
+            before = min(per_byte(run, small) for _ in range(3))
+            after = per_byte(run, large)
+            growth = after / max(before, 0.1)
+            failed = after > args.max_us or growth > args.max_growth
+            if failed:
+                failures.append(f"{name} ({run_name})")
+            print(
+                f"{name:>26} {run_name:>8}  {before:7.3f} {after:7.3f}"
+                f"  x{growth:4.1f}{'  FAIL' if failed else ''}"
+            )
+    if failures:
+        sys.exit("Not linear: " + ", ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Request latency of an asyncio service that parses manifests.
+
+Clients keep sending a mix of small and large manifests for a fixed time.
+"inline" parses inside the coroutine, blocking the event loop; "aio" awaits
+puppetparser.aio.parse. A heartbeat task records how late the loop wakes up.
+
+    python -m benchmarks.bench_aio_latency --clients 16 --seconds 10
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+from benchmarks.corpus import manifest
+from puppetparser import aio
+from puppetparser.parser import Parser
+
+
+def percentile(samples: List[float], q: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+
+async def run(mode: str, clients: int, seconds: float, large_share: float) -> None:
+    rng = random.Random(0)
+    small = [manifest(rng, 5) for _ in range(50)]
+    large = [manifest(rng, 2000) for _ in range(5)]
+    parser = Parser()
+    latencies: List[float] = []
+    lags: List[float] = []
+    deadline = time.perf_counter() + seconds
+
+    async def heartbeat() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - start - 0.005)
+
+    async def client(seed: int) -> None:
+        crng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            is_large = crng.random() < large_share
+            script = crng.choice(large if is_large else small)
+            start = time.perf_counter()
+            if mode == "inline":
+                parser.parse(script)
+                await asyncio.sleep(0)
+            else:
+                await aio.parse(script)
+            if not is_large:
+                latencies.append(time.perf_counter() - start)
+
+    if mode == "aio":
+        await aio.parse(small[0])  # start the worker pool before timing
+    await asyncio.gather(heartbeat(), *(client(i) for i in range(clients)))
+    print(
+        f"{mode:>6}: {len(latencies):6} small requests  "
+        f"p50 {statistics.median(latencies) * 1e3:7.1f} ms  "
+        f"p99 {percentile(latencies, 0.99) * 1e3:7.1f} ms  "
+        f"loop lag p99 {percentile(lags, 0.99) * 1e3:7.1f} ms  "
+        f"max {max(lags) * 1e3:7.1f} ms"
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--clients", type=int, default=16)
+    ap.add_argument("--seconds", type=float, default=10)
+    ap.add_argument("--large-share", type=float, default=0.05)
+    args = ap.parse_args()
+    for mode in ("inline", "aio"):
+        asyncio.run(run(mode, args.clients, args.seconds, args.large_share))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Memory and traversal time of the arena representation against the objects.
+
+Traversal collects the titles of all the resources of a repository, by
+walking the object model and through ``Arena.nodes_of_kind``.
+
+    python -m benchmarks.bench_arena --files 500
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from benchmarks.bench_model_memory import nodes
+from benchmarks.corpus import repository
+from puppetparser.model import Resource
+from puppetparser.parser import Parser
+
+
+def measure(build: Callable[[], List[Any]]) -> "tuple[List[Any], int, float]":
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, size, elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=500)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    parser = Parser()
+    parser.parse(sources[0])
+
+    objects, objects_size, objects_time = measure(
+        lambda: [parser.parse(s)[0] for s in sources]
+    )
+    arenas, arena_size, arena_time = measure(
+        lambda: [parser.parse(s, "arena")[0] for s in sources]
+    )
+    count = sum(arena.node_count for arena in arenas)
+    print(f"{args.files} files, {count} nodes")
+    print(
+        f"objects: {objects_size / 1e6:7.1f} MB  {objects_size / count:5.0f} B/node"
+        f"  parse {objects_time:6.2f} s"
+    )
+    print(
+        f"arena:   {arena_size / 1e6:7.1f} MB  {arena_size / count:5.0f} B/node"
+        f"  parse {arena_time:6.2f} s"
+    )
+
+    start = time.perf_counter()
+    titles = [n.title for n in nodes(objects) if isinstance(n, Resource)]
+    walk = time.perf_counter() - start
+    start = time.perf_counter()
+    arena_titles = [r.title for a in arenas for r in a.nodes_of_kind(Resource)]
+    bulk = time.perf_counter() - start
+    start = time.perf_counter()
+    indices = sum(len(a.indices_of_kind(Resource)) for a in arenas)
+    index = time.perf_counter() - start
+    assert len(titles) == len(arena_titles) == indices
+    print(f"resource titles: objects walk {walk * 1e3:7.1f} ms")
+    print(f"                 arena views  {bulk * 1e3:7.1f} ms")
+    print(f"                 arena index  {index * 1e3:7.1f} ms (count only)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Parse time of manifests carrying large /* ... */ blocks.
+
+"charwise" lexes block comments one character at a time in a dedicated
+lexer state, as the parser used to; "single" matches each comment with one
+regular expression.
+
+    python -m benchmarks.bench_block_comments --comment-kb 100 --files 20
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from ply.lex import LexToken
+
+from benchmarks.corpus import manifest
+from puppetparser.model import Comment
+from puppetparser.parser import Parser
+
+
+class CharwiseParser(Parser):
+    states = (("comment", "exclusive"),) + Parser.states
+
+    def t_comment(self, t: LexToken):
+        r"\/\*"
+        self.current = Comment(t.lexer.lineno, self._column(t.lexpos), 0, 0, "")
+        t.lexer.begin("comment")
+
+    def t_unterminated_comment(self, t: LexToken):
+        r"(?!)"
+
+    def t_comment_END(self, t: LexToken):
+        r"\*\/"
+        self.current.end_line = self.current.line + self.current.content.count("\n")
+        self.current.end_col = len(self.current.content.split("\n")[-1])
+        self._ctx.comments.append(self.current)
+        t.lexer.begin("INITIAL")
+
+    def t_comment_content(self, t: LexToken):
+        r".|\n"
+        self.current.content += t.value
+        t.lexer.lineno += t.value.count("\n")
+
+
+def license_block(rng: random.Random, size: int) -> str:
+    words = ["Licensed", "under", "the", "Apache", "License,", "*", "WITHOUT", "/"]
+    lines: List[str] = []
+    length = 0
+    while length < size:
+        line = " * " + " ".join(rng.choice(words) for _ in range(12))
+        lines.append(line)
+        length += len(line) + 1
+    return "/*\n" + "\n".join(lines) + "\n */\n"
+
+
+def bench(parser: Parser, scripts: List[str]) -> float:
+    start = time.perf_counter()
+    for script in scripts:
+        parser.parse(script)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--comment-kb", type=int, nargs="+", default=[10, 100])
+    ap.add_argument("--files", type=int, default=10)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    charwise, single = CharwiseParser(), Parser()
+    for kb in args.comment_kb:
+        scripts = [
+            license_block(rng, kb * 1024) + manifest(rng, 20) for _ in range(args.files)
+        ]
+        size = sum(len(s) for s in scripts) / 1e6
+        old = bench(charwise, scripts)
+        new = bench(single, scripts)
+        print(
+            f"{kb:>4} KB comments: charwise {size / old:6.2f} MB/s  "
+            f"single {size / new:6.2f} MB/s  ({old / new:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Parse time of a full repository with a cold and with a warm ParseCache.
+
+    python -m benchmarks.bench_cache --files 2000
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+from benchmarks.corpus import write_repository
+from puppetparser.cache import ParseCache
+from puppetparser.parser import Parser
+
+
+def run(parse_file: "ParseCache | Parser", paths: List[str]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        with open(path) as f:
+            parse_file.parse(f.read())
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=2000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = write_repository(os.path.join(root, "repo"), args.files)
+        parser = Parser()
+        cache = ParseCache(os.path.join(root, "cache"), parser=parser)
+
+        plain = run(parser, paths)
+        cold = run(cache, paths)
+        warm = run(ParseCache(cache.directory, parser=parser), paths)
+        print(f"{len(paths)} files, cache {cache.size() / 1e6:.1f} MB")
+        print(f"no cache: {plain:7.2f} s")
+        print(f"cold:     {cold:7.2f} s  ({cache.stats})")
+        print(f"warm:     {warm:7.2f} s  ({plain / warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
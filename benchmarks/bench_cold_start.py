@@ -0,0 +1,57 @@
+"""Cold ``import`` + first ``parse()`` latency in fresh interpreters.
+
+Each run starts a new Python process, so nothing is shared between runs
+except files on disk. The first run is discarded as it may have to write
+bytecode. The benchmark fails if the median exceeds the target.
+
+    python -m benchmarks.bench_cold_start --runs 20 --target-ms 100
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+import puppetparser.parser
+imported = time.perf_counter()
+puppetparser.parser.parse("package { 'ntp': ensure => present }")
+parsed = time.perf_counter()
+print(imported - start, parsed - imported)
+"""
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=20)
+    ap.add_argument("--target-ms", type=float, default=100.0)
+    args = ap.parse_args()
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    samples = []
+    for _ in range(args.runs + 1):
+        out = subprocess.run(
+            [sys.executable, "-c", SNIPPET],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        samples.append((float(out[0]) * 1e3, float(out[1]) * 1e3))
+    samples = samples[1:]
+
+    imports = statistics.median(s[0] for s in samples)
+    parses = statistics.median(s[1] for s in samples)
+    total = statistics.median(s[0] + s[1] for s in samples)
+    print(f"import:      {imports:8.1f} ms")
+    print(f"first parse: {parses:8.1f} ms")
+    print(f"total:       {total:8.1f} ms (target {args.target_ms:.0f} ms)")
+    if total > args.target_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Peak memory of iparse() against parse() on a single large manifest.
+
+Elements yielded by iparse() are counted and dropped, as a consumer that
+processes them one at a time would.
+
+    python -m benchmarks.bench_iparse --mb 5
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks.corpus import manifest
+from puppetparser.parser import Parser
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=float, default=5)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    parts = []
+    while sum(map(len, parts)) < args.mb * 1e6:
+        parts.append(manifest(rng, 200))
+    script = "".join(parts)
+    parser = Parser()
+    print(f"{len(script) / 1e6:.1f} MB, {script.count(chr(10)) + 1} lines")
+
+    for name, run in [
+        ("parse", lambda: len(parser.parse(script)[0])),
+        ("iparse", lambda: sum(1 for _ in parser.iparse(script))),
+    ]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = run()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:6s}: {count} elements, {elapsed:6.2f} s", end="")
+        print(f", peak {peak / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
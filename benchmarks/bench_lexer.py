@@ -0,0 +1,51 @@
+"""Lexing throughput of the Scanner against the PLY lexer.
+
+Lexing is timed through ``tokenize``, which switches to the regex and
+heredoc states as the parser would. Whole parses are timed as well.
+
+    python -m benchmarks.bench_lexer --files 500
+"""
+import argparse
+import time
+from typing import Dict, Tuple
+
+from benchmarks.corpus import repository
+from puppetparser.parser import Parser
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=500)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    size = sum(len(source) for source in sources)
+    parser = Parser()
+    parser.parse(sources[0])
+
+    print(f"{args.files} files, {size / 1e6:.1f} MB")
+    times: Dict[str, Tuple[float, float]] = {}
+    for lexer in ("ply", "scanner"):
+        start = time.perf_counter()
+        count = sum(1 for s in sources for _ in parser.tokenize(s, lexer))
+        lexing = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for source in sources:
+            parser.parse(source, lexer=lexer)
+        parsing = time.perf_counter() - start
+        times[lexer] = (lexing, parsing)
+        print(
+            f"{lexer:>7}: lex {lexing:6.2f} s  {size / lexing / 1e6:6.2f} MB/s"
+            f"  {count / lexing / 1e6:5.2f} M tokens/s  parse {parsing:6.2f} s"
+        )
+
+    (ply_lex, ply_parse), (lexing, parsing) = times["ply"], times["scanner"]
+    print(
+        f"scanner: lexing {ply_lex / lexing:.1f}x faster,"
+        f" parsing {ply_parse / parsing:.2f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    main()
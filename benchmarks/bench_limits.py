@@ -0,0 +1,55 @@
+"""Overhead of each of the ParseLimits on the parse time of a repository.
+
+Limits are set high enough never to be reached, so that only the cost of
+checking them is measured.
+
+    python -m benchmarks.bench_limits --files 500
+"""
+import argparse
+import time
+from typing import Dict, List
+
+from benchmarks.corpus import repository
+from puppetparser.parser import ParseLimits, Parser
+
+LIMITS: Dict[str, ParseLimits | None] = {
+    "none": None,
+    "max_size": ParseLimits(max_size=1 << 30),
+    "max_tokens": ParseLimits(max_tokens=1 << 30),
+    "max_depth": ParseLimits(max_depth=1 << 30),
+    "timeout": ParseLimits(timeout=3600),
+    "all": ParseLimits(1 << 30, 1 << 30, 1 << 30, 3600),
+}
+
+
+def bench(parser: Parser, sources: List[str], limits: ParseLimits | None) -> float:
+    start = time.perf_counter()
+    for source in sources:
+        parser.parse(source, limits=limits)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=500)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    parser = Parser()
+    parser.parse(sources[0])
+
+    best = {name: float("inf") for name in LIMITS}
+    for _ in range(args.repeat):
+        # Interleaved, so that all limits see the same machine noise
+        for name, limits in LIMITS.items():
+            best[name] = min(best[name], bench(parser, sources, limits))
+
+    print(f"{args.files} files")
+    for name, elapsed in best.items():
+        overhead = (elapsed / best["none"] - 1) * 100
+        print(f"{name:>10}: {elapsed:6.2f} s  {overhead:+5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
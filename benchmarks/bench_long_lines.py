@@ -0,0 +1,62 @@
+"""Parse time of minified manifests whose lines are thousands of characters.
+
+"rfind" resolves columns by scanning back to the previous newline, as the
+parser used to; "index" uses the per-script line index.
+
+    python -m benchmarks.bench_long_lines --line-length 10000
+"""
+import argparse
+import time
+
+from puppetparser.parser import Parser, find_column
+
+
+class RfindParser(Parser):
+    def _column(self, pos: int) -> int:
+        return find_column(self._ctx.script, pos)
+
+
+def minified(line_length: int, lines: int) -> str:
+    out = []
+    for i in range(lines):
+        parts = []
+        size = 0
+        n = 0
+        while size < line_length:
+            part = f"file {{ '/tmp/{i}_{n}': ensure => present, mode => '0644' }} "
+            parts.append(part)
+            size += len(part)
+            n += 1
+        out.append("".join(parts))
+    return "\n".join(out)
+
+
+def bench(parser: Parser, script: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse(script)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--line-length", type=int, nargs="+", default=[1000, 10000])
+    ap.add_argument("--lines", type=int, default=5)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    rfind, index = RfindParser(), Parser()
+    for length in args.line_length:
+        script = minified(length, args.lines)
+        old = bench(rfind, script, args.repeat)
+        new = bench(index, script, args.repeat)
+        print(
+            f"{length:>7} chars/line: rfind {old * 1e3:9.1f} ms  "
+            f"index {new * 1e3:9.1f} ms  ({old / new:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Parse time of manifests dominated by one long list.
+
+Per-element time should stay flat as the list grows; it used to grow
+linearly because every level of the right-recursive productions copied the
+tail of the list.
+
+    python -m benchmarks.bench_long_lists --sizes 1000 10000 100000
+"""
+import argparse
+import time
+from typing import Callable, Dict
+
+from puppetparser.parser import Parser
+
+
+def class_body(n: int) -> str:
+    body = "\n".join(f"  file {{ '/tmp/{i}': ensure => present }}" for i in range(n))
+    return f"class big {{\n{body}\n}}\n"
+
+
+def hash_literal(n: int) -> str:
+    pairs = ",\n".join(f"  'key{i}' => {i}" for i in range(n))
+    return f"$data = {{\n{pairs},\n}}\n"
+
+
+def array_literal(n: int) -> str:
+    items = ",\n".join(f"  'item{i}'" for i in range(n))
+    return f"$data = [\n{items},\n]\n"
+
+
+def resource_bodies(n: int) -> str:
+    bodies = ";\n".join(f"  '/tmp/{i}': mode => '0644'" for i in range(n))
+    return f"file {{\n{bodies};\n}}\n"
+
+
+def attributes(n: int) -> str:
+    attrs = ",\n".join(f"  attr{i} => {i}" for i in range(n))
+    return f"file {{ '/tmp/a':\n{attrs},\n}}\n"
+
+
+SHAPES: Dict[str, Callable[[int], str]] = {
+    "statements": class_body,
+    "hash": hash_literal,
+    "array": array_literal,
+    "resources": resource_bodies,
+    "attributes": attributes,
+}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    args = ap.parse_args()
+
+    parser = Parser()
+    for shape in args.shapes:
+        for n in args.sizes:
+            script = SHAPES[shape](n)
+            start = time.perf_counter()
+            parser.parse(script)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{shape:>10} {n:>7}: {elapsed * 1e3:9.1f} ms  "
+                f"{elapsed / n * 1e6:6.1f} us/element"
+            )
+
+
+if __name__ == "__main__":
+    main()
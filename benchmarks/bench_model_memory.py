@@ -0,0 +1,79 @@
+"""Memory held by the object model of a synthetic repository.
+
+The total is measured with tracemalloc; the per-type numbers are the size
+of the node objects themselves (and of their ``__dict__``, when they have
+one), without the values they point to.
+
+    python -m benchmarks.bench_model_memory --files 500
+"""
+import argparse
+import sys
+import tracemalloc
+from collections import Counter
+from typing import Any, Iterator, List
+
+from benchmarks.corpus import repository
+from puppetparser.model import CodeElement
+from puppetparser.parser import Parser
+
+
+def attributes(node: Any) -> Iterator[Any]:
+    if hasattr(node, "__dict__"):
+        yield from vars(node).values()
+    for cls in type(node).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(node, name):
+                yield getattr(node, name)
+
+
+def nodes(value: Any) -> Iterator[CodeElement]:
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, CodeElement):
+            yield value
+            stack.extend(attributes(value))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+
+
+def shallow_size(node: CodeElement) -> int:
+    size = sys.getsizeof(node)
+    if hasattr(node, "__dict__"):
+        size += sys.getsizeof(vars(node))
+    return size
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=500)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    parser = Parser()
+    parser.parse(sources[0])
+
+    tracemalloc.start()
+    results: List[Any] = [parser.parse(source) for source in sources]
+    total, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    counts: Counter[str] = Counter()
+    sizes: Counter[str] = Counter()
+    for node in nodes(results):
+        counts[type(node).__name__] += 1
+        sizes[type(node).__name__] += shallow_size(node)
+
+    n = sum(counts.values())
+    print(f"{args.files} files, {n} nodes")
+    print(f"total {total / 1e6:8.1f} MB  {total / n:6.0f} bytes/node (tracemalloc)")
+    print(f"nodes {sum(sizes.values()) / 1e6:8.1f} MB  (objects only)")
+    for name, count in counts.most_common():
+        print(f"  {name:>20} {count:9}  {sizes[name] / count:6.0f} bytes/node")
+
+
+if __name__ == "__main__":
+    main()
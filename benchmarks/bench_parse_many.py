@@ -0,0 +1,39 @@
+"""Throughput of parse_many() over a synthetic control repository.
+
+    python -m benchmarks.bench_parse_many --files 10000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import write_repository
+from puppetparser import parse_many
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=10000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = write_repository(root, args.files)
+        size = sum(os.path.getsize(p) for p in paths) / 1e6
+        print(f"{len(paths)} files, {size:.1f} MB, {os.cpu_count()} CPUs")
+
+        base = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            errors = sum(r.error is not None for r in parse_many(paths, workers))
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            print(
+                f"{workers:>3} workers: {elapsed:7.2f} s  "
+                f"{len(paths) / elapsed:8.0f} files/s  {size / elapsed:6.2f} MB/s  "
+                f"({base / elapsed:.1f}x, {errors} errors)"
+            )
+
+
+if __name__ == "__main__":
+    main()
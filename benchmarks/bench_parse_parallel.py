@@ -0,0 +1,56 @@
+"""Speedup of parse_parallel() on a single large manifest, by number of
+workers.
+
+    python -m benchmarks.bench_parse_parallel --mb 20 --workers 1 2 4 8
+"""
+import argparse
+import os
+import random
+import time
+
+from benchmarks.corpus import manifest
+from puppetparser import parse_parallel
+from puppetparser.parser import parse
+from puppetparser.skim import statement_starts
+
+
+def generated(size: int) -> str:
+    # A generated site manifest of about ``size`` characters
+    rng = random.Random(0)
+    parts = []
+    total = 0
+    while total < size:
+        parts.append(manifest(rng, 200))
+        total += len(parts[-1])
+    return "".join(parts)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=float, default=20)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    ap.add_argument("--chunk-size", type=int, default=None)
+    args = ap.parse_args()
+
+    script = generated(int(args.mb * 1e6))
+    start = time.perf_counter()
+    starts = statement_starts(script)
+    scan = time.perf_counter() - start
+    print(f"{len(script) / 1e6:.1f} MB, {script.count(chr(10)) + 1} lines")
+    print(f"{os.cpu_count()} CPUs, {len(starts)} statements found in {scan:.2f} s")
+
+    start = time.perf_counter()
+    count = len(parse(script)[0])
+    base = time.perf_counter() - start
+    print(f"parse():   {base:7.2f} s")
+    for workers in args.workers:
+        start = time.perf_counter()
+        elements, _ = parse_parallel(script, workers, args.chunk_size)
+        elapsed = time.perf_counter() - start
+        assert len(elements) == count
+        del elements
+        print(f"{workers:3d} workers: {elapsed:7.2f} s  {base / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
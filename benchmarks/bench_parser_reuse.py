@@ -0,0 +1,38 @@
+"""Per-file cost of parsing many tiny manifests.
+
+"rebuild" constructs a new Parser for every file, which is what ``parse()``
+used to do on each call; "shared" goes through the module-level parser.
+
+    python -m benchmarks.bench_parser_reuse --files 1000
+"""
+import argparse
+import time
+
+from benchmarks.corpus import tiny_manifest
+from puppetparser.parser import Parser, parse
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=1000)
+    args = ap.parse_args()
+    sources = [tiny_manifest(i) for i in range(args.files)]
+    parse(sources[0])  # make sure parse tables exist before timing
+
+    start = time.perf_counter()
+    for source in sources:
+        Parser().parse(source)
+    rebuild = (time.perf_counter() - start) / len(sources)
+
+    start = time.perf_counter()
+    for source in sources:
+        parse(source)
+    shared = (time.perf_counter() - start) / len(sources)
+
+    print(f"files:   {len(sources)}")
+    print(f"rebuild: {rebuild * 1e6:10.1f} us/file")
+    print(f"shared:  {shared * 1e6:10.1f} us/file ({rebuild / shared:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Structural queries over a large repository: the cost of building the
+indexes, and that of each query once they are built, against walking every
+tree by hand.
+
+    python -m benchmarks.bench_query --files 2000
+"""
+import argparse
+import gc
+import time
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.corpus import repository
+from puppetparser.model import Attribute, CodeElement, Resource, Value
+from puppetparser.parser import Parser
+from puppetparser.query import Index, compile
+from puppetparser.visitor import walk
+
+QUERIES = [
+    "Resource[type=file]/Attribute[key=mode]/Value:str",
+    "Resource[type=package]/Attribute[key=ensure]",
+    "Resource[type=service]",
+    "FunctionCall[name=lookup]",
+    "PuppetClass//Resource[type=exec]",
+    "Assignment/Hash",
+]
+
+
+def by_hand(trees: List[Tuple[str, List[CodeElement]]]) -> int:
+    # The first query, as it is written without the query language
+    found = 0
+    for _, tree in trees:
+        for element in walk(tree):
+            if isinstance(element, Resource) and element.type.value == "file":
+                for attribute in element.attributes:
+                    if (
+                        isinstance(attribute, Attribute)
+                        and attribute.key.value == "mode"
+                        and type(attribute.value) is Value
+                        and isinstance(attribute.value.value, str)
+                    ):
+                        found += 1
+    return found
+
+
+def timed(run: Callable[[], Any]) -> Tuple[float, Any]:
+    # Collections of the garbage left by parsing would land in any phase
+    gc.collect()
+    start = time.perf_counter()
+    result = run()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=2000)
+    args = ap.parse_args()
+
+    parser = Parser()
+    trees = [(path, parser.parse(source)[0]) for path, source in repository(args.files)]
+    nodes = sum(1 for _, tree in trees for _ in walk(tree))
+    print(f"{len(trees)} files, {nodes} nodes")
+
+    start = time.perf_counter()
+    queries = [compile(text) for text in QUERIES]
+    compiling = time.perf_counter() - start
+    print(f"compile {len(queries)} queries: {compiling * 1000:8.2f} ms")
+
+    indexes = [Index(tree, path) for path, tree in trees]
+    build, _ = timed(lambda: [index.of_class(Resource) for index in indexes])
+    print(f"index by class:      {build * 1000:8.1f} ms")
+    build, _ = timed(lambda: [index.resources_of_type("file") for index in indexes])
+    print(f"index by type:       {build * 1000:8.1f} ms")
+
+    for query in queries:
+        elapsed, matches = timed(
+            lambda: sum(len(m) for _, m in query.run_many(indexes))
+        )
+        print(f"{elapsed * 1000:8.1f} ms {matches:7d} matches  {query.text}")
+
+    elapsed, found = timed(lambda: by_hand(trees))
+    matches = sum(len(m) for _, m in queries[0].run_many(indexes))
+    assert found == matches, (found, matches)
+    print(f"{elapsed * 1000:8.1f} ms {found:7d} matches  walking by hand")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Cost of recovering from errors, on valid and on broken scripts.
+
+Broken scripts have a closing brace removed, an operator doubled, or a
+keyword inserted at random places.
+
+    python -m benchmarks.bench_recovery --files 300
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from benchmarks.corpus import repository
+from puppetparser.parser import InvalidPuppetScript, ParseError, Parser
+
+DAMAGE = ["", "= =", "class", ") )", "{"]
+
+
+def broken(rng: random.Random, source: str) -> str:
+    for _ in range(3):
+        pos = rng.randrange(len(source))
+        source = source[:pos] + " " + rng.choice(DAMAGE) + " " + source[pos + 1 :]
+    return source
+
+
+def bench(parser: Parser, sources: List[str], recover: bool) -> float:
+    start = time.perf_counter()
+    for source in sources:
+        parser.parse(source, errors=[] if recover else None)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=300)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    parser = Parser()
+    parser.parse(sources[0])
+
+    raising = recovering = float("inf")
+    for _ in range(args.repeat):
+        raising = min(raising, bench(parser, sources, False))
+        recovering = min(recovering, bench(parser, sources, True))
+    print(f"{args.files} valid files")
+    print(f"raise:   {raising:6.2f} s")
+    print(f"recover: {recovering:6.2f} s  {(recovering / raising - 1) * 100:+5.1f}%")
+
+    rng = random.Random(0)
+    errors: List[ParseError] = []
+    elements = failed = 0
+    start = time.perf_counter()
+    for source in sources:
+        try:
+            elements += len(parser.parse(broken(rng, source), errors=errors)[0])
+        except InvalidPuppetScript:
+            # Raised by the checks of the grammar rules
+            failed += 1
+    elapsed = time.perf_counter() - start
+    print(f"{args.files} broken files: {elapsed:6.2f} s")
+    print(f"{len(errors)} errors, {elements} top-level elements, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
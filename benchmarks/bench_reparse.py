@@ -0,0 +1,71 @@
+"""Reparsing a large manifest after single-character edits, against parsing it
+again from scratch.
+
+Each edit inserts a space next to an existing one, at a random place, as an
+editor would on every keystroke.
+
+    python -m benchmarks.bench_reparse --lines 5000 --edits 50
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from benchmarks.corpus import repository
+from puppetparser.parser import InvalidPuppetScript, ParsedScript, Parser
+
+
+def manifest(parser: Parser, lines: int) -> str:
+    sources: List[str] = []
+    total = 0
+    for _, source in repository(10 * lines):
+        try:
+            parser.parse(source)
+        except InvalidPuppetScript:
+            continue
+        sources.append(source)
+        total += source.count("\n") + 1
+        if total >= lines:
+            break
+    return "\n".join(sources)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=5000)
+    ap.add_argument("--edits", type=int, default=50)
+    args = ap.parse_args()
+
+    parser = Parser()
+    script = manifest(parser, args.lines)
+    rng = random.Random(0)
+    positions = []
+    scripts = []
+    edited = script
+    for _ in range(args.edits):
+        pos = edited.find(" ", rng.randrange(len(edited)))
+        pos = pos if pos >= 0 else edited.find(" ")
+        edited = edited[:pos] + " " + edited[pos:]
+        positions.append(pos)
+        scripts.append(edited)
+
+    previous = ParsedScript(script, *parser.parse(script))
+    start = time.perf_counter()
+    for pos in positions:
+        previous = parser.reparse(previous, [(pos, pos, " ")])
+    reparse = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for edited in scripts:
+        parser.parse(edited)
+    full = time.perf_counter() - start
+
+    assert previous.script == edited
+    print(f"{edited.count(chr(10)) + 1} lines, {args.edits} edits")
+    print(f"parse:   {full / args.edits * 1000:8.2f} ms per edit")
+    speedup = full / reparse
+    print(f"reparse: {reparse / args.edits * 1000:8.2f} ms per edit  {speedup:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Eighty rules run over a corpus with one traversal per rule, as separate
+checks would, and fused in a single Engine.
+
+The rules come from four families, about resources, assignments, function
+calls and strings, each with twenty parameters. The most expensive rules of
+the fused run are listed from the engine's timings.
+
+    python -m benchmarks.bench_rules --nodes 300000 --rules 80
+"""
+import argparse
+import time
+from typing import Any, Callable, List
+
+from benchmarks.corpus import PACKAGES, SERVICES, repository
+from puppetparser.model import Assignment, CodeElement, FunctionCall, Resource, Value
+from puppetparser.parser import Parser
+from puppetparser.rules import Engine, Rule
+from puppetparser.visitor import walk
+
+WORDS = PACKAGES + SERVICES + ["root", "www-data", "present", "latest", "0644"]
+
+
+class ResourceAttribute(Rule):
+    # Resources of a type that set an attribute
+    def __init__(self, i: int) -> None:
+        super().__init__()
+        self.name = f"resource-{i}"
+        self.type = ["package", "file", "service", "user", "exec"][i % 5]
+        self.key = ["ensure", "owner", "group", "mode"][i % 4]
+
+    def visit_Resource(self, node: Resource) -> None:
+        if node.type.value == self.type:
+            for attribute in node.attributes:
+                if attribute.key.value == self.key:
+                    self.report(attribute, f"{self.type} sets {self.key}")
+
+
+class AssignedName(Rule):
+    # Assignments to variables whose name contains a word
+    def __init__(self, i: int) -> None:
+        super().__init__()
+        self.name = f"assignment-{i}"
+        self.word = ["x", "a", "config", "port", "content"][i % 5]
+
+    def visit_Assignment(self, node: Assignment) -> None:
+        if self.word in node.name.value:
+            self.report(node, f"assignment to {node.name.value}")
+
+
+class CalledFunction(Rule):
+    # Calls of a function
+    def __init__(self, i: int) -> None:
+        super().__init__()
+        self.name = f"function-{i}"
+        self.function = ["lookup", "template", "include", "notice"][i % 4]
+
+    def visit_FunctionCall(self, node: FunctionCall) -> None:
+        if node.name == self.function:
+            self.report(node, f"call to {self.function}")
+
+
+class StringValue(Rule):
+    # String literals that contain a word
+    def __init__(self, i: int) -> None:
+        super().__init__()
+        self.name = f"string-{i}"
+        self.word = WORDS[i % len(WORDS)]
+
+    def visit_Value(self, node: Value) -> None:
+        value = node.value
+        if value.__class__ is str and self.word in value:
+            self.report(node, f"string with {self.word}")
+
+    def visit_Id(self, node: Value) -> None:
+        pass
+
+
+FAMILIES = [ResourceAttribute, AssignedName, CalledFunction, StringValue]
+
+
+def timed(label: str, run: Callable[[], Any], base: float | None = None) -> float:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    speedup = f"  {base / elapsed:5.2f}x" if base else ""
+    print(f"{label:22s} {elapsed:6.2f} s{speedup}")
+    return elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodes", type=int, default=300000)
+    ap.add_argument("--rules", type=int, default=80)
+    args = ap.parse_args()
+
+    parser = Parser()
+    trees: List[List[CodeElement]] = []
+    nodes = 0
+    for _, source in repository(args.nodes // 100):
+        trees.append(parser.parse(source)[0])
+        nodes += sum(1 for _ in walk(trees[-1]))
+        if nodes >= args.nodes:
+            break
+    start = time.perf_counter()
+    for _, source in repository(len(trees)):
+        parser.parse(source)
+    parsing = time.perf_counter() - start
+    print(f"{len(trees)} files, {nodes} nodes, {args.rules} rules")
+    print(f"{'parse':22s} {parsing:6.2f} s")
+
+    def rules() -> List[Rule]:
+        return [FAMILIES[i % 4](i // 4) for i in range(args.rules)]
+
+    findings = [0, 0]
+
+    def separate() -> None:
+        engines = [Engine([rule]) for rule in rules()]
+        for tree in trees:
+            for engine in engines:
+                findings[0] += len(engine.run(tree))
+
+    def fused() -> None:
+        engine = Engine(rules())
+        for tree in trees:
+            findings[1] += len(engine.run(tree))
+
+    base = timed("one walk per rule", separate)
+    timed("fused", fused, base)
+    assert findings[0] == findings[1], findings
+
+    engine = Engine(rules(), timing=True)
+    start = time.perf_counter()
+    for tree in trees:
+        engine.run(tree)
+    elapsed = time.perf_counter() - start
+    print(f"{'fused with timing':22s} {elapsed:6.2f} s  ({findings[1]} findings)")
+    timings = sorted(engine.timings.items(), key=lambda item: -item[1])
+    for name, seconds in timings[:5]:
+        print(f"  {name:20s} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
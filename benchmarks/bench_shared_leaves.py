@@ -0,0 +1,51 @@
+"""Memory and parse time with and without shared leaves.
+
+Also counts the distinct objects behind the values of identifiers, which are
+interned in both modes, and of the leaves themselves.
+
+    python -m benchmarks.bench_shared_leaves --files 500
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Any, List
+
+from benchmarks.bench_model_memory import nodes
+from benchmarks.corpus import repository
+from puppetparser.model import Id, Value
+from puppetparser.parser import Parser
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=500)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    parser = Parser()
+    parser.parse(sources[0])
+
+    for share in (False, True):
+        start = time.perf_counter()
+        for source in sources:
+            parser.parse(source, share_leaves=share)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        results: List[Any] = [
+            parser.parse(source, share_leaves=share)[0] for source in sources
+        ]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        leaves = [n for n in nodes(results) if type(n) in (Value, Id)]
+        ids = [n for n in leaves if type(n) is Id]
+        print(
+            f"share_leaves={share!s:5}  parse {elapsed:6.2f} s  {size / 1e6:7.1f} MB"
+            f"  leaves {len(leaves):8} ({len({id(n) for n in leaves}):8} objects)"
+            f"  identifiers {len(ids):8} ({len({id(n.value) for n in ids}):6} strings)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Throughput of skim() against parse() on the same repository.
+
+    python -m benchmarks.bench_skim --files 500
+"""
+import argparse
+import time
+
+from benchmarks.corpus import repository
+from puppetparser.parser import parse
+from puppetparser.skim import skim
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=500)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    size = sum(len(source) for source in sources)
+    parse(sources[0])
+
+    start = time.perf_counter()
+    for source in sources:
+        parse(source)
+    parsing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    declarations = sum(len(skim(source).declarations) for source in sources)
+    skimming = time.perf_counter() - start
+
+    print(f"{args.files} files, {size / 1e6:.1f} MB, {declarations} declarations")
+    print(f"parse: {parsing:6.2f} s  {size / parsing / 1e6:6.2f} MB/s")
+    print(
+        f"skim:  {skimming:6.2f} s  {size / skimming / 1e6:6.2f} MB/s"
+        f"  ({parsing / skimming:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Throughput of tokenize() against parse() on the same repository.
+
+    python -m benchmarks.bench_tokenize --files 500
+"""
+import argparse
+import time
+from collections import Counter
+
+from benchmarks.corpus import repository
+from puppetparser.parser import parse, tokenize
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=500)
+    args = ap.parse_args()
+
+    sources = [source for _, source in repository(args.files)]
+    size = sum(len(source) for source in sources)
+    parse(sources[0])
+
+    start = time.perf_counter()
+    for source in sources:
+        parse(source)
+    parsing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    types: Counter[str] = Counter()
+    for source in sources:
+        types.update(token.type for token in tokenize(source))
+    tokenizing = time.perf_counter() - start
+
+    print(f"{args.files} files, {size / 1e6:.1f} MB, {sum(types.values())} tokens")
+    print(f"parse:    {parsing:6.2f} s  {size / parsing / 1e6:6.2f} MB/s")
+    print(
+        f"tokenize: {tokenizing:6.2f} s  {size / tokenizing / 1e6:6.2f} MB/s"
+        f"  ({parsing / tokenizing:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
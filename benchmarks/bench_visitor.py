@@ -0,0 +1,127 @@
+"""Traversal of a corpus of about a million nodes, with walk() and Visitor
+against the recursive walkers they replace.
+
+Each traversal counts the nodes by class, or the resources and the values
+in the case of visitors.
+
+    python -m benchmarks.bench_visitor --nodes 1000000
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, List
+
+from benchmarks.corpus import repository
+from puppetparser.arena import FIELDS
+from puppetparser.model import CodeElement, Resource, Value
+from puppetparser.parser import Parser
+from puppetparser.visitor import Visitor, walk
+
+
+def recursive_count(value: Any, counts: Counter) -> None:
+    # Generic recursive walker, with isinstance tests on each value
+    if isinstance(value, CodeElement):
+        counts[type(value)] += 1
+        for name in FIELDS[type(value)]:
+            recursive_count(getattr(value, name), counts)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            recursive_count(v, counts)
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            recursive_count(k, counts)
+            recursive_count(v, counts)
+
+
+class RecursiveVisitor:
+    # Method looked up by name on each node, as in ast.NodeVisitor
+    def __init__(self) -> None:
+        self.resources = self.values = 0
+
+    def visit(self, value: Any) -> None:
+        if isinstance(value, CodeElement):
+            method = getattr(self, "visit_" + type(value).__name__, None)
+            if method is not None:
+                method(value)
+            for name in FIELDS[type(value)]:
+                self.visit(getattr(value, name))
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                self.visit(v)
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                self.visit(k)
+                self.visit(v)
+
+    def visit_Resource(self, node: Resource) -> None:
+        self.resources += 1
+
+    def visit_Value(self, node: Value) -> None:
+        self.values += 1
+
+
+class CountingVisitor(Visitor):
+    def __init__(self) -> None:
+        self.resources = self.values = 0
+
+    def visit_Resource(self, node: Resource) -> None:
+        self.resources += 1
+
+    def visit_Value(self, node: Value) -> None:
+        self.values += 1
+
+
+def timed(label: str, run: Callable[[], Any], base: float | None = None) -> float:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    speedup = f"  {base / elapsed:5.2f}x" if base else ""
+    print(f"{label:18s} {elapsed:6.2f} s{speedup}")
+    return elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodes", type=int, default=1000000)
+    args = ap.parse_args()
+    sys.setrecursionlimit(10000)
+
+    parser = Parser()
+    trees: List[List[CodeElement]] = []
+    nodes = 0
+    for _, source in repository(args.nodes // 100):
+        trees.append(parser.parse(source)[0])
+        nodes += sum(1 for _ in walk(trees[-1]))
+        if nodes >= args.nodes:
+            break
+    print(f"{len(trees)} files, {nodes} nodes")
+
+    def recursive() -> None:
+        counts: Counter = Counter()
+        for tree in trees:
+            recursive_count(tree, counts)
+
+    def walked() -> None:
+        counts: Counter = Counter()
+        for tree in trees:
+            counts.update(type(node) for node in walk(tree))
+
+    def recursive_visitor() -> None:
+        visitor = RecursiveVisitor()
+        for tree in trees:
+            visitor.visit(tree)
+
+    def visitor() -> None:
+        counting = CountingVisitor()
+        for tree in trees:
+            counting.visit(tree)
+
+    base = timed("recursive count", recursive)
+    timed("walk() count", walked, base)
+    base = timed("recursive visitor", recursive_visitor)
+    timed("Visitor", visitor, base)
+
+
+if __name__ == "__main__":
+    main()
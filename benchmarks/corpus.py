@@ -0,0 +1,155 @@
+"""Deterministic synthetic Puppet manifests used by the benchmarks."""
+import os
+import random
+from typing import List, Tuple
+
+PACKAGES = ["apache2", "nginx", "ntp", "openssh-server", "rsyslog", "curl", "git"]
+SERVICES = ["apache2", "nginx", "ntpd", "sshd", "rsyslog", "cron"]
+FILES = ["/etc/motd", "/etc/ntp.conf", "/etc/ssh/sshd_config", "/var/www/index.html"]
+MODES = ["'0644'", "'0600'", "'0755'", "'0440'"]
+FACTS = ["$facts['os']['family']", "$facts['is_virtual']", "$::osfamily", "$role"]
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(["base", "profile", "role", "apache", "ntp", "ssh"]) + (
+        "::" + rng.choice(["params", "config", "install", "service", "linux"])
+    )
+
+
+def _value(rng: random.Random, depth: int = 0) -> str:
+    kind = rng.randrange(9 if depth < 2 else 6)
+    if kind == 0:
+        return rng.choice(MODES)
+    if kind == 1:
+        return str(rng.randrange(1, 5000))
+    if kind == 2:
+        return rng.choice(["true", "false", "undef"])
+    if kind == 3:
+        return "$" + rng.choice(["content", "port", "ensure", "owner", "config"])
+    if kind == 4:
+        return f"\"${{{rng.choice(['content', 'fqdn'])}}} {rng.randrange(100)}\""
+    if kind == 5:
+        return f"{rng.choice(['Package', 'File', 'Service'])}['{rng.choice(PACKAGES)}']"
+    if kind == 6:
+        items = ", ".join(_value(rng, depth + 1) for _ in range(rng.randrange(1, 4)))
+        return f"[{items}]"
+    if kind == 7:
+        pairs = ", ".join(
+            f"'k{i}' => {_value(rng, depth + 1)}" for i in range(rng.randrange(1, 4))
+        )
+        return "{" + pairs + "}"
+    return f"{rng.choice(FACTS)} ? {{ 'Debian' => 'www-data', default => 'root' }}"
+
+
+def _attributes(rng: random.Random, indent: str) -> str:
+    keys = ["ensure", "owner", "group", "mode", "content", "require", "notify"]
+    rng.shuffle(keys)
+    lines = [
+        f"{indent}{k} => {_value(rng)}," for k in keys[: rng.randrange(1, len(keys))]
+    ]
+    return "\n".join(lines)
+
+
+def _resource(rng: random.Random, indent: str) -> str:
+    rtype = rng.choice(["package", "file", "service", "user", "exec"])
+    title = rng.choice(PACKAGES + FILES + SERVICES)
+    prefix = rng.choice(["", "", "", "", "@", "@@"])
+    return (
+        f"{indent}{prefix}{rtype} {{ '{title}':\n"
+        f"{_attributes(rng, indent + '  ')}\n"
+        f"{indent}}}"
+    )
+
+
+def _statement(rng: random.Random, indent: str, depth: int) -> str:
+    kind = rng.randrange(12 if depth < 2 else 6)
+    if kind <= 2:
+        return _resource(rng, indent)
+    if kind == 3:
+        return f"{indent}${rng.choice(['port', 'owner', 'config'])} = {_value(rng)}"
+    if kind == 4:
+        return f"{indent}{rng.choice(['include', 'contain', 'require'])} {_name(rng)}"
+    if kind == 5:
+        return f"{indent}# {rng.choice(['managed by puppet', 'TODO', 'see docs'])}"
+    inner = indent + "  "
+    body = "\n".join(
+        _statement(rng, inner, depth + 1) for _ in range(rng.randrange(1, 4))
+    )
+    if kind == 6:
+        return (
+            f"{indent}if {rng.choice(FACTS)} == 'Debian' and !$disabled {{\n{body}\n"
+            f"{indent}}} elsif $port > 1024 {{\n{body}\n{indent}}} else {{\n{indent}}}"
+        )
+    if kind == 7:
+        return (
+            f"{indent}case {rng.choice(FACTS)} {{\n"
+            f"{inner}'RedHat', 'CentOS': {{ include role::redhat }}\n"
+            f"{inner}/^(Debian|Ubuntu)$/: {{\n{body}\n{inner}}}\n"
+            f"{inner}default: {{ }}\n{indent}}}"
+        )
+    if kind == 8:
+        return f"{indent}$packages.each |$pkg| {{\n{body}\n{indent}}}"
+    if kind == 9:
+        return (
+            f"{indent}Package['{rng.choice(PACKAGES)}'] -> "
+            f"File['{rng.choice(FILES)}'] ~> Service['{rng.choice(SERVICES)}']"
+        )
+    if kind == 10:
+        return f"{indent}unless $facts['is_virtual'] {{\n{body}\n{indent}}}"
+    return f"{indent}/* {rng.choice(['block', 'license'])} comment\n{indent}   spanning lines */"
+
+
+def manifest(rng: random.Random, statements: int) -> str:
+    """Build one module-style manifest with roughly ``statements`` statements."""
+    parts: List[str] = []
+    while statements > 0:
+        size = min(statements, rng.randrange(3, 12))
+        statements -= size
+        body = "\n".join(_statement(rng, "  ", 0) for _ in range(size))
+        kind = rng.randrange(4)
+        if kind == 0:
+            parts.append(
+                f"class {_name(rng)} (\n  String $content = '',\n  Integer $port = 80,\n)"
+                f" inherits {_name(rng)} {{\n{body}\n}}"
+            )
+        elif kind == 1:
+            parts.append(
+                f"define {_name(rng)} (String $ensure = 'present', $owner) {{\n{body}\n}}"
+            )
+        elif kind == 2:
+            parts.append(
+                f"node '{rng.choice(['web01', 'db01', 'lb01'])}' {{\n{body}\n}}"
+            )
+        else:
+            parts.append(body.replace("\n  ", "\n")[2:])
+    return "\n\n".join(parts) + "\n"
+
+
+def tiny_manifest(i: int) -> str:
+    return f"package {{ 'pkg{i}':\n  ensure => present,\n}}\n"
+
+
+def repository(
+    files: int, statements: int = 40, seed: int = 0
+) -> List[Tuple[str, str]]:
+    """Return ``(path, source)`` pairs for a synthetic control repository."""
+    rng = random.Random(seed)
+    return [
+        (
+            f"modules/m{i // 50}/manifests/f{i}.pp",
+            manifest(rng, rng.randrange(1, statements * 2)),
+        )
+        for i in range(files)
+    ]
+
+
+def write_repository(root: str, files: int, statements: int = 40, seed: int = 0):
+    """Materialize :func:`repository` under ``root`` and return the file paths."""
+    paths: List[str] = []
+    for rel, source in repository(files, statements, seed):
+        path = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(source)
+        paths.append(path)
+    return paths
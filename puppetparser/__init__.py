@@ -0,0 +1,4 @@
+from puppetparser.batch import ParseResult, parse_many, parse_parallel
+from puppetparser.parser import Token, tokenize
+
+__all__ = ["ParseResult", "Token", "parse_many", "parse_parallel", "tokenize"]
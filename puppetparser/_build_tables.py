@@ -0,0 +1,25 @@
+"""Regenerate the parse tables shipped in ``puppetparser/parsetab.py``.
+
+Run ``python -m puppetparser._build_tables`` after changing the grammar.
+"""
+import os
+
+from ply.yacc import yacc
+
+from puppetparser.parser import Parser, TABLES_MODULE
+
+
+def main() -> None:
+    # Only the grammar rules are needed, not a fully constructed parser
+    parser = Parser.__new__(Parser)
+    outputdir = os.path.dirname(os.path.abspath(__file__))
+    yacc(
+        module=parser,
+        debug=False,
+        tabmodule=TABLES_MODULE.rsplit(".", 1)[1],
+        outputdir=outputdir,
+    )
+
+
+if __name__ == "__main__":
+    main()
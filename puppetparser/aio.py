@@ -0,0 +1,98 @@
+"""asyncio front-end that keeps parsing off the event loop."""
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, Iterable, List, Tuple
+
+from puppetparser.batch import ParseResult, init_worker, parse_in_worker, worker_parser
+from puppetparser.model import CodeElement, Comment
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def _default_executor() -> Executor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(initializer=init_worker)
+            # Starts the workers, which build their parsers in the background
+            _executor.submit(_warm)
+        return _executor
+
+
+def _warm() -> None:
+    worker_parser()
+
+
+def _parse_script(script: str) -> Tuple[List[CodeElement], List[Comment]]:
+    return worker_parser().parse(script)
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+async def parse(
+    script: str, executor: Executor | None = None
+) -> Tuple[List[CodeElement], List[Comment]]:
+    """Parse ``script`` on ``executor``, a shared process pool by default."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or _default_executor(), _parse_script, script
+    )
+
+
+async def _parse_file(executor: Executor, path: str) -> ParseResult:
+    loop = asyncio.get_running_loop()
+    try:
+        script = await loop.run_in_executor(None, _read, path)
+        return await loop.run_in_executor(executor, parse_in_worker, (path, script))
+    except Exception as e:
+        return ParseResult(path, None, None, e)
+
+
+async def parse_files(
+    paths: Iterable[str | os.PathLike[str]],
+    concurrency: int = 8,
+    executor: Executor | None = None,
+) -> AsyncIterator[ParseResult]:
+    """Parse files with at most ``concurrency`` of them in flight.
+
+    Results are yielded as they complete. Files that cannot be read or
+    parsed are reported in the ``error`` field of their result.
+    """
+    pool = executor or _default_executor()
+    pending: "asyncio.Queue[str | None]" = asyncio.Queue(concurrency)
+    results: "asyncio.Queue[ParseResult | None]" = asyncio.Queue(concurrency)
+
+    async def produce() -> None:
+        try:
+            for path in paths:
+                await pending.put(os.fspath(path))
+        finally:
+            for _ in range(concurrency):
+                await pending.put(None)
+
+    async def work() -> None:
+        while (path := await pending.get()) is not None:
+            await results.put(await _parse_file(pool, path))
+        await results.put(None)
+
+    producer = asyncio.create_task(produce())
+    workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+    try:
+        running = concurrency
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
+        await producer
+    finally:
+        for task in [producer, *workers]:
+            task.cancel()
+        await asyncio.gather(producer, *workers, return_exceptions=True)
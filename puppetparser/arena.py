@@ -0,0 +1,275 @@
+"""Columnar representation of parsed scripts.
+
+Nodes are numbered in preorder and stored in parallel arrays, so the
+descendants of node ``i`` are the nodes ``i + 1`` to ``end(i) - 1``. Model
+objects are only created when nodes are accessed, as views that subclass
+the model classes.
+"""
+from array import array
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Type, overload
+
+import puppetparser.model as model
+from puppetparser.model import CodeElement
+
+KINDS: List[Type[CodeElement]] = [
+    cls
+    for cls in vars(model).values()
+    if isinstance(cls, type) and issubclass(cls, CodeElement)
+]
+_KIND_CODES: Dict[type, int] = {cls: i for i, cls in enumerate(KINDS)}
+
+POSITIONS = ("line", "col", "end_line", "end_col")
+
+
+def _fields(cls: type) -> Tuple[str, ...]:
+    names: List[str] = []
+    for base in reversed(cls.__mro__):
+        for name in base.__dict__.get("__slots__", ()):
+            if name not in POSITIONS and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+FIELDS: Dict[type, Tuple[str, ...]] = {cls: _fields(cls) for cls in KINDS}
+
+# Field values are encoded as (payload << 3) | tag
+_NODE, _CONST, _LIST, _TUPLE, _DICT = range(5)
+
+_EXIT = object()
+
+
+class _View:
+    # The slots are declared by each view class, next to those of the model
+    __slots__ = ()
+    _arena: "Arena"
+    _index: int
+
+
+def _position(i: int) -> property:
+    def get(self: _View) -> int:
+        arena, index = self._arena, self._index  # pyright: ignore[reportPrivateUsage]
+        return arena.spans[4 * index + i]
+
+    return property(get)
+
+
+def _field(j: int) -> property:
+    def get(self: _View) -> Any:
+        arena, index = self._arena, self._index  # pyright: ignore[reportPrivateUsage]
+        return arena.decode(arena.fields[arena.field_start[index] + j])
+
+    return property(get)
+
+
+def _same_node(self: _View, other: object) -> bool:
+    return (
+        isinstance(other, _View)
+        and other._arena is self._arena  # pyright: ignore[reportPrivateUsage]
+        and other._index == self._index  # pyright: ignore[reportPrivateUsage]
+    )
+
+
+def _eq(cls: type) -> Any:
+    if not issubclass(cls, model.Value):
+        return _same_node
+
+    # Value compares values of the same class, views are compared to the
+    # model class they stand for
+    def eq(self: Any, other: object) -> bool:
+        return _same_node(self, other) or (
+            isinstance(other, cls) and self.value == other.value  # type: ignore
+        )
+
+    return eq
+
+
+def _index(self: _View) -> int:
+    return self._index  # pyright: ignore[reportPrivateUsage]
+
+
+def _make_view(cls: type) -> type:
+    namespace: Dict[str, Any] = {
+        "__slots__": ("_arena", "_index"),
+        "__eq__": _eq(cls),
+        "__hash__": cls.__hash__,
+        "index": property(_index),
+    }
+    for i, name in enumerate(POSITIONS):
+        namespace[name] = _position(i)
+    for j, name in enumerate(FIELDS[cls]):
+        namespace[name] = _field(j)
+    return type(cls.__name__ + "View", (_View, cls), namespace)
+
+
+VIEWS: List[type] = [_make_view(cls) for cls in KINDS]
+
+
+class Arena(Sequence[CodeElement]):
+    """Parsed script stored as parallel arrays.
+
+    The arena is a sequence of the top-level elements of the script. Any node
+    can also be reached by its index through :meth:`view`, and
+    :meth:`nodes_of_kind` iterates over all the nodes of a given class.
+    """
+
+    def __init__(self, elements: List[CodeElement]) -> None:
+        self.kinds = array("B")
+        self.parents = array("i")
+        self.ends = array("i")
+        self.spans = array("i")
+        self.field_start = array("I")
+        self.fields = array("q")
+        self.items = array("q")
+        self.seq_start = array("I")
+        self.seq_len = array("I")
+        self.constants: List[Any] = []
+        self._constant_codes: Dict[Tuple[type, Any], int] = {}
+        self._by_kind: Dict[int, List[int]] | None = None
+
+        nodes = self._number(elements)
+        self.roots = array("i", (self._ids[id(e)] for e in elements))
+        for node in nodes:
+            self.field_start.append(len(self.fields))
+            for name in FIELDS[type(node)]:
+                self.fields.append(self._encode(getattr(node, name)))
+        del self._ids, self._constant_codes
+
+    def _number(self, elements: List[CodeElement]) -> List[CodeElement]:
+        # Numbers the nodes in preorder, iteratively so that deep trees do not
+        # hit the recursion limit. Nodes reachable from several places keep
+        # the position of their first occurrence.
+        self._ids: Dict[int, int] = {}
+        nodes: List[CodeElement] = []
+        stack: List[Tuple[Any, int]] = [(e, -1) for e in reversed(elements)]
+        while stack:
+            value, parent = stack.pop()
+            if isinstance(value, CodeElement):
+                if id(value) in self._ids:
+                    continue
+                index = len(nodes)
+                self._ids[id(value)] = index
+                nodes.append(value)
+                self.kinds.append(_KIND_CODES[type(value)])
+                self.parents.append(parent)
+                self.ends.append(0)
+                self.spans.extend(
+                    (value.line, value.col, value.end_line, value.end_col)
+                )
+                stack.append((_EXIT, index))
+                for name in reversed(FIELDS[type(value)]):
+                    stack.append((getattr(value, name), index))
+            elif value is _EXIT:
+                self.ends[parent] = len(nodes)
+            elif isinstance(value, (list, tuple)):
+                stack.extend((v, parent) for v in reversed(value))  # type: ignore
+            elif isinstance(value, dict):
+                pairs: List[Tuple[Any, Any]] = list(value.items())  # type: ignore
+                for k, v in reversed(pairs):
+                    stack.append((v, parent))
+                    stack.append((k, parent))
+        return nodes
+
+    def _encode(self, value: Any) -> int:
+        if isinstance(value, CodeElement):
+            return self._ids[id(value)] << 3 | _NODE
+        if isinstance(value, (list, tuple, dict)):
+            if isinstance(value, dict):
+                tag = _DICT
+                codes = [
+                    self._encode(x) for kv in value.items() for x in kv  # type: ignore
+                ]
+            else:
+                tag = _TUPLE if isinstance(value, tuple) else _LIST
+                codes = [self._encode(x) for x in value]  # type: ignore
+            self.seq_start.append(len(self.items))
+            self.seq_len.append(len(codes))
+            self.items.extend(codes)
+            return (len(self.seq_start) - 1) << 3 | tag
+        key: Tuple[type, Any] = (value.__class__, value)
+        code = self._constant_codes.get(key)
+        if code is None:
+            code = self._constant_codes[key] = len(self.constants)
+            self.constants.append(value)
+        return code << 3 | _CONST
+
+    def decode(self, code: int) -> Any:
+        tag, payload = code & 7, code >> 3
+        if tag == _NODE:
+            return self.view(payload)
+        if tag == _CONST:
+            return self.constants[payload]
+        start = self.seq_start[payload]
+        codes = self.items[start : start + self.seq_len[payload]]
+        if tag == _DICT:
+            return {
+                self.decode(codes[k]): self.decode(codes[k + 1])
+                for k in range(0, len(codes), 2)
+            }
+        values = [self.decode(c) for c in codes]
+        return tuple(values) if tag == _TUPLE else values
+
+    @property
+    def node_count(self) -> int:
+        return len(self.kinds)
+
+    def view(self, index: int) -> Any:
+        cls: Any = VIEWS[self.kinds[index]]
+        view = cls.__new__(cls)
+        view._arena = self
+        view._index = index
+        return view
+
+    def kind(self, index: int) -> Type[CodeElement]:
+        return KINDS[self.kinds[index]]
+
+    def parent(self, index: int) -> int:
+        """Index of the parent of a node, -1 for top-level elements."""
+        return self.parents[index]
+
+    def end(self, index: int) -> int:
+        return self.ends[index]
+
+    def span(self, index: int) -> Tuple[int, int, int, int]:
+        return (
+            self.spans[4 * index],
+            self.spans[4 * index + 1],
+            self.spans[4 * index + 2],
+            self.spans[4 * index + 3],
+        )
+
+    def children(self, index: int) -> Iterator[int]:
+        child = index + 1
+        while child < self.ends[index]:
+            yield child
+            child = self.ends[child]
+
+    def indices_of_kind(self, cls: Type[CodeElement]) -> List[int]:
+        """Indices of the nodes that are instances of ``cls``, in preorder."""
+        if self._by_kind is None:
+            by_kind: Dict[int, List[int]] = {}
+            for index, kind in enumerate(self.kinds):
+                by_kind.setdefault(kind, []).append(index)
+            self._by_kind = by_kind
+        codes = [i for i, kind in enumerate(KINDS) if issubclass(kind, cls)]
+        if len(codes) == 1:
+            return self._by_kind.get(codes[0], [])
+        return sorted(i for code in codes for i in self._by_kind.get(code, []))
+
+    def nodes_of_kind(self, cls: Type[CodeElement]) -> Iterator[Any]:
+        return (self.view(i) for i in self.indices_of_kind(cls))
+
+    @overload
+    def __getitem__(self, index: int) -> CodeElement:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[CodeElement]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> CodeElement | List[CodeElement]:
+        if isinstance(index, slice):
+            return [self.view(i) for i in self.roots[index]]
+        return self.view(self.roots[index])
+
+    def __len__(self) -> int:
+        return len(self.roots)
@@ -0,0 +1,232 @@
+import gc
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from puppetparser.model import CodeElement, Comment
+from puppetparser.parser import Parser, move_positions, parse
+from puppetparser.skim import statement_starts
+
+Source = Union[str, "os.PathLike[str]", Tuple[str, str]]
+R = TypeVar("R")
+
+
+class ParseResult(NamedTuple):
+    path: str
+    elements: List[CodeElement] | None
+    comments: List[Comment] | None
+    error: Exception | None
+
+
+_worker_parser: Parser | None = None
+
+
+def init_worker() -> None:
+    """Executor initializer that builds the parser of a worker process."""
+    global _worker_parser
+    _worker_parser = Parser()
+
+
+def worker_parser() -> Parser:
+    if _worker_parser is None:
+        init_worker()
+    assert _worker_parser is not None
+    return _worker_parser
+
+
+def source_name(item: Source) -> str:
+    """The path of a path or ``(name, source)`` pair, or its name."""
+    return item[0] if isinstance(item, tuple) else os.fspath(item)
+
+
+def source_size(item: Source) -> int:
+    """Size of a source in characters, or of a file in bytes, 0 if unknown."""
+    if isinstance(item, tuple):
+        return len(item[1])
+    try:
+        return os.path.getsize(item)
+    except OSError:
+        return 0
+
+
+def parse_source(parser: Parser, item: Source) -> ParseResult:
+    """Parse a path or ``(name, source)`` pair with ``parser``, reporting
+    failures in the result."""
+    path = source_name(item)
+    try:
+        if isinstance(item, tuple):
+            script = item[1]
+        else:
+            with open(path, encoding="utf-8") as f:
+                script = f.read()
+        elements, comments = parser.parse(script)
+    except Exception as e:
+        return ParseResult(path, None, None, e)
+    return ParseResult(path, elements, comments, None)
+
+
+def parse_in_worker(item: Source) -> ParseResult:
+    """Parse a path or ``(name, source)`` pair with the worker's parser."""
+    return parse_source(worker_parser(), item)
+
+
+def run_on_pool(
+    work: Callable[[Source], R],
+    items: List[Source],
+    workers: int,
+    ordered: bool,
+    failed: Callable[[Exception, Source], R],
+    initializer: Callable[..., None] = init_worker,
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """Call ``work`` on each of ``items`` on a pool of ``workers`` processes,
+    each set up by ``initializer(*initargs)``, and yield the results in the
+    order of ``items``, or as soon as they are ready when ``ordered`` is
+    false. When a call fails, or its result cannot be sent back, the result
+    is ``failed(error, item)``."""
+    executor = ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs)
+    try:
+        # The largest files go first so that they do not end up alone at the
+        # tail of the run
+        largest = sorted(
+            range(len(items)), key=lambda i: source_size(items[i]), reverse=True
+        )
+        futures: Dict["Future[R]", int] = {
+            executor.submit(work, items[i]): i for i in largest
+        }
+
+        def result(future: "Future[R]", item: Source) -> R:
+            try:
+                return future.result()
+            except Exception as e:
+                return failed(e, item)
+
+        if ordered:
+            by_index = {i: future for future, i in futures.items()}
+            for i, item in enumerate(items):
+                yield result(by_index[i], item)
+        else:
+            for future in as_completed(futures):
+                yield result(future, items[futures[future]])
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _failed(error: Exception, item: Source) -> ParseResult:
+    if isinstance(error, BrokenProcessPool):
+        # The worker died
+        return ParseResult(source_name(item), None, None, error)
+    # The result could not be sent back: pickling recurses once per level of
+    # the tree, and deep trees exceed the recursion limit. The script is
+    # parsed here instead, as it is with a single worker
+    return parse_source(worker_parser(), item)
+
+
+def parse_many(
+    paths_or_sources: Iterable[Source],
+    workers: int | None = None,
+    ordered: bool = True,
+) -> Iterator[ParseResult]:
+    """Parse many scripts on a pool of worker processes.
+
+    Each item is either the path of a file or a ``(name, source)`` pair.
+    Results are yielded in the order of the input, or as soon as they are
+    ready when ``ordered`` is false. Failures are reported in the ``error``
+    field of the result instead of being raised.
+    """
+    items = list(paths_or_sources)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(items))
+
+    if workers <= 1:
+        parser = Parser()
+        for item in items:
+            yield parse_source(parser, item)
+        return
+
+    yield from run_on_pool(parse_in_worker, items, workers, ordered, _failed)
+
+
+def _parse_chunk(chunk: Tuple[str, int]) -> Tuple[List[CodeElement], List[Comment]]:
+    # Parses the lines of a script that start at line ``first``
+    script, first = chunk
+    elements, comments = worker_parser().parse(script)
+    if first > 1:
+        shift = first - 1
+
+        def move(line: int, col: int) -> Tuple[int, int]:
+            return (line + shift if line >= 1 else line), col
+
+        move_positions(elements + comments, move)
+    return elements, comments
+
+
+def _chunks(script: str, size: int) -> List[Tuple[str, int]]:
+    # Pieces of about ``size`` characters, cut before top-level statements
+    chunks: List[Tuple[str, int]] = []
+    start = line = 0
+    for offset in statement_starts(script):
+        if offset - start >= size:
+            chunks.append((script[start:offset], line + 1))
+            line += script.count("\n", start, offset)
+            start = offset
+    chunks.append((script[start:], line + 1))
+    return chunks
+
+
+def parse_parallel(
+    script: str, workers: int | None = None, chunk_size: int | None = None
+) -> Tuple[List[CodeElement], List[Comment]]:
+    """Parse a single large script on a pool of worker processes.
+
+    The script is cut into pieces of about ``chunk_size`` characters, four
+    per worker by default, before lines that start top-level statements.
+    These are found without parsing by
+    :func:`puppetparser.skim.statement_starts`. The pieces are parsed in
+    parallel and their elements and comments are put back in order, with
+    their positions in the whole script. The result is the same as that of
+    ``parse(script)``: if a piece fails to parse, or its result cannot be
+    sent back, the script is parsed again as a whole, so that an error is
+    raised from where it is.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(len(script) // (4 * workers), 1 << 16)
+    chunks = _chunks(script, chunk_size) if workers > 1 else []
+    if len(chunks) <= 1:
+        return parse(script)
+
+    elements: List[CodeElement] = []
+    comments: List[Comment] = []
+    executor = ProcessPoolExecutor(min(workers, len(chunks)), initializer=init_worker)
+    # The results are unpickled as they arrive, and collections would walk
+    # the elements received so far again and again
+    collect = gc.isenabled()
+    gc.disable()
+    try:
+        for chunk_elements, chunk_comments in executor.map(_parse_chunk, chunks):
+            elements += chunk_elements
+            comments += chunk_comments
+    except Exception:
+        # A piece failed to parse, or its elements were too deep to be
+        # pickled back
+        return parse(script)
+    finally:
+        if collect:
+            gc.enable()
+        executor.shutdown(cancel_futures=True)
+    return elements, comments
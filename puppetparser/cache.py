@@ -0,0 +1,171 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from importlib import metadata
+from typing import List, Tuple
+
+from puppetparser.model import PICKLE_VERSION, CodeElement, Comment
+from puppetparser.parser import Parser, tables_cache_dir
+
+
+def library_version() -> str:
+    try:
+        return metadata.version("puppetparser")
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.writes: int = 0
+        self.evictions: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"writes={self.writes}, evictions={self.evictions})"
+        )
+
+
+class ParseCache:
+    """On-disk cache of parse results keyed by the content of the script.
+
+    Keys also cover the grammar, the library version and the pickle format of
+    the model, so entries written by another version are never returned.
+    Entries are written atomically and the least recently used ones are
+    evicted once the directory grows past ``max_size`` bytes. Several
+    processes may share a directory.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_size: int = 256 * 1024 * 1024,
+        parser: Parser | None = None,
+    ) -> None:
+        self.directory = directory or os.path.join(tables_cache_dir(), "parses")
+        self.max_size = max_size
+        self.parser = parser or Parser()
+        self.stats = CacheStats()
+        self._salt = (
+            f"{library_version()}\0{self.parser.grammar_hash}\0{PICKLE_VERSION}\0"
+        ).encode()
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    def key(self, script: str) -> str:
+        return hashlib.sha256(self._salt + script.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key[2:] + ".pkl")
+
+    def parse(self, script: str) -> Tuple[List[CodeElement], List[Comment]]:
+        path = self._path(self.key(script))
+        result = self._load(path)
+        if result is not None:
+            self.stats.hits += 1
+            return result
+
+        self.stats.misses += 1
+        result = self.parser.parse(script)
+        self._store(path, result)
+        return result
+
+    def _load(self, path: str) -> Tuple[List[CodeElement], List[Comment]] | None:
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated by a full disk or written by an incompatible model
+            return None
+        try:
+            # The modification time records the last use for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def _store(
+        self, path: str, result: Tuple[List[CodeElement], List[Comment]]
+    ) -> None:
+        try:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            return
+
+        self.stats.writes += 1
+        with self._lock:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries: List[Tuple[float, int, str]] = []
+        try:
+            buckets = list(os.scandir(self.directory))
+        except OSError:
+            return entries
+        for bucket in buckets:
+            if not bucket.is_dir():
+                continue
+            try:
+                for entry in os.scandir(bucket.path):
+                    if entry.name.endswith(".pkl"):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+            except OSError:
+                continue
+        return entries
+
+    def size(self) -> int:
+        """Total size in bytes of the entries in the cache directory."""
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        # Other processes write to the same directory, so the real size is
+        # only known after a scan. Evicting down to 90% of the limit avoids
+        # scanning again on the next few writes.
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        target = self.max_size * 9 // 10
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size -= entry_size
+            self.stats.evictions += 1
+        self._size = size
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._size = 0
@@ -0,0 +1,111 @@
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import List, Tuple
+
+from puppetparser.cache import CacheStats
+from puppetparser.model import CodeElement, Comment
+from puppetparser.parser import Parser
+
+# Measured size of the model per character of source, used to approximate
+# the memory held by an entry without walking it
+BYTES_PER_CHAR = 24
+
+
+class _Entry:
+    __slots__ = ("result", "size", "snapshot")
+
+    def __init__(
+        self, result: Tuple[List[CodeElement], List[Comment]], size: int
+    ) -> None:
+        self.result = result
+        self.size = size
+        self.snapshot: bytes | None = None
+
+
+class ParseMemo:
+    """Thread-safe in-memory LRU of parse results keyed by a hash of the script.
+
+    Results are shared between callers and must not be modified, unless
+    :meth:`parse` is asked for a copy. Entries are evicted once there are more
+    than ``max_entries`` of them or their approximate size goes past
+    ``max_memory`` bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_memory: int = 256 * 1024 * 1024,
+        parser: Parser | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.parser = parser or Parser()
+        self.stats = CacheStats()
+        self.memory = 0
+        self._entries: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(
+        self, script: str, copy: bool = False
+    ) -> Tuple[List[CodeElement], List[Comment]]:
+        key = hashlib.blake2b(script.encode(), digest_size=16).digest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+        if entry is None:
+            # Parsed outside of the lock, concurrent misses on the same
+            # script both parse it and the last one is kept
+            entry = _Entry(self.parser.parse(script), len(script) * BYTES_PER_CHAR)
+            self._insert(key, entry)
+        if not copy:
+            return entry.result
+
+        # Unpickling a snapshot is several times cheaper than parsing again
+        # or deep copying the model
+        if entry.snapshot is None:
+            try:
+                snapshot = pickle.dumps(entry.result, pickle.HIGHEST_PROTOCOL)
+            except RecursionError:
+                return self.parser.parse(script)
+            with self._lock:
+                if entry.snapshot is None:
+                    entry.snapshot = snapshot
+                    entry.size += len(snapshot)
+                    if self._entries.get(key) is entry:
+                        self.memory += len(snapshot)
+                        self._evict()
+        return pickle.loads(entry.snapshot)
+
+    def _insert(self, key: bytes, entry: _Entry) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.memory -= old.size
+            self._entries[key] = entry
+            self.memory += entry.size
+            self.stats.writes += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        # The most recent entry is kept even when it is larger than the limit
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self.memory > self.max_memory
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self.memory -= entry.size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.memory = 0
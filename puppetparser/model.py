@@ -1,5 +1,14 @@
 from types import NoneType
-from typing import Dict, Sequence, List, Tuple, Optional, Generic, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Sequence,
+    List,
+    Tuple,
+    Optional,
+    Generic,
+    TypeVar,
+)
 
 T = TypeVar(
     "T",
@@ -13,7 +22,28 @@ T = TypeVar(
 )
 
 
+# Version of the pickled form of elements, to bump whenever __getstate__
+# changes, as caches of pickled results are keyed by it
+PICKLE_VERSION = 3
+
+# Slots of each class, those of its bases first
+_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _slots(cls: type) -> Tuple[str, ...]:
+    names = _SLOTS.get(cls)
+    if names is None:
+        names = _SLOTS[cls] = tuple(
+            name
+            for base in reversed(cls.__mro__)
+            for name in base.__dict__.get("__slots__", ())
+        )
+    return names
+
+
 class CodeElement:
+    __slots__ = ("line", "col", "end_line", "end_col")
+
     def __init__(self, line: int, col: int, end_line: int, end_col: int) -> None:
         self.line: int = line
         self.col: int = col
@@ -23,8 +53,25 @@ class CodeElement:
     def __hash__(self) -> int:
         return hash((self.line, self.col, self.end_line, self.end_col))
 
+    # Pickled as a tuple of the slots rather than the default dictionary of
+    # them, which is smaller and faster to load
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple([getattr(self, name) for name in _slots(self.__class__)])
+
+    def __setstate__(self, state: Any) -> None:
+        slots = _slots(self.__class__)
+        if state.__class__ is not tuple or len(state) != len(slots):
+            raise TypeError(
+                f"Invalid pickled state for {self.__class__.__name__}, "
+                f"expected a tuple of {len(slots)} slots"
+            )
+        for name, value in zip(slots, state):
+            setattr(self, name, value)
+
 
 class Value(CodeElement, Generic[T]):
+    __slots__ = ("value",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, value: T
     ) -> None:
@@ -44,6 +91,8 @@ class Value(CodeElement, Generic[T]):
 
 
 class Id(Value[str]):
+    __slots__ = ()
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, value: str
     ) -> None:
@@ -51,6 +100,8 @@ class Id(Value[str]):
 
 
 class Hash(Value[Dict[CodeElement, CodeElement]]):
+    __slots__ = ()
+
     def __init__(
         self,
         line: int,
@@ -63,6 +114,8 @@ class Hash(Value[Dict[CodeElement, CodeElement]]):
 
 
 class Array(Value[List[CodeElement]]):
+    __slots__ = ()
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, value: List[CodeElement]
     ) -> None:
@@ -70,11 +123,15 @@ class Array(Value[List[CodeElement]]):
 
 
 class Regex(Value[str]):
+    __slots__ = ()
+
     def __init__(self, line: int, col: int, end_line: int, end_col: int, value: str):
         super().__init__(line, col, end_line, end_col, value)
 
 
 class Attribute(CodeElement):
+    __slots__ = ("key", "value")
+
     def __init__(self, key: CodeElement, value: CodeElement) -> None:
         super().__init__(key.line, key.col, value.end_line, value.end_col)
         self.key: CodeElement = key
@@ -82,6 +139,8 @@ class Attribute(CodeElement):
 
 
 class Resource(CodeElement):
+    __slots__ = ("type", "title", "attributes")
+
     def __init__(
         self,
         line: int,
@@ -99,6 +158,8 @@ class Resource(CodeElement):
 
 
 class ResourceDeclaration(CodeElement):
+    __slots__ = ("name", "parameters", "block")
+
     def __init__(
         self,
         line: int,
@@ -116,6 +177,8 @@ class ResourceDeclaration(CodeElement):
 
 
 class Parameter(CodeElement):
+    __slots__ = ("type", "name", "default")
+
     def __init__(
         self,
         line: int,
@@ -133,6 +196,8 @@ class Parameter(CodeElement):
 
 
 class Assignment(CodeElement):
+    __slots__ = ("name", "value")
+
     def __init__(
         self,
         line: int,
@@ -148,6 +213,8 @@ class Assignment(CodeElement):
 
 
 class PuppetClass(CodeElement):
+    __slots__ = ("name", "block", "inherits", "parameters")
+
     def __init__(
         self,
         line: int,
@@ -167,6 +234,8 @@ class PuppetClass(CodeElement):
 
 
 class ClassAsResource(CodeElement):
+    __slots__ = ("title", "attributes")
+
     def __init__(
         self,
         line: int,
@@ -182,6 +251,8 @@ class ClassAsResource(CodeElement):
 
 
 class Node(CodeElement):
+    __slots__ = ("name", "block")
+
     def __init__(
         self,
         line: int,
@@ -197,12 +268,16 @@ class Node(CodeElement):
 
 
 class Comment(CodeElement):
+    __slots__ = ("content",)
+
     def __init__(self, line: int, col: int, end_line: int, end_col: int, content: str):
         super().__init__(line, col, end_line, end_col)
         self.content = content
 
 
 class Operation(CodeElement):
+    __slots__ = ("arguments", "operator")
+
     def __init__(
         self,
         line: int,
@@ -218,6 +293,8 @@ class Operation(CodeElement):
 
 
 class Lambda(CodeElement):
+    __slots__ = ("parameters", "block")
+
     def __init__(
         self,
         line: int,
@@ -233,6 +310,8 @@ class Lambda(CodeElement):
 
 
 class FunctionCall(CodeElement):
+    __slots__ = ("name", "arguments", "lamb")
+
     def __init__(
         self,
         line: int,
@@ -250,6 +329,8 @@ class FunctionCall(CodeElement):
 
 
 class If(CodeElement):
+    __slots__ = ("condition", "block", "elseblock")
+
     def __init__(
         self,
         line: int,
@@ -267,6 +348,8 @@ class If(CodeElement):
 
 
 class Unless(CodeElement):
+    __slots__ = ("condition", "block", "elseblock")
+
     def __init__(
         self,
         line: int,
@@ -284,6 +367,8 @@ class Unless(CodeElement):
 
 
 class Include(CodeElement):
+    __slots__ = ("inc",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, inc: List[CodeElement]
     ) -> None:
@@ -292,6 +377,8 @@ class Include(CodeElement):
 
 
 class Import(CodeElement):
+    __slots__ = ("imp",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, imp: List[CodeElement]
     ) -> None:
@@ -300,6 +387,8 @@ class Import(CodeElement):
 
 
 class Require(CodeElement):
+    __slots__ = ("req",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, req: List[CodeElement]
     ) -> None:
@@ -308,6 +397,8 @@ class Require(CodeElement):
 
 
 class Contain(CodeElement):
+    __slots__ = ("cont",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, cont: List[CodeElement]
     ) -> None:
@@ -316,6 +407,8 @@ class Contain(CodeElement):
 
 
 class Debug(CodeElement):
+    __slots__ = ("args",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, args: List[CodeElement]
     ) -> None:
@@ -324,6 +417,8 @@ class Debug(CodeElement):
 
 
 class Fail(CodeElement):
+    __slots__ = ("args",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, args: List[CodeElement]
     ) -> None:
@@ -332,6 +427,8 @@ class Fail(CodeElement):
 
 
 class Realize(CodeElement):
+    __slots__ = ("classes",)
+
     def __init__(
         self,
         line: int,
@@ -345,6 +442,8 @@ class Realize(CodeElement):
 
 
 class Tag(CodeElement):
+    __slots__ = ("tags",)
+
     def __init__(
         self, line: int, col: int, end_line: int, end_col: int, tags: List[CodeElement]
     ) -> None:
@@ -353,6 +452,8 @@ class Tag(CodeElement):
 
 
 class Match(CodeElement):
+    __slots__ = ("expressions", "block")
+
     def __init__(
         self,
         line: int,
@@ -368,6 +469,8 @@ class Match(CodeElement):
 
 
 class Case(CodeElement):
+    __slots__ = ("control", "matches")
+
     def __init__(
         self,
         line: int,
@@ -383,6 +486,8 @@ class Case(CodeElement):
 
 
 class Selector(CodeElement):
+    __slots__ = ("control", "hash")
+
     def __init__(
         self,
         line: int,
@@ -398,6 +503,8 @@ class Selector(CodeElement):
 
 
 class Reference(CodeElement):
+    __slots__ = ("type", "references")
+
     def __init__(
         self,
         line: int,
@@ -413,6 +520,8 @@ class Reference(CodeElement):
 
 
 class Function(CodeElement):
+    __slots__ = ("name", "parameters", "return_type", "body")
+
     def __init__(
         self,
         line: int,
@@ -432,6 +541,8 @@ class Function(CodeElement):
 
 
 class ResourceCollector(CodeElement):
+    __slots__ = ("resource_type", "search")
+
     def __init__(
         self,
         line: int,
@@ -447,6 +558,8 @@ class ResourceCollector(CodeElement):
 
 
 class ResourceExpression(CodeElement):
+    __slots__ = ("default", "resources")
+
     def __init__(
         self,
         line: int,
@@ -462,6 +575,8 @@ class ResourceExpression(CodeElement):
 
 
 class Chaining(CodeElement):
+    __slots__ = ("op1", "op2", "direction")
+
     def __init__(self, op1: CodeElement, op2: CodeElement, direction: str) -> None:
         super().__init__(op1.line, op1.col, op2.end_line, op2.end_col)
         self.op1 = op1
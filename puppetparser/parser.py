@@ -1,17 +1,112 @@
 # pyright: reportUnusedFunction=false, reportUnusedVariable=false
 from ply.lex import lex, LexToken
-from ply.yacc import yacc, YaccProduction
+from ply.yacc import yacc, NullLogger, ParserReflect, YaccProduction, YaccSymbol
+from bisect import bisect_right
+from itertools import accumulate
+from types import ModuleType
+import copy
+import hashlib
+import math
+import importlib
+import importlib.util
+import shutil
 import tempfile
-import re, os
-from typing import Tuple, List
+import threading
+import time
+import re, os, sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+    List,
+    cast,
+    overload,
+)
+from puppetparser.arena import FIELDS, Arena
 from puppetparser.model import *
-from puppetparser import parser as pf
+
+
+TABLES_MODULE = "puppetparser.parsetab"
+
+# Longer strings are rarely repeated, and are not worth interning
+INTERNED_STRING_LENGTH = 32
 
 
 class InvalidPuppetScript(Exception):
     pass
 
 
+class LimitExceeded(InvalidPuppetScript):
+    """Raised when a script goes over one of the :class:`ParseLimits`."""
+
+    def __init__(self, limit: str, value: float) -> None:
+        super().__init__(f"Parse limit {limit}={value} exceeded")
+        self.limit = limit
+        self.value = value
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, float]]:
+        return (LimitExceeded, (self.limit, self.value))
+
+
+class ParseLimits:
+    """Limits on the cost of one call to :meth:`Parser.parse`.
+
+    Limits left to ``None`` are not checked. ``max_depth`` bounds the nesting
+    of braces, brackets and parentheses, through which blocks and most
+    expressions nest; chains of operators are bounded by ``max_tokens``.
+    ``timeout`` is in seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        max_tokens: int | None = None,
+        max_depth: int | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.max_tokens = max_tokens
+        self.max_depth = max_depth
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return (
+            f"ParseLimits(max_size={self.max_size}, max_tokens={self.max_tokens}, "
+            f"max_depth={self.max_depth}, timeout={self.timeout})"
+        )
+
+
+class Token(NamedTuple):
+    type: str
+    value: str
+    start: int
+    end: int
+    line: int
+
+
+class ParseError(NamedTuple):
+    """Error found by a parse that recovers from them."""
+
+    line: int
+    col: int
+    message: str
+
+
+class ParsedScript(NamedTuple):
+    """A script with its elements and comments, which can be reparsed."""
+
+    script: str
+    elements: List[CodeElement]
+    comments: List[Comment]
+
+
 def find_column(input: str, pos: int) -> int:
     rfind = input.rfind("\n", 0, pos)
     if rfind == -1:
@@ -20,8 +115,572 @@ def find_column(input: str, pos: int) -> int:
     return (pos - line_start) + 1
 
 
-def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
-    comments: List[Comment] = []
+class LineIndex:
+    """Offsets at which the lines of a script start.
+
+    Built once per script so that positions can be resolved with a binary
+    search instead of scanning back to the previous newline. Resolved columns
+    are cached, since the same positions are often asked for more than once.
+    """
+
+    def __init__(self, script: str) -> None:
+        self.starts: List[int] = list(
+            accumulate((len(line) + 1 for line in script.split("\n")), initial=0)
+        )[:-1]
+        self.columns: Dict[int, int] = {}
+
+    def line(self, pos: int) -> int:
+        return bisect_right(self.starts, pos)
+
+    def column(self, pos: int) -> int:
+        column = self.columns.get(pos)
+        if column is None:
+            starts = self.starts
+            column = pos - starts[bisect_right(starts, pos) - 1] + 1
+            self.columns[pos] = column
+        return column
+
+
+statement_functions = {
+    "include": "INCLUDE",
+    "require": "REQUIRE",
+    "contain": "CONTAIN",
+    "tag": "TAG",
+    "debug": "DEBUG",
+    "info": "INFO",
+    "notice": "NOTICE",
+    "warning": "WARNING",
+    "err": "ERR",
+    "fail": "FAIL",
+    "realize": "REALIZE",
+    "import": "IMPORT",
+}
+
+statement_functions_class = {
+    "include": "Include",
+    "require": "Require",
+    "contain": "Contain",
+    "tag": "Tag",
+    "debug": "Debug",
+    "info": "Debug",
+    "notice": "Debug",
+    "warning": "Debug",
+    "err": "Debug",
+    "fail": "Fail",
+    "realize": "Realize",
+    "import": "Import",
+}
+
+keywords = {
+    "and": "BOOL_AND",
+    "application": "APPLICATION",
+    "attr": "ATTR",
+    "case": "CASE",
+    "component": "COMPONENT",
+    "consumes": "CONSUMES",
+    "default": "DEFAULT",
+    "define": "DEFINE",
+    "elsif": "ELSIF",
+    "else": "ELSE",
+    "false": "FALSE",
+    "function": "FUNCTION",
+    "if": "IF",
+    "import": "IMPORT",
+    "in": "CMP_IN",
+    "inherits": "INHERITS",
+    "node": "NODE",
+    "or": "BOOL_OR",
+    "produces": "PRODUCES",
+    "regexp": "REGEXP",
+    "site": "SITE",
+    "true": "TRUE",
+    "type": "TYPE",
+    "undef": "UNDEF",
+    "unless": "UNLESS",
+    "class": "CLASS",
+}
+
+
+_LEAVES = (Value, Id, Regex)
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _share_leaves(elements: List[CodeElement]) -> None:
+    # Replaces the leaves of the tree by the first leaf of the same class and
+    # value in preorder, iteratively so that deep trees do not hit the
+    # recursion limit
+    leaves: Dict[Tuple[type, type, Any], Any] = {}
+    seen: Set[int] = set()
+    stack: List[Any] = [elements]
+
+    def share(value: Any) -> Any:
+        if value.__class__ in _LEAVES:
+            payload = value.value
+            if payload.__class__ in _SCALARS:
+                key = (value.__class__, payload.__class__, payload)
+                return leaves.setdefault(key, value)
+        if isinstance(value, tuple):
+            return tuple(share(v) for v in value)  # type: ignore
+        walk = isinstance(value, CodeElement) or value.__class__ in (list, dict)
+        if walk and id(value) not in seen:
+            seen.add(id(value))
+            stack.append(value)
+        return value
+
+    while stack:
+        value = stack.pop()
+        # Children are pushed in order, and reversed below so that leaves are
+        # first reached in preorder
+        mark = len(stack)
+        if isinstance(value, CodeElement):
+            for name in FIELDS[value.__class__]:
+                setattr(value, name, share(getattr(value, name)))
+        elif isinstance(value, list):
+            for i, v in enumerate(value):  # type: ignore
+                value[i] = share(v)
+        else:
+            pairs = [(share(k), share(v)) for k, v in value.items()]
+            value.clear()
+            value.update(pairs)
+        stack[mark:] = reversed(stack[mark:])
+
+
+_GAP = re.compile(r"(?:\s+|#[^\n]*|/\*.*?\*/)*", re.S)
+
+
+def _offset(lines: LineIndex, line: int, col: int) -> int:
+    return lines.starts[line - 1] + col - 1
+
+
+def _span(element: CodeElement) -> Tuple[int, int, int, int]:
+    return element.line, element.col, element.end_line, element.end_col
+
+
+def _statement_bounds(
+    elements: List[CodeElement], lines: LineIndex, script: str
+) -> List[Tuple[int, int]]:
+    # Indices of the top-level elements that a parse can start at, with their
+    # offsets: those with only spaces and comments since the previous one.
+    # Elements of a statement with several elements, or whose position does
+    # not include its first token, are skipped
+    bounds = [(0, 0)]
+    end: int | None = 0
+    for i, e in enumerate(elements):
+        if e.line < 1 or e.end_line < 1:
+            end = None
+            continue
+        start = _offset(lines, e.line, e.col)
+        if end is not None and end <= start and _GAP.fullmatch(script, end, start):
+            if i:
+                bounds.append((i, start))
+        stop = _offset(lines, e.end_line, e.end_col)
+        end = stop if end is None else max(end, stop)
+    bounds.append((len(elements), len(script)))
+    return bounds
+
+
+def move_positions(
+    values: Iterable[CodeElement], move: Callable[[int, int], Tuple[int, int]]
+) -> None:
+    """Replace, in place, each ``(line, col)`` position of ``values`` and of
+    the elements under them, start and end, with ``move(line, col)``.
+
+    Elements reachable from several places are moved once, and dictionaries
+    are rebuilt, as their keys are hashed by position.
+    """
+    seen: Set[int] = set()
+    stack: List[Any] = list(values)
+    tables: List[Dict[Any, Any]] = []
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, CodeElement):
+            value.line, value.col = move(value.line, value.col)
+            value.end_line, value.end_col = move(value.end_line, value.end_col)
+            stack.extend(getattr(value, name) for name in FIELDS[value.__class__])
+        elif isinstance(value, (list, tuple)):
+            stack.extend(cast(Sequence[Any], value))
+        elif isinstance(value, dict):
+            table = cast(Dict[Any, Any], value)
+            tables.append(table)
+            stack.extend(table.keys())
+            stack.extend(table.values())
+    # Keys are hashed by their positions
+    for table in tables:
+        items = list(table.items())
+        table.clear()
+        table.update(items)
+
+
+class _ParseContext:
+    """Per-call state of a :class:`Parser`."""
+
+    def __init__(self, script: str) -> None:
+        self.script = script
+        self.lines = LineIndex(script)
+        self.comments: List[Tuple[int, int, int, int, str]] = []
+        # Comment tokens are only kept by Parser.tokenize
+        self.comment_tokens: List[Token] | None = None
+        # Errors are only collected, rather than raised, when this is a list
+        self.errors: List[ParseError] | None = None
+        # Token the parser was last resynchronized at
+        self.resync: Any = None
+        # Top-level statements parsed before an error at the end of the script
+        self.partial: List[CodeElement] = []
+
+    def error(self, message: str, lexpos: int, lineno: int) -> None:
+        assert self.errors is not None
+        self.errors.append(ParseError(lineno, self.lines.column(lexpos), message))
+
+    def line_comment(self, text: str, lexpos: int, lineno: int) -> None:
+        column = self.lines.column(lexpos)
+        value = text[1:-1]
+        self.comments.append((lineno, column, lineno, column + len(value), value))
+        self.comment_token(text, lexpos, lineno)
+
+    def block_comment(self, text: str, lexpos: int, lineno: int) -> int:
+        """Record a ``/* */`` comment, and return the number of lines it spans."""
+        start, end = lexpos + 2, lexpos + len(text) - 2
+        lines = self.lines
+        new_lines = lines.line(end) - lines.line(start)
+        self.comments.append(
+            (
+                lineno,
+                lines.column(lexpos),
+                lineno + new_lines,
+                # Length of the last line of the content
+                lines.column(end) - 1 if new_lines else end - start,
+                text[2:-2],
+            )
+        )
+        self.comment_token(text, lexpos, lineno)
+        return new_lines
+
+    def comment_token(self, text: str, lexpos: int, lineno: int) -> None:
+        if self.comment_tokens is not None:
+            value = text.rstrip("\n")
+            self.comment_tokens.append(
+                Token("COMMENT", value, lexpos, lexpos + len(value), lineno)
+            )
+
+
+# Tokens after which a slash is a division rather than the start of a regex
+OPERAND_END = {
+    "ID",
+    "ID_TYPE",
+    "SENSITIVE",
+    "STRING",
+    "INTEGER",
+    "HEXA_INTEGER",
+    "OCT_INTEGER",
+    "FLOAT",
+    "TRUE",
+    "FALSE",
+    "UNDEF",
+    "DEFAULT",
+    "RPAREN",
+    "RPARENR",
+}
+
+
+class _ScannedToken:
+    # Same attributes and text as PLY's LexToken, which errors are formatted with
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type: str, value: str, lineno: int, lexpos: int) -> None:
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __str__(self) -> str:
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+    __repr__ = __str__
+
+
+def _switch_state(lexer: Any, type: str, previous: str, heredoc: bool) -> bool:
+    """Switch ``lexer`` to the state the parser would give it after ``type``.
+
+    ``heredoc`` tells whether the header of a heredoc is open, and the new
+    value is returned.
+    """
+    if type == "ARITH_DIV" and previous not in OPERAND_END:
+        lexer.begin("regex")
+    elif type == "LPAREN" and previous == "AT":
+        return True
+    elif type == "RPAREN" and heredoc:
+        lexer.begin("docs")
+        return False
+    return heredoc
+
+
+# Actions of the rules that are functions, the others only give the token type
+_NEWLINE, _SKIP, _COMMENT, _BLOCK_COMMENT, _UNTERMINATED_COMMENT = range(5)
+_ID, _ID_TYPE, _STRING, _NUMBER, _DOCS_STRING, _END = range(5, 11)
+_RULE_ACTIONS = {
+    "t_newline": (_NEWLINE, ""),
+    "t_ignore_ANY": (_SKIP, ""),
+    "t_COMMENT": (_COMMENT, ""),
+    "t_comment": (_BLOCK_COMMENT, ""),
+    "t_unterminated_comment": (_UNTERMINATED_COMMENT, ""),
+    "t_octal_INTEGER": (-1, "OCT_INTEGER"),
+    "t_hexa_INTEGER": (-1, "HEXA_INTEGER"),
+    "t_NUMBER": (_NUMBER, ""),
+    "t_ID_TYPE": (_ID_TYPE, "ID_TYPE"),
+    "t_ID": (_ID, "ID"),
+    "t_STRING": (_STRING, "STRING"),
+    "t_regex_END": (_END, "ARITH_DIV"),
+    "t_regex_expression": (-1, "REGEXPRESSION"),
+    "t_docs_END": (_END, "BAR"),
+    "t_docs_string": (_DOCS_STRING, "STRING"),
+}
+
+_ID_TYPES = {**statement_functions, **keywords}
+_BLANKS = re.compile(r"[ \t\n]*")
+
+
+class Scanner:
+    """Single-pass replacement for the PLY lexer of a :class:`Parser`.
+
+    The rules of each state are the ones PLY combines into its master regex,
+    in the same order, so that tokens are the same. Rules are dispatched on
+    the name of the group that matched, runs of blanks and newlines are
+    skipped in the same match as the token that follows them, and tokens are
+    created without going through the rule functions.
+    """
+
+    def __init__(self, lexer: Any) -> None:
+        self._rules: Dict[str, Tuple[Any, List[Tuple[int, str]]]] = {}
+        for state, texts in lexer.lexstateretext.items():
+            master = "|".join(texts)
+            if state == "INITIAL":
+                # Blanks are matched like an atomic group, so that they are
+                # not given back one at a time when no rule matches after them
+                master = rf"(?=(?P<blanks>[\ \t\n]*))(?P=blanks)(?:{master})"
+            regex = re.compile(master, lexer.lexreflags)
+            actions = [(-2, "")] * (regex.groups + 1)
+            for name, index in regex.groupindex.items():
+                if name in _RULE_ACTIONS:
+                    actions[index] = _RULE_ACTIONS[name]
+                elif callable(getattr(lexer.lexmodule, name, None)):
+                    raise ValueError(f"No action for lexer rule {name}")
+                elif name.startswith("t_"):
+                    actions[index] = (-1, name[2:])
+            self._rules[state] = (regex.match, actions)
+        self.ctx = _ParseContext("")
+        self.input("")
+
+    def clone(self) -> "Scanner":
+        return copy.copy(self)
+
+    def input(self, data: str) -> None:
+        self.lexdata = data
+        self.lexpos = 0
+        self.lineno = 1
+        self.begin("INITIAL")
+
+    def begin(self, state: str) -> None:
+        self._state = state
+        self._match, self._actions = self._rules[state]
+
+    def current_state(self) -> str:
+        return self._state
+
+    def token(self) -> _ScannedToken | None:
+        data = self.lexdata
+        pos = self.lexpos
+        while True:
+            m = self._match(data, pos)
+            if m is None:
+                # Trailing blanks, or blanks before a character no rule matches
+                if self._state == "INITIAL":
+                    blanks = _BLANKS.match(data, pos)
+                    if blanks is not None:
+                        self.lineno += data.count("\n", pos, blanks.end())
+                        pos = blanks.end()
+                self.lexpos = pos
+                if pos >= len(data):
+                    return None
+                token = _ScannedToken("error", data[pos:], self.lineno, pos)
+                raise InvalidPuppetScript(f"Lexer error {token}")
+
+            index = m.lastindex or 0
+            action, type = self._actions[index]
+            start = m.start(index)
+            if start != pos:
+                self.lineno += data.count("\n", pos, start)
+            pos = m.end()
+            if action == -1:
+                self.lexpos = pos
+                return _ScannedToken(type, m.group(index), self.lineno, start)
+            value: str = m.group(index)
+            if action == _ID:
+                value = sys.intern(value)
+                type = _ID_TYPES.get(value, "ID")
+            elif action == _ID_TYPE:
+                value = sys.intern(value)
+                if value == "Sensitive":
+                    type = "SENSITIVE"
+            elif action == _STRING:
+                value = value[1:-1]
+                if len(value) <= INTERNED_STRING_LENGTH:
+                    value = sys.intern(value)
+                token = _ScannedToken(type, value, self.lineno, start)
+                self.lineno += value.count("\n")
+                self.lexpos = pos
+                return token
+            elif action == _NUMBER:
+                type = "FLOAT" if "." in value else "INTEGER"
+            elif action == _END:
+                self.begin("INITIAL")
+            elif action == _DOCS_STRING:
+                token = _ScannedToken(type, value, self.lineno, start)
+                self.lineno += value.count("\n")
+                self.lexpos = pos
+                return token
+            elif action == _NEWLINE:
+                self.lineno += len(value)
+                continue
+            elif action == _SKIP:
+                continue
+            elif action == _COMMENT:
+                self.ctx.line_comment(value, start, self.lineno)
+                self.lineno += 1
+                continue
+            elif action == _BLOCK_COMMENT:
+                self.lineno += self.ctx.block_comment(value, start, self.lineno)
+                continue
+            elif action == _UNTERMINATED_COMMENT:
+                self.ctx.comment_token(value, start, self.lineno)
+                continue
+            self.lexpos = pos
+            return _ScannedToken(type, value, self.lineno, start)
+
+
+_OPENING = {"LBRACKET", "LPAREN", "LPARENR", "LANGLEBRACKET"}
+_CLOSING = {"RBRACKET", "RPAREN", "RPARENR", "RANGLEBRACKET"}
+
+# Keywords at which a parse that recovers from errors resumes
+_STATEMENT_KEYWORDS = {"CLASS", "DEFINE", "NODE", "FUNCTION"}
+
+# Number of tokens between two reads of the clock
+_TIMEOUT_INTERVAL = 256
+
+
+class _LimitedLexer:
+    """Lexer that checks :class:`ParseLimits` on the tokens it passes on."""
+
+    def __init__(self, lexer: Any, limits: ParseLimits) -> None:
+        self.lexer = lexer
+        self.limits = limits
+        self.tokens = 0
+        self.depth = 0
+        self.deadline = math.inf
+        if limits.timeout is not None:
+            self.deadline = time.monotonic() + limits.timeout
+        self.max_tokens = math.inf
+        if limits.max_tokens is not None:
+            self.max_tokens = limits.max_tokens
+        # Token count and time are only checked every so many tokens
+        self.next_check = 0.0
+        self._check()
+
+    def _check(self) -> None:
+        if self.tokens > self.max_tokens:
+            raise LimitExceeded("max_tokens", self.max_tokens)
+        if time.monotonic() > self.deadline:
+            raise LimitExceeded("timeout", self.limits.timeout or 0)
+        self.next_check = min(
+            self.max_tokens + 1,
+            self.tokens + _TIMEOUT_INTERVAL if self.deadline < math.inf else math.inf,
+        )
+
+    def token(self) -> Any:
+        token = self.lexer.token()
+        if token is None:
+            return None
+        self.tokens += 1
+        if self.tokens >= self.next_check:
+            self._check()
+        if self.limits.max_depth is not None:
+            if token.type in _OPENING:
+                self.depth += 1
+                if self.depth > self.limits.max_depth:
+                    raise LimitExceeded("max_depth", self.limits.max_depth)
+            elif token.type in _CLOSING:
+                self.depth -= 1
+        return token
+
+    def __getattr__(self, name: str) -> Any:
+        # begin(), input() and the rest are the wrapped lexer's
+        return getattr(self.lexer, name)
+
+
+class _RecoveringLexer:
+    """Lexer that records lexer errors and skips the character they are at."""
+
+    def __init__(self, lexer: Any, ctx: _ParseContext) -> None:
+        self.lexer = lexer
+        self.ctx = ctx
+        # Position after the last skipped character
+        self.skipped = -1
+
+    def token(self) -> Any:
+        lexer = self.lexer
+        while True:
+            try:
+                return lexer.token()
+            except InvalidPuppetScript:
+                pos = lexer.lexpos
+                # A run of characters that no rule matches is a single error
+                if pos != self.skipped:
+                    char = lexer.lexdata[pos]
+                    self.ctx.error(f"Lexer error at {char!r}", pos, lexer.lineno)
+                lexer.lexpos = self.skipped = pos + 1
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.lexer, name)
+
+
+class _RegionLexer:
+    """Lexer that only gives the tokens of ``script[start:end]``.
+
+    ``next`` is the first token at or after ``end``.
+    """
+
+    def __init__(self, lexer: Any, start: int, end: int, lineno: int) -> None:
+        self.lexer = lexer
+        self.start = start
+        self.end = end
+        self.first_line = lineno
+        self.next: Any = None
+
+    def input(self, script: str) -> None:
+        self.lexer.input(script)
+        self.lexer.lexpos = self.start
+        self.lexer.lineno = self.first_line
+
+    def token(self) -> Any:
+        t = self.lexer.token()
+        if t is not None and t.lexpos >= self.end:
+            self.next = t
+            return None
+        return t
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.lexer, name)
+
+
+class Parser:
+    """Puppet parser whose lexer and LALR tables are built once.
+
+    The same instance can be used to parse any number of scripts. Calls to
+    :meth:`parse` on one instance are serialized, so a parser may be shared
+    between threads but does not parse concurrently.
+    """
 
     tokens = (
         # Keywords
@@ -119,66 +778,357 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         "CHAINING_RIGHT",
     )
 
-    statement_functions = {
-        "include": "INCLUDE",
-        "require": "REQUIRE",
-        "contain": "CONTAIN",
-        "tag": "TAG",
-        "debug": "DEBUG",
-        "info": "INFO",
-        "notice": "NOTICE",
-        "warning": "WARNING",
-        "err": "ERR",
-        "fail": "FAIL",
-        "realize": "REALIZE",
-        "import": "IMPORT",
-    }
-
-    statement_functions_class = {
-        "include": "Include",
-        "require": "Require",
-        "contain": "Contain",
-        "tag": "Tag",
-        "debug": "Debug",
-        "info": "Debug",
-        "notice": "Debug",
-        "warning": "Debug",
-        "err": "Debug",
-        "fail": "Fail",
-        "realize": "Realize",
-        "import": "Import",
-    }
-
-    keywords = {
-        "and": "BOOL_AND",
-        "application": "APPLICATION",
-        "attr": "ATTR",
-        "case": "CASE",
-        "component": "COMPONENT",
-        "consumes": "CONSUMES",
-        "default": "DEFAULT",
-        "define": "DEFINE",
-        "elsif": "ELSIF",
-        "else": "ELSE",
-        "false": "FALSE",
-        "function": "FUNCTION",
-        "if": "IF",
-        "import": "IMPORT",
-        "in": "CMP_IN",
-        "inherits": "INHERITS",
-        "node": "NODE",
-        "or": "BOOL_OR",
-        "produces": "PRODUCES",
-        "regexp": "REGEXP",
-        "site": "SITE",
-        "true": "TRUE",
-        "type": "TYPE",
-        "undef": "UNDEF",
-        "unless": "UNLESS",
-        "class": "CLASS",
-    }
-
-    states = (("comment", "exclusive"), ("regex", "exclusive"), ("docs", "exclusive"))
+    states = (("regex", "exclusive"), ("docs", "exclusive"))
+
+    def __init__(self) -> None:
+        self._ctx = _ParseContext("")
+        self._lock = threading.Lock()
+        self._lexer: Any = lex(object=self)
+        self._scanner = Scanner(self._lexer)
+
+        signature = grammar_signature(self)
+        self.grammar_hash = hashlib.sha256(signature.encode()).hexdigest()[:16]
+        self._parser: Any = _load_tables(self, signature, self.grammar_hash)
+        _resume_on_errors(self._parser)
+
+    @overload
+    def parse(
+        self,
+        script: str,
+        representation: Literal["objects"] = ...,
+        share_leaves: bool = ...,
+        lexer: str = ...,
+        limits: ParseLimits | None = ...,
+        errors: List[ParseError] | None = ...,
+    ) -> Tuple[List[CodeElement], List[Comment]]:
+        ...
+
+    @overload
+    def parse(
+        self,
+        script: str,
+        representation: Literal["arena"],
+        share_leaves: bool = ...,
+        lexer: str = ...,
+        limits: ParseLimits | None = ...,
+        errors: List[ParseError] | None = ...,
+    ) -> Tuple[Arena, List[Comment]]:
+        ...
+
+    def parse(
+        self,
+        script: str,
+        representation: str = "objects",
+        share_leaves: bool = False,
+        lexer: str = "scanner",
+        limits: ParseLimits | None = None,
+        errors: List[ParseError] | None = None,
+    ) -> Tuple[List[CodeElement] | Arena, List[Comment]]:
+        """Parse ``script`` into its elements and comments.
+
+        With ``share_leaves``, values, identifiers and regexes of the same
+        class and value are a single object, which keeps the position of its
+        first occurrence in the tree.
+
+        ``lexer`` is ``"scanner"`` for the :class:`Scanner`, or ``"ply"`` for
+        the PLY lexer it replaces, which gives the same tokens.
+
+        ``limits`` bounds the cost of the call, :class:`LimitExceeded` is
+        raised as soon as one of them is exceeded.
+
+        When ``errors`` is a list, syntax and lexer errors are appended to it
+        instead of being raised. After an error, parsing resumes at the next
+        top-level keyword or ``}``, and the statements that parse are
+        returned. Errors raised by the checks of the grammar rules, such as
+        invalid class names, still end the parse.
+        """
+        if representation not in ("objects", "arena"):
+            raise ValueError(f"Unknown representation {representation!r}")
+        scanner = self._lexer_named(lexer)
+        ctx = _ParseContext(script)
+        tokens = scanner
+        if errors is not None:
+            ctx.errors = errors
+            tokens = _RecoveringLexer(scanner, ctx)
+        if limits is not None:
+            if limits.max_size is not None and len(script) > limits.max_size:
+                raise LimitExceeded("max_size", limits.max_size)
+            if (limits.max_tokens, limits.max_depth, limits.timeout) != (None,) * 3:
+                tokens = _LimitedLexer(tokens, limits)
+        with self._lock:
+            self._ctx = scanner.ctx = ctx
+            scanner.begin("INITIAL")
+            scanner.lineno = 1
+            scanner.input(script)
+            try:
+                elements = self._parser.parse(script, lexer=tokens)
+                if elements is None:
+                    # Recovery gave up at the end of the script
+                    elements = ctx.partial
+            finally:
+                self._ctx = scanner.ctx = _ParseContext("")
+                scanner.input("")
+        if share_leaves:
+            _share_leaves(elements)
+        comments = [Comment(*comment) for comment in ctx.comments]
+        if representation == "arena":
+            return Arena(elements), comments
+        return elements, comments
+
+    def iparse(self, script: str, lexer: str = "scanner") -> Iterator[CodeElement]:
+        """Yield the top-level elements of ``script`` as they are parsed.
+
+        Each element is yielded as soon as the token after it is read, and
+        is not kept afterwards, so a large script can be processed in about
+        the memory of its largest statement. Comments are not collected.
+        Errors are raised when they are reached, after the elements before
+        them were yielded.
+
+        The parser can be used by other calls between two elements.
+        """
+        scanner = self._lexer_named(lexer).clone()
+        scanner.ctx = ctx = _ParseContext(script)
+        scanner.begin("INITIAL")
+        scanner.lineno = 1
+        scanner.input(script)
+        statements = self._statements(scanner)
+        while True:
+            with self._lock:
+                self._ctx = ctx
+                try:
+                    element = next(statements, None)
+                finally:
+                    self._ctx = _ParseContext("")
+            if element is None:
+                return
+            # Neither are needed once the element is built
+            ctx.comments.clear()
+            ctx.lines.columns.clear()
+            yield element
+
+    def _statements(self, lexer: Any) -> Iterator[CodeElement]:
+        # Runs the LALR tables as PLY does, without error recovery, but
+        # yields the top-level statements when they are reduced instead of
+        # appending them to the list of the script
+        parser = self._parser
+        actions, goto = parser.action, parser.goto
+        productions, defaulted = parser.productions, parser.defaulted_states
+        p = YaccProduction(None)
+        p.lexer, p.parser = lexer, parser
+        end = YaccSymbol()
+        end.type = "$end"
+        states = [0]
+        symbols: List[Any] = [end]
+        p.stack = symbols
+        state = 0
+        lookahead = None
+        while True:
+            if state in defaulted:
+                t = defaulted[state]
+            else:
+                if lookahead is None:
+                    lookahead = lexer.token() or end
+                t = actions[state].get(lookahead.type)
+            if t is None:
+                # Raises, recovery is not enabled
+                parser.errorfunc(None if lookahead is end else lookahead)
+            elif t > 0:
+                states.append(t)
+                symbols.append(lookahead)
+                state = t
+                lookahead = None
+            elif t < 0:
+                production = productions[-t]
+                sym = YaccSymbol()
+                sym.type = production.name
+                sym.value = None
+                size = production.len
+                if size:
+                    p.slice = symbols[-size - 1 :]
+                    p.slice[0] = sym
+                    del symbols[-size:]
+                    production.callable(p)
+                    del states[-size:]
+                else:
+                    p.slice = [sym]
+                    production.callable(p)
+                symbols.append(sym)
+                state = goto[states[-1]][production.name]
+                states.append(state)
+                if production.func == "p_statements" and len(symbols) == 2:
+                    statements: List[CodeElement] = p[0]
+                    yield from statements
+                    statements.clear()
+            else:
+                # The statements not yielded yet, and a final expression
+                yield from symbols[-1].value
+                return
+
+    def reparse(
+        self, previous: ParsedScript, edits: Iterable[Tuple[int, int, str]]
+    ) -> ParsedScript:
+        """Apply ``edits`` to a parsed script and parse only what they change.
+
+        Each edit replaces ``previous.script[start:end]`` with a new text.
+        Edits are given in offsets of the previous script and must not
+        overlap. Only the top-level elements around the edits are parsed
+        again, with an unchanged element on each side to check that they
+        start and end as before, and the elements after them are moved.
+        When that check fails, the whole script is parsed.
+
+        ``previous`` must come from a parse with the default options, and is
+        consumed: its elements are reused, and moved, in the result.
+        """
+        old = previous.script
+        changes = sorted(edits, key=lambda edit: edit[:2])
+        if not changes:
+            return previous
+        pieces: List[str] = []
+        pos = 0
+        for start, end, text in changes:
+            if not pos <= start <= end <= len(old):
+                raise ValueError(f"Invalid edit ({start}, {end}, {text!r})")
+            pieces += [old[pos:start], text]
+            pos = end
+        pieces.append(old[pos:])
+        script = "".join(pieces)
+
+        result = self._reparse(previous, script, changes[0][0], changes[-1][1])
+        if result is None:
+            return ParsedScript(script, *self.parse(script))
+        return result
+
+    def _reparse(
+        self, previous: ParsedScript, script: str, lo: int, hi: int
+    ) -> ParsedScript | None:
+        # The edits replace old[lo:hi]. The region parsed again starts at the
+        # second statement before them and ends at the second one after them
+        old, elements, comments = previous
+        old_lines = LineIndex(old)
+        bounds = _statement_bounds(elements, old_lines, old)
+        before = [b for b in bounds if b[1] < lo] or bounds[:1]
+        after = [b for b in bounds if b[1] > hi] or bounds[-1:]
+        a, region_start = before[-2] if len(before) > 1 else before[0]
+        kept_a = before[-1][0]
+        kept_b = after[0][0]
+        b, old_end = after[1] if len(after) > 1 else after[0]
+        region_end = old_end + len(script) - len(old)
+
+        region = self._parse_region(script, region_start, region_end)
+        if region is None:
+            return None
+        parsed, region_comments, new_lines = region
+
+        # Positions at or after old_end are moved to region_end
+        old_line, old_col = old_lines.line(old_end), old_lines.column(old_end)
+        dline = new_lines.line(region_end) - old_line
+        dcol = new_lines.column(region_end) - old_col
+
+        def move(line: int, col: int) -> Tuple[int, int]:
+            if line < old_line:
+                return line, col
+            return line + dline, (col + dcol if line == old_line else col)
+
+        # The unchanged statements around the edits must be parsed as before
+        tail = len(parsed) - (b - kept_b)
+        if tail < kept_a - a:
+            return None
+        for x, y in zip(elements[a:kept_a], parsed):
+            if _span(x) != _span(y):
+                return None
+        for x, y in zip(elements[kept_b:b], parsed[tail:]):
+            if move(x.line, x.col) + move(x.end_line, x.end_col) != _span(y):
+                return None
+
+        kept: List[Comment] = []
+        moved: List[Comment] = []
+        for comment in comments:
+            offset = _offset(old_lines, comment.line, comment.col)
+            if offset < region_start:
+                kept.append(comment)
+            elif offset >= old_end:
+                moved.append(comment)
+        if dline or dcol:
+            move_positions(elements[b:] + moved, move)
+        return ParsedScript(
+            script,
+            elements[:a] + parsed + elements[b:],
+            kept + region_comments + moved,
+        )
+
+    def _parse_region(
+        self, script: str, start: int, end: int
+    ) -> Tuple[List[CodeElement], List[Comment], LineIndex] | None:
+        # Parses script[start:end], or returns None if it is not a sequence of
+        # statements that ends right at end
+        scanner = self._scanner
+        ctx = _ParseContext(script)
+        tokens = _RegionLexer(scanner, start, end, ctx.lines.line(start))
+        with self._lock:
+            self._ctx = scanner.ctx = ctx
+            scanner.begin("INITIAL")
+            try:
+                elements = self._parser.parse(script, lexer=tokens)
+            except InvalidPuppetScript:
+                return None
+            finally:
+                self._ctx = scanner.ctx = _ParseContext("")
+                scanner.input("")
+        # The lines counted by the lexer must also match those of the script
+        following = tokens.next
+        if following is None:
+            if end != len(script):
+                return None
+        elif following.lexpos != end or following.lineno != ctx.lines.line(end):
+            return None
+        comments = [Comment(*comment) for comment in ctx.comments]
+        return elements, comments, ctx.lines
+
+    def tokenize(self, script: str, lexer: str = "scanner") -> Iterator[Token]:
+        """Yield the tokens of ``script``, comments included.
+
+        Tokens are produced on demand by a copy of the parser's lexer, so
+        tokenizing does not hold up other calls to this parser. Whether a
+        slash starts a regex is decided from the previous token, as the
+        parser would.
+        """
+        scanner = self._lexer_named(lexer).clone()
+        scanner.ctx = ctx = _ParseContext(script)
+        ctx.comment_tokens = comments = []
+        scanner.begin("INITIAL")
+        scanner.lineno = 1
+        scanner.input(script)
+        previous = ""
+        heredoc = False
+        while True:
+            state = scanner.current_state()
+            t = scanner.token()
+            yield from comments
+            comments.clear()
+            if t is None:
+                return
+
+            if state == "INITIAL":
+                heredoc = _switch_state(scanner, t.type, previous, heredoc)
+            previous = t.type
+            yield Token(t.type, t.value, t.lexpos, scanner.lexpos, t.lineno)
+
+    def _lexer_named(self, name: str) -> Any:
+        if name == "scanner":
+            return self._scanner
+        if name == "ply":
+            return self._lexer
+        raise ValueError(f"Unknown lexer {name!r}")
+
+    def _column(self, pos: int) -> int:
+        ctx = self._ctx
+        columns = ctx.lines.columns
+        column = columns.get(pos)
+        if column is None:
+            starts = ctx.lines.starts
+            column = pos - starts[bisect_right(starts, pos) - 1] + 1
+            columns[pos] = column
+        return column
 
     # Other
     t_LBRACKET = r"\{"
@@ -204,7 +1154,8 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
     t_CMP_GREATER_THAN_OR_EQUAL = r">="
     t_CMP_REGEX_MATCH = r"=~"
     t_CMP_REGEX_NOT_MATCH = r"!~"
-    t_EQUAL = r"\="
+    # PLY tries longer string rules first, so this has to stay shorter than "=>"
+    t_EQUAL = r"="
     t_BOOL_NOT = r"!"
     t_ARITH_ADD = r"\+"
     t_ARITH_SUB = r"-"
@@ -218,81 +1169,68 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
     t_LANGLEBRACKET = r"(\<\<\|)|(\<\|)"
     t_RANGLEBRACKET = r"(\|\>\>)|(\|\>)"
 
-    # Identifiers
+    # Rules are written so that matching them is linear in the length of the
+    # script, whatever the input: no nested quantifiers over overlapping
+    # alternatives, and identifiers cannot start with a dash
     t_ignore_ANY = r"[\t\ ]"
 
-    def t_newline(t: LexToken):
+    def t_newline(self, t: LexToken):
         r"\n+"
         t.lexer.lineno += len(t.value)
 
-    def t_COMMENT(t: LexToken):
+    def t_COMMENT(self, t: LexToken):
         r"\#.*(\n?)"
-        column = find_column(script, t.lexpos)
-        value = t.value[1:-1]
-        comments.append(
-            Comment(t.lexer.lineno, column, t.lexer.lineno, column + len(value), value)
-        )
+        ctx: _ParseContext = getattr(t.lexer, "ctx")
+        ctx.line_comment(t.value, t.lexpos, t.lexer.lineno)
         t.lexer.lineno += 1
 
-    current_comment = Comment(0, 0, 0, 0, "")
-
-    def t_comment(t: LexToken):
-        r"\/\*"
-        nonlocal current_comment
-        current_comment = Comment(0, 0, 0, 0, "")
-        current_comment.line = t.lexer.lineno
-        current_comment.col = find_column(script, t.lexpos)
-        t.lexer.begin("comment")
-
-    def t_comment_END(t: LexToken):
-        r"\*\/"
-        new_lines = current_comment.content.count("\n")
-        current_comment.end_line = current_comment.line + new_lines
-        current_comment.end_col = len(current_comment.content.split("\n")[-1])
-        comments.append(current_comment)
-        t.lexer.begin("INITIAL")
+    def t_comment(self, t: LexToken):
+        r"/\*[^*]*\*+(?:[^/*][^*]*\*+)*/"
+        ctx: _ParseContext = getattr(t.lexer, "ctx")
+        t.lexer.lineno += ctx.block_comment(t.value, t.lexpos, t.lexer.lineno)
 
-    def t_comment_content(t: LexToken):
-        r".|\n"
-        current_comment.content += t.value
-        t.lexer.lineno += t.value.count("\n")
+    def t_unterminated_comment(self, t: LexToken):
+        r"/\*[\s\S]*"
+        # Unterminated comments swallow the rest of the script
+        ctx: _ParseContext = getattr(t.lexer, "ctx")
+        ctx.comment_token(t.value, t.lexpos, t.lexer.lineno)
 
-    def t_regex_END(t: LexToken):
+    def t_regex_END(self, t: LexToken):
         r"\/"
         t.type = "ARITH_DIV"
         t.lexer.begin("INITIAL")
         return t
 
-    def t_regex_expression(t: LexToken):
-        r"((\\.)|[^\/])+"
+    def t_regex_expression(self, t: LexToken):
+        r"(?:[^\\/]|\\[\s\S]?)+"
         t.type = "REGEXPRESSION"
         return t
 
-    def t_docs_END(t: LexToken):
+    def t_docs_END(self, t: LexToken):
         r"\|"
         t.type = "BAR"
         t.lexer.begin("INITIAL")
         return t
 
-    def t_docs_string(t: LexToken):
-        r"(\n|[^\|])+"
+    def t_docs_string(self, t: LexToken):
+        r"[^\|]+"
         t.lexer.lineno += t.value.count("\n")
         t.type = "STRING"
         return t
 
-    def t_octal_INTEGER(t: LexToken):
+    def t_octal_INTEGER(self, t: LexToken):
         r"0[0-9]+"
         t.value = str(t.value)  # type: ignore
         t.type = "OCT_INTEGER"
         return t
 
-    def t_hexa_INTEGER(t: LexToken):
+    def t_hexa_INTEGER(self, t: LexToken):
         r"0x[0-9a-f]+"
         t.value = str(t.value)  # type: ignore
         t.type = "HEXA_INTEGER"
         return t
 
-    def t_NUMBER(t: LexToken):
+    def t_NUMBER(self, t: LexToken):
         r"((0|[1-9]\d*)(\.\d+)?(e-?(0|[1-9]\d*))?)"
         if "." in t.value:
             t.type = "FLOAT"
@@ -300,36 +1238,30 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
             t.type = "INTEGER"
         return t
 
-    def t_ID_TYPE(t: LexToken):
-        r"((::)?[A-Za-z0-9\_\-]*(::))*[A-Z][a-zA-Z0-9\_\-]*"
+    def t_ID_TYPE(self, t: LexToken):
+        r"(?!-)(?:[A-Za-z0-9\_\-]*::)*[A-Z][a-zA-Z0-9\_\-]*"
+        t.value = sys.intern(t.value)
         if t.value == "Sensitive":
             t.type = "SENSITIVE"
         return t
 
-    def t_ID(t: LexToken):
-        r"([a-z_\$]|(::))((::)?[A-Za-z0-9\_\-]*)*"
+    def t_ID(self, t: LexToken):
+        r"(?:[a-z\_\$]|::)(?:::|[A-Za-z0-9\_\-])*"
+        t.value = sys.intern(t.value)
         t.type = keywords.get(t.value, statement_functions.get(t.value, "ID"))
         return t
 
-    def t_STRING(t: LexToken):
-        r"(\'([^\\]|(\\(\n|.)))*?\')|(\"([^\\]|(\\(\n|.)))*?\")"
+    def t_STRING(self, t: LexToken):
+        r"\"[^\"\\]*(?:\\[\s\S][^\"\\]*)*\"|\'[^\'\\]*(?:\\[\s\S][^\'\\]*)*\'"
         t.value = t.value[1:-1]
+        if len(t.value) <= INTERNED_STRING_LENGTH:
+            t.value = sys.intern(t.value)
         t.lexer.lineno += t.value.count("\n")
         return t
 
-    def t_ANY_error(t: LexToken):
+    def t_ANY_error(self, t: LexToken):
         raise InvalidPuppetScript(f"Lexer error {t}")
 
-    lexer = lex()
-    # Give the lexer some input
-    lexer.input(script)
-
-    # while True:
-    #     tok = lexer.token()
-    #     if not tok:
-    #         break      # No more input
-    #     print(tok)
-
     precedence = (
         ("nonassoc", "NO_LAMBDA"),
         ("nonassoc", "LAMBDA"),
@@ -363,36 +1295,36 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
 
     start = "program"
 
-    def p_program(p: YaccProduction):
+    def p_program(self, p: YaccProduction):
         "program : block"
         p[0] = p[1]
 
-    def p_class(p: YaccProduction):
+    def p_class(self, p: YaccProduction):
         r"class : CLASS class_header LBRACKET block RBRACKET"
         p[0] = PuppetClass(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2][0],
             p[4],
             p[2][2],
             p[2][1],
         )
 
-    def p_class_header(p: YaccProduction):
+    def p_class_header(self, p: YaccProduction):
         r"class_header : ID LPAREN parameters RPAREN"
         if not re.match(r"([a-z][a-z0-9_]*)?(::[a-z][a-z0-9_]*)*", p[1]):
             raise InvalidPuppetScript(f"Syntax error")
         p[0] = (p[1], p[3], "")
 
-    def p_class_header_no_parameters(p: YaccProduction):
+    def p_class_header_no_parameters(self, p: YaccProduction):
         r"class_header : ID"
         if not re.match(r"([a-z][a-z0-9_]*)?(::[a-z][a-z0-9_]*)*", p[1]):
             raise InvalidPuppetScript(f"Syntax error")
         p[0] = (p[1], [], "")
 
-    def p_class_header_pars_inherits(p: YaccProduction):
+    def p_class_header_pars_inherits(self, p: YaccProduction):
         r"class_header : ID LPAREN parameters RPAREN INHERITS ID"
         if not re.match(r"([a-z][a-z0-9_]*)?(::[a-z][a-z0-9_]*)*", p[1]):
             raise InvalidPuppetScript(f"Syntax error")
@@ -400,7 +1332,7 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
             raise InvalidPuppetScript(f"Syntax error")
         p[0] = (p[1], p[3], p[6])
 
-    def p_class_header_inherits(p: YaccProduction):
+    def p_class_header_inherits(self, p: YaccProduction):
         r"class_header : ID INHERITS ID"
         if not re.match(r"([a-z][a-z0-9_]*)?(::[a-z][a-z0-9_]*)*", p[1]):
             raise InvalidPuppetScript(f"Syntax error")
@@ -408,14 +1340,14 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
             raise InvalidPuppetScript(f"Syntax error")
         p[0] = (p[1], [], p[3])
 
-    def p_class_resource_declaration(p: YaccProduction):
+    def p_class_resource_declaration(self, p: YaccProduction):
         r"class : CLASS LBRACKET resource_list RBRACKET"
         if len(p[3]) == 1:
             p[0] = ClassAsResource(
                 p.lineno(1),
-                find_column(script, p.lexpos(1)),
+                self._column(p.lexpos(1)),
                 p.lineno(4),
-                find_column(script, p.lexpos(4)) + 1,
+                self._column(p.lexpos(4)) + 1,
                 p[3][0][0],
                 p[3][0][1],
             )
@@ -425,80 +1357,80 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
             )
             p[0] = ResourceExpression(
                 p.lineno(1),
-                find_column(script, p.lexpos(1)),
+                self._column(p.lexpos(1)),
                 p.lineno(4),
-                find_column(script, p.lexpos(4)) + 1,
+                self._column(p.lexpos(4)) + 1,
                 None,
                 resources,
             )
 
-    def p_node(p: YaccProduction):
+    def p_node(self, p: YaccProduction):
         r"node : NODE STRING LBRACKET block RBRACKET"
         p[0] = Node(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
         )
 
-    def p_node_id(p: YaccProduction):
+    def p_node_id(self, p: YaccProduction):
         r"node : NODE ID LBRACKET block RBRACKET"
         p[0] = Node(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
         )
 
-    def p_node_regex(p: YaccProduction):
+    def p_node_regex(self, p: YaccProduction):
         r"node : NODE regex LBRACKET block RBRACKET"
         p[0] = Node(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
         )
 
-    def p_node_default(p: YaccProduction):
+    def p_node_default(self, p: YaccProduction):
         r"node : NODE DEFAULT LBRACKET block RBRACKET"
         p[0] = Node(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
         )
 
-    def p_assignment(p: YaccProduction):
+    def p_assignment(self, p: YaccProduction):
         r"assignment : ID EQUAL expression"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = Assignment(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[3].end_line,
             p[3].end_col,
             id,
             p[3],
         )
 
-    def p_assignment_access(p: YaccProduction):
+    def p_assignment_access(self, p: YaccProduction):
         r"assignment : access EQUAL expression"
         p[0] = Assignment(p[1].line, p[1].col, p[3].end_line, p[3].end_col, p[1], p[3])
 
-    def p_assignment_array(p: YaccProduction):
+    def p_assignment_array(self, p: YaccProduction):
         r"assignment : array EQUAL array"
         if len(p[1].value) != len(p[3].value):
             raise InvalidPuppetScript(f"Syntax error")
@@ -510,14 +1442,14 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
                 raise InvalidPuppetScript(f"Syntax error")
         p[0] = Assignment(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[3].end_line,
             p[3].end_col,
             p[1],
             p[3],
         )
 
-    def p_assignment_hash(p: YaccProduction):
+    def p_assignment_hash(self, p: YaccProduction):
         r"assignment : array EQUAL hash"
         for id in p[1].value:
             if not re.match(r"^\$[a-z0-9_][a-zA-Z0-9_]*$", id.value) and not re.match(
@@ -531,50 +1463,63 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
 
         p[0] = Assignment(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[3].end_line,
             p[3].end_col,
             p[1],
             p[3],
         )
 
-    def p_assignment_type_alias(p: YaccProduction):
+    def p_assignment_type_alias(self, p: YaccProduction):
         r"assignment : TYPE ID_TYPE EQUAL expression"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(2),
-            find_column(script, p.lexpos(2)) + len(p[2]),
+            self._column(p.lexpos(2)) + len(p[2]),
             p[1] + " " + p[2],
         )
         p[0] = Assignment(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[4].end_line,
             p[4].end_col,
             id,
             p[4],
         )
 
-    def p_block(p: YaccProduction):
-        r"block : statement block"
-        p[0] = [p[1]] + p[2]
+    def p_block(self, p: YaccProduction):
+        r"block : statements"
+        p[0] = p[1]
 
-    def p_block_return(p: YaccProduction):
-        r"block : expression"
-        p[0] = [p[1]]
+    def p_block_return(self, p: YaccProduction):
+        r"block : statements expression"
+        p[1].append(p[2])
+        p[0] = p[1]
+
+    def p_statements(self, p: YaccProduction):
+        r"statements : statements statement"
+        p[1].append(p[2])
+        p[0] = p[1]
 
-    def p_block_empty(p: YaccProduction):
-        r"block : empty"
+    def p_statements_empty(self, p: YaccProduction):
+        r"statements : empty"
         p[0] = []
 
-    def p_resource_id(p: YaccProduction):
+    def p_statements_error(self, p: YaccProduction):
+        r"statements : statements error"
+        # Only reached when recovering, p_error raises otherwise. The next
+        # error is reported as well, however close it is.
+        p.parser.errok()
+        p[0] = p[1]
+
+    def p_resource_id(self, p: YaccProduction):
         r"resource : ID LBRACKET resource_list RBRACKET"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         if not re.match(r"([a-z][a-z0-9_]*)?(::[a-z][a-z0-9_]*)*", p[1]):
@@ -582,9 +1527,9 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         if len(p[3]) == 1:
             p[0] = Resource(
                 id.line,
-                id.col,
+                id.col,  # pyright: ignore[reportPrivateUsage]
                 p.lineno(4),
-                find_column(script, p.lexpos(4)) + 1,
+                self._column(p.lexpos(4)) + 1,
                 id,
                 p[3][0][0],
                 p[3][0][1],
@@ -615,14 +1560,14 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
 
             p[0] = ResourceExpression(
                 id.line,
-                id.col,
+                id.col,  # pyright: ignore[reportPrivateUsage]
                 p.lineno(4),
-                find_column(script, p.lexpos(4)) + 1,
+                self._column(p.lexpos(4)) + 1,
                 default,
                 resources,
             )
 
-    def p_resource(p: YaccProduction):
+    def p_resource(self, p: YaccProduction):
         r"resource : key LBRACKET resource_list RBRACKET"
         if not re.match(r"([a-z][a-z0-9_]*)?(::[a-z][a-z0-9_]*)*", p[1].value):
             raise InvalidPuppetScript(f"Syntax error")
@@ -631,7 +1576,7 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
                 p[1].line,
                 p[1].col,
                 p.lineno(4),
-                find_column(script, p.lexpos(4)) + 1,
+                self._column(p.lexpos(4)) + 1,
                 p[1],
                 p[3][0][0],
                 p[3][0][1],
@@ -662,31 +1607,40 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
                 p[1].line,
                 p[1].col,
                 p.lineno(4),
-                find_column(script, p.lexpos(4)) + 1,
+                self._column(p.lexpos(4)) + 1,
                 default,
                 resources,
             )
 
-    def p_resource_list(p: YaccProduction):
-        r"resource_list : resource_body DOT_COMMA resource_list"
-        p[0] = [p[1]] + p[3]
+    def p_resource_list(self, p: YaccProduction):
+        r"resource_list : resource_list_items"
+        p[0] = p[1]
 
-    def p_resource_list_single(p: YaccProduction):
-        r"resource_list : resource_body"
-        p[0] = [p[1]]
+    def p_resource_list_trailing(self, p: YaccProduction):
+        r"resource_list : resource_list_items DOT_COMMA"
+        p[0] = p[1]
 
-    def p_resource_list_empty(p: YaccProduction):
+    def p_resource_list_empty(self, p: YaccProduction):
         r"resource_list : empty"
         p[0] = []
 
-    def p_resource_body(p: YaccProduction):
+    def p_resource_list_items(self, p: YaccProduction):
+        r"resource_list_items : resource_list_items DOT_COMMA resource_body"
+        p[1].append(p[3])
+        p[0] = p[1]
+
+    def p_resource_list_items_single(self, p: YaccProduction):
+        r"resource_list_items : resource_body"
+        p[0] = [p[1]]
+
+    def p_resource_body(self, p: YaccProduction):
         r"resource_body : expression COLON attributes"
         if len(p[3]) > 0:
             p[0] = (
                 p[1],
                 p[3],
                 p.lineno(1),
-                find_column(script, p.lexpos(1)),
+                self._column(p.lexpos(1)),
                 p[3][-1].end_line,
                 p[3][-1].end_col,
             )
@@ -695,26 +1649,26 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
                 p[1],
                 p[3],
                 p.lineno(1),
-                find_column(script, p.lexpos(1)),
+                self._column(p.lexpos(1)),
                 p.lineno(2),
-                find_column(script, p.lexpos(2)),
+                self._column(p.lexpos(2)),
             )
 
-    def p_virtual_resource(p: YaccProduction):
+    def p_virtual_resource(self, p: YaccProduction):
         r"resource : AT ID LBRACKET resource_list RBRACKET"
         id = Id(
             p.lineno(2),
-            find_column(script, p.lexpos(2)),
+            self._column(p.lexpos(2)),
             p.lineno(2),
-            find_column(script, p.lexpos(2)) + len(p[2]),
+            self._column(p.lexpos(2)) + len(p[2]),
             "@" + p[2],
         )
         if len(p[4]) == 1:
             p[0] = Resource(
                 p.lineno(2),
-                find_column(script, p.lexpos(2)),
+                self._column(p.lexpos(2)),
                 p.lineno(5),
-                find_column(script, p.lexpos(5)) + 1,
+                self._column(p.lexpos(5)) + 1,
                 id,
                 p[4][0][0],
                 p[4][0][1],
@@ -743,29 +1697,29 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
 
             p[0] = ResourceExpression(
                 p.lineno(2),
-                find_column(script, p.lexpos(2)),
+                self._column(p.lexpos(2)),
                 p.lineno(5),
-                find_column(script, p.lexpos(5)) + 1,
+                self._column(p.lexpos(5)) + 1,
                 default,
                 resources,
             )
 
-    def p_exported_resource(p: YaccProduction):
+    def p_exported_resource(self, p: YaccProduction):
         r"resource : AT AT ID LBRACKET resource_list RBRACKET"
         id = Id(
             p.lineno(3),
-            find_column(script, p.lexpos(3)),
+            self._column(p.lexpos(3)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + len(p[3]),
+            self._column(p.lexpos(3)) + len(p[3]),
             "@@" + p[3],
         )
 
         if len(p[4]) == 1:
             p[0] = Resource(
                 p.lineno(3),
-                find_column(script, p.lexpos(3)),
+                self._column(p.lexpos(3)),
                 p.lineno(6),
-                find_column(script, p.lexpos(6)) + 1,
+                self._column(p.lexpos(6)) + 1,
                 id,
                 p[5][0][0],
                 p[5][0][1],
@@ -794,195 +1748,204 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
 
             p[0] = ResourceExpression(
                 p.lineno(3),
-                find_column(script, p.lexpos(3)),
+                self._column(p.lexpos(3)),
                 p.lineno(6),
-                find_column(script, p.lexpos(6)) + 1,
+                self._column(p.lexpos(6)) + 1,
                 default,
                 resources,
             )
 
-    def p_abstract_resource(p: YaccProduction):
+    def p_abstract_resource(self, p: YaccProduction):
         r"resource : reference LBRACKET expression COLON attributes RBRACKET"
         if p[1].type != "Resource":
             raise InvalidPuppetScript(f"Syntax error")
         p[0] = Resource(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(6),
-            find_column(script, p.lexpos(6)) + 1,
+            self._column(p.lexpos(6)) + 1,
             p[1],
             p[3],
             p[5],
         )
 
-    def p_change_resource(p: YaccProduction):
+    def p_change_resource(self, p: YaccProduction):
         r"resource : reference LBRACKET attributes RBRACKET"
         p[0] = Resource(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             p[1],
             None,
             p[3],
         )
 
-    def p_change_resource_collector(p: YaccProduction):
+    def p_change_resource_collector(self, p: YaccProduction):
         r"resource : resource_collector LBRACKET attributes RBRACKET"
         p[0] = Resource(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             p[1],
             None,
             p[3],
         )
 
-    def p_resource_default(p: YaccProduction):
+    def p_resource_default(self, p: YaccProduction):
         r"resource : ID_TYPE LBRACKET attributes RBRACKET"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = Resource(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             id,
             None,
             p[3],
         )
 
-    def p_resource_declaration(p: YaccProduction):
+    def p_resource_declaration(self, p: YaccProduction):
         r"resource : DEFINE ID LPAREN parameters RPAREN LBRACKET block RBRACKET"
         p[0] = ResourceDeclaration(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(8),
-            find_column(script, p.lexpos(8)) + 1,
+            self._column(p.lexpos(8)) + 1,
             p[2],
             p[4],
             p[7],
         )
 
-    def p_resource_declaration_no_parameters(p: YaccProduction):
+    def p_resource_declaration_no_parameters(self, p: YaccProduction):
         r"resource : DEFINE ID LBRACKET block RBRACKET"
         p[0] = ResourceDeclaration(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             [],
             p[4],
         )
 
-    def p_resource_collector(p: YaccProduction):
+    def p_resource_collector(self, p: YaccProduction):
         r"resource_collector : ID_TYPE LANGLEBRACKET rc_expression RANGLEBRACKET"
         p[0] = ResourceCollector(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 2,
+            self._column(p.lexpos(4)) + 2,
             p[1],
             p[3],
         )
 
-    def p_resource_collector_empty(p: YaccProduction):
+    def p_resource_collector_empty(self, p: YaccProduction):
         r"resource_collector : ID_TYPE LANGLEBRACKET RANGLEBRACKET"
         p[0] = ResourceCollector(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + 2,
+            self._column(p.lexpos(3)) + 2,
             p[1],
             None,
         )
 
-    def p_resource_collector_expression_equal(p: YaccProduction):
+    def p_resource_collector_expression_equal(self, p: YaccProduction):
         r"rc_expression : rc_expression CMP_EQUAL rc_expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
 
-    def p_resource_collector_expression_not_equal(p: YaccProduction):
+    def p_resource_collector_expression_not_equal(self, p: YaccProduction):
         r"rc_expression : rc_expression CMP_NOT_EQUAL rc_expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
 
-    def p_resource_collector_expression_and(p: YaccProduction):
+    def p_resource_collector_expression_and(self, p: YaccProduction):
         r"rc_expression : rc_expression BOOL_AND rc_expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
 
-    def p_resource_collector_expression_or(p: YaccProduction):
+    def p_resource_collector_expression_or(self, p: YaccProduction):
         r"rc_expression : rc_expression BOOL_OR rc_expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
 
-    def p_resource_collector_expression_paren(p: YaccProduction):
+    def p_resource_collector_expression_paren(self, p: YaccProduction):
         r"rc_expression : LPAREN rc_expression RPAREN"
         p[0] = p[2]
 
-    def p_resource_collector_expression_value(p: YaccProduction):
+    def p_resource_collector_expression_value(self, p: YaccProduction):
         r"rc_expression : expression"
         p[0] = p[1]
 
-    def p_parameters(p: YaccProduction):
-        r"parameters : parameter COMMA parameters"
-        p[0] = [p[1]] + p[3]
+    def p_parameters(self, p: YaccProduction):
+        r"parameters : parameters_items"
+        p[0] = p[1]
 
-    def p_parameters_single(p: YaccProduction):
-        r"parameters : parameter"
-        p[0] = [p[1]]
+    def p_parameters_trailing(self, p: YaccProduction):
+        r"parameters : parameters_items COMMA"
+        p[0] = p[1]
 
-    def p_parameters_empty(p: YaccProduction):
+    def p_parameters_empty(self, p: YaccProduction):
         r"parameters : empty"
         p[0] = []
 
-    def p_parameter(p: YaccProduction):
+    def p_parameters_items(self, p: YaccProduction):
+        r"parameters_items : parameters_items COMMA parameter"
+        p[1].append(p[3])
+        p[0] = p[1]
+
+    def p_parameters_items_single(self, p: YaccProduction):
+        r"parameters_items : parameter"
+        p[0] = [p[1]]
+
+    def p_parameter(self, p: YaccProduction):
         r"parameter : data_type ID EQUAL expression"
         p[0] = Parameter(
             p[1].line, p[1].col, p[4].end_line, p[4].end_col, p[1], p[2], p[4]
         )
 
-    def p_parameter_no_default(p: YaccProduction):
+    def p_parameter_no_default(self, p: YaccProduction):
         r"parameter : data_type ID"
         p[0] = Parameter(
             p[1].line,
             p[1].col,
             p.lineno(2),
-            find_column(script, p.lexpos(2)) + len(p[2]),
+            self._column(p.lexpos(2)) + len(p[2]),
             p[1],
             p[2],
             None,
         )
 
-    def p_parameter_only_name(p: YaccProduction):
+    def p_parameter_only_name(self, p: YaccProduction):
         r"parameter : ID"
         p[0] = Parameter(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             "",
             p[1],
             None,
         )
 
-    def p_parameter_default_without_type(p: YaccProduction):
+    def p_parameter_default_without_type(self, p: YaccProduction):
         r"parameter : ID EQUAL expression"
         p[0] = Parameter(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[3].end_line,
             p[3].end_col,
             "",
@@ -990,11 +1953,11 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
             p[3],
         )
 
-    def p_parameter_extra(p: YaccProduction):
+    def p_parameter_extra(self, p: YaccProduction):
         r"parameter : ID ARITH_MUL ID EQUAL expression"
         p[0] = Parameter(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[5].end_line,
             p[5].end_col,
             p[1],
@@ -1002,35 +1965,35 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
             p[4],
         )
 
-    def p_parameter_no_default_extra(p: YaccProduction):
+    def p_parameter_no_default_extra(self, p: YaccProduction):
         r"parameter : ID ARITH_MUL ID"
         p[0] = Parameter(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + len(p[3]),
+            self._column(p.lexpos(3)) + len(p[3]),
             p[1],
             p[2],
             None,
         )
 
-    def p_parameter_only_name_extra(p: YaccProduction):
+    def p_parameter_only_name_extra(self, p: YaccProduction):
         r"parameter : ARITH_MUL ID"
         p[0] = Parameter(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(2),
-            find_column(script, p.lexpos(2)) + len(p[2]),
+            self._column(p.lexpos(2)) + len(p[2]),
             "",
             p[1],
             None,
         )
 
-    def p_parameter_default_without_type_extra(p: YaccProduction):
+    def p_parameter_default_without_type_extra(self, p: YaccProduction):
         r"parameter : ARITH_MUL ID EQUAL expression"
         p[0] = Parameter(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[4].end_line,
             p[4].end_col,
             "",
@@ -1038,341 +2001,370 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
             p[3],
         )
 
-    def p_attributes(p: YaccProduction):
-        r"attributes : attribute COMMA attributes"
-        p[0] = [p[1]] + p[3]
+    def p_attributes(self, p: YaccProduction):
+        r"attributes : attributes_items"
+        p[0] = p[1]
 
-    def p_attributes_single(p: YaccProduction):
-        r"attributes : attribute"
-        p[0] = [p[1]]
+    def p_attributes_trailing(self, p: YaccProduction):
+        r"attributes : attributes_items COMMA"
+        p[0] = p[1]
 
-    def p_attributes_empty(p: YaccProduction):
+    def p_attributes_empty(self, p: YaccProduction):
         r"attributes : empty"
         p[0] = []
 
-    def p_attribute(p: YaccProduction):
+    def p_attributes_items(self, p: YaccProduction):
+        r"attributes_items : attributes_items COMMA attribute"
+        p[1].append(p[3])
+        p[0] = p[1]
+
+    def p_attributes_items_single(self, p: YaccProduction):
+        r"attributes_items : attribute"
+        p[0] = [p[1]]
+
+    def p_attribute(self, p: YaccProduction):
         r"attribute : ID HASH_ROCKET expression"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = Attribute(id, p[3])
 
-    def p_attribute_key(p: YaccProduction):
+    def p_attribute_key(self, p: YaccProduction):
         r"attribute : key HASH_ROCKET expression"
         p[0] = Attribute(p[1], p[3])
 
-    def p_attribute_splat(p: YaccProduction):
+    def p_attribute_splat(self, p: YaccProduction):
         r"attribute : ARITH_MUL HASH_ROCKET expression"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = Attribute(id, p[3])
 
-    def p_attribute_plussign(p: YaccProduction):
+    def p_attribute_plussign(self, p: YaccProduction):
         r"attribute : ID PLUSIGNMENT expression"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = Attribute(id, p[3])
 
-    def p_attribute_key_plussign(p: YaccProduction):
+    def p_attribute_key_plussign(self, p: YaccProduction):
         r"attribute : key PLUSIGNMENT expression"
         p[0] = Attribute(p[1], p[3])
 
-    def p_attribute_splat_plussign(p: YaccProduction):
+    def p_attribute_splat_plussign(self, p: YaccProduction):
         r"attribute : ARITH_MUL PLUSIGNMENT expression"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = Attribute(id, p[3])
 
-    def p_key_default(p: YaccProduction):
+    def p_key_default(self, p: YaccProduction):
         r"key : DEFAULT"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_node(p: YaccProduction):
+    def p_key_node(self, p: YaccProduction):
         r"key : NODE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_site(p: YaccProduction):
+    def p_key_site(self, p: YaccProduction):
         r"key : SITE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_import(p: YaccProduction):
+    def p_key_import(self, p: YaccProduction):
         r"key : IMPORT"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_unless(p: YaccProduction):
+    def p_key_unless(self, p: YaccProduction):
         r"key : UNLESS"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_type(p: YaccProduction):
+    def p_key_type(self, p: YaccProduction):
         r"key : TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_include(p: YaccProduction):
+    def p_key_include(self, p: YaccProduction):
         r"key : INCLUDE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_require(p: YaccProduction):
+    def p_key_require(self, p: YaccProduction):
         r"key : REQUIRE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_contain(p: YaccProduction):
+    def p_key_contain(self, p: YaccProduction):
         r"key : CONTAIN"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_tag(p: YaccProduction):
+    def p_key_tag(self, p: YaccProduction):
         r"key : TAG"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_debug(p: YaccProduction):
+    def p_key_debug(self, p: YaccProduction):
         r"key : DEBUG"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_info(p: YaccProduction):
+    def p_key_info(self, p: YaccProduction):
         r"key : INFO"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_notice(p: YaccProduction):
+    def p_key_notice(self, p: YaccProduction):
         r"key : NOTICE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_warning(p: YaccProduction):
+    def p_key_warning(self, p: YaccProduction):
         r"key : WARNING"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_err(p: YaccProduction):
+    def p_key_err(self, p: YaccProduction):
         r"key : ERR"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_attributekey_fail(p: YaccProduction):
+    def p_attributekey_fail(self, p: YaccProduction):
         r"key : FAIL"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_key_realize(p: YaccProduction):
+    def p_key_realize(self, p: YaccProduction):
         r"key : REALIZE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_array(p: YaccProduction):
+    def p_array(self, p: YaccProduction):
         r"array : LPARENR expressionlist RPARENR"
         p[0] = Array(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + 1,
+            self._column(p.lexpos(3)) + 1,
             p[2],
         )
 
-    def p_hash(p: YaccProduction):
+    def p_hash(self, p: YaccProduction):
         r"hash : LBRACKET keyvalue_pairs RBRACKET"
         res: Dict[CodeElement, CodeElement] = {}
         for kv in p[2]:
             res[kv[0]] = kv[1]
         p[0] = Hash(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + 1,
+            self._column(p.lexpos(3)) + 1,
             res,
         )
 
-    def p_keyvalue_pairs(p: YaccProduction):
-        r"keyvalue_pairs : keyvalue COMMA keyvalue_pairs"
-        p[0] = [p[1]] + p[3]
+    def p_keyvalue_pairs(self, p: YaccProduction):
+        r"keyvalue_pairs : keyvalue_pairs_items"
+        p[0] = p[1]
 
-    def p_keyvalue_pairs_single(p: YaccProduction):
-        r"keyvalue_pairs : keyvalue"
-        p[0] = [p[1]]
+    def p_keyvalue_pairs_trailing(self, p: YaccProduction):
+        r"keyvalue_pairs : keyvalue_pairs_items COMMA"
+        p[0] = p[1]
 
-    def p_keyvalue_pairs_empty(p: YaccProduction):
+    def p_keyvalue_pairs_empty(self, p: YaccProduction):
         r"keyvalue_pairs : empty"
         p[0] = []
 
-    def p_keyvalue(p: YaccProduction):
+    def p_keyvalue_pairs_items(self, p: YaccProduction):
+        r"keyvalue_pairs_items : keyvalue_pairs_items COMMA keyvalue"
+        p[1].append(p[3])
+        p[0] = p[1]
+
+    def p_keyvalue_pairs_items_single(self, p: YaccProduction):
+        r"keyvalue_pairs_items : keyvalue"
+        p[0] = [p[1]]
+
+    def p_keyvalue(self, p: YaccProduction):
         r"keyvalue : expression HASH_ROCKET expression"
         p[0] = (p[1], p[3])
 
-    def p_keyvalue_key(p: YaccProduction):
+    def p_keyvalue_key(self, p: YaccProduction):
         r"keyvalue : key HASH_ROCKET expression"
         p[0] = (p[1], p[3])
 
-    def p_expressionlist(p: YaccProduction):
-        r"expressionlist : expression COMMA expressionlist"
-        p[0] = [p[1]] + p[3]
+    def p_expressionlist(self, p: YaccProduction):
+        r"expressionlist : expressionlist_items"
+        p[0] = p[1]
         p.set_lineno(0, p.lineno(1))
 
-    def p_expressionlist_single(p: YaccProduction):
-        r"expressionlist : expression"
-        p[0] = [p[1]]
+    def p_expressionlist_trailing(self, p: YaccProduction):
+        r"expressionlist : expressionlist_items COMMA"
+        p[0] = p[1]
         p.set_lineno(0, p.lineno(1))
 
-    def p_expressionlist_empty(p: YaccProduction):
+    def p_expressionlist_empty(self, p: YaccProduction):
         r"expressionlist : empty"
         p[0] = []
 
+    def p_expressionlist_items(self, p: YaccProduction):
+        r"expressionlist_items : expressionlist_items COMMA expression"
+        p[1].append(p[3])
+        p[0] = p[1]
+        p.set_lineno(0, p.lineno(1))
+
+    def p_expressionlist_items_single(self, p: YaccProduction):
+        r"expressionlist_items : expression"
+        p[0] = [p[1]]
+        p.set_lineno(0, p.lineno(1))
+
     ### Expressions ###
-    def p_expression(p: YaccProduction):
+    def p_expression(self, p: YaccProduction):
         "expression : value"
         p[0] = p[1]
         p.set_lineno(0, p[1].line)
 
-    def p_expression_function_call(p: YaccProduction):
+    def p_expression_function_call(self, p: YaccProduction):
         r"expression : function_call"
         p[0] = p[1]
         p.set_lineno(0, p[1].line)
 
-    def p_expression_statement_function(p: YaccProduction):
+    def p_expression_statement_function(self, p: YaccProduction):
         "expression : statement_function"
         p[0] = p[1]
         p.set_lineno(0, p[1].line)
 
-    def p_expression_paren(p: YaccProduction):
+    def p_expression_paren(self, p: YaccProduction):
         "expression : LPAREN expression RPAREN"
         p[0] = p[2]
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_assignment(p: YaccProduction):
+    def p_expression_assignment(self, p: YaccProduction):
         r"expression : assignment"
         p[0] = p[1]
         p.set_lineno(0, p[1].line)
 
-    def p_expression_access_section(p: YaccProduction):
+    def p_expression_access_section(self, p: YaccProduction):
         r"expression : expression LPARENR INTEGER COMMA INTEGER RPARENR"
         p[0] = Operation(
             p[1].line,
             p[1].col,
             p.lineno(6),
-            find_column(script, p.lexpos(6)) + 1,
+            self._column(p.lexpos(6)) + 1,
             (p[1], p[3], p[5]),
             p[2] + p[4] + p[6],
         )
         p.set_lineno(0, p.lineno(1))
 
     ## Selector ##
-    def p_expression_selector(p: YaccProduction):
+    def p_expression_selector(self, p: YaccProduction):
         r"expression : expression QUESTION_MARK hash"
         p[0] = Selector(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[3].end_line,
             p[3].end_col,
             p[1],
@@ -1381,63 +2373,63 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         p.set_lineno(0, p.lineno(1))
 
     ## Comparison ##
-    def p_expression_equal(p: YaccProduction):
+    def p_expression_equal(self, p: YaccProduction):
         r"expression : expression CMP_EQUAL expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_not_equal(p: YaccProduction):
+    def p_expression_not_equal(self, p: YaccProduction):
         r"expression : expression CMP_NOT_EQUAL expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_less_than(p: YaccProduction):
+    def p_expression_less_than(self, p: YaccProduction):
         r"expression : expression CMP_LESS_THAN expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_greater_than(p: YaccProduction):
+    def p_expression_greater_than(self, p: YaccProduction):
         r"expression : expression CMP_GREATER_THAN expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_less_than_or_equal(p: YaccProduction):
+    def p_expression_less_than_or_equal(self, p: YaccProduction):
         r"expression : expression CMP_LESS_THAN_OR_EQUAL expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_greater_than_or_equal(p: YaccProduction):
+    def p_expression_greater_than_or_equal(self, p: YaccProduction):
         r"expression : expression CMP_GREATER_THAN_OR_EQUAL expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_regex_match(p: YaccProduction):
+    def p_expression_regex_match(self, p: YaccProduction):
         r"expression : expression CMP_REGEX_MATCH expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_regex_not_match(p: YaccProduction):
+    def p_expression_regex_not_match(self, p: YaccProduction):
         r"expression : expression CMP_REGEX_NOT_MATCH expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_in(p: YaccProduction):
+    def p_expression_in(self, p: YaccProduction):
         r"expression : expression CMP_IN expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
@@ -1445,25 +2437,25 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         p.set_lineno(0, p.lineno(1))
 
     ## Boolean
-    def p_expression_and(p: YaccProduction):
+    def p_expression_and(self, p: YaccProduction):
         r"expression : expression BOOL_AND expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_or(p: YaccProduction):
+    def p_expression_or(self, p: YaccProduction):
         r"expression : expression BOOL_OR expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_not(p: YaccProduction):
+    def p_expression_not(self, p: YaccProduction):
         r"expression : BOOL_NOT expression"
         p[0] = Operation(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[2].end_line,
             p[2].end_col,
             (p[2],),
@@ -1472,11 +2464,11 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         p.set_lineno(0, p.lineno(1))
 
     ## Arithmetic
-    def p_expression_negation(p: YaccProduction):
+    def p_expression_negation(self, p: YaccProduction):
         r"expression : ARITH_SUB expression %prec ARITH_MINUS"
         p[0] = Operation(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[2].end_line,
             p[2].end_col,
             (p[2],),
@@ -1485,7 +2477,7 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         p.set_lineno(0, p.lineno(1))
 
     # It also works for array concatenation and hash merging
-    def p_expression_addition(p: YaccProduction):
+    def p_expression_addition(self, p: YaccProduction):
         r"expression : expression ARITH_ADD expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
@@ -1493,28 +2485,28 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         p.set_lineno(0, p.lineno(1))
 
     # It also works for array and hash removal
-    def p_expression_subtraction(p: YaccProduction):
+    def p_expression_subtraction(self, p: YaccProduction):
         r"expression : expression ARITH_SUB expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_division(p: YaccProduction):
+    def p_expression_division(self, p: YaccProduction):
         r"expression : expression ARITH_DIV expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_multiplication(p: YaccProduction):
+    def p_expression_multiplication(self, p: YaccProduction):
         r"expression : expression ARITH_MUL expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_modulo(p: YaccProduction):
+    def p_expression_modulo(self, p: YaccProduction):
         r"expression : expression ARITH_MOD expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
@@ -1522,14 +2514,14 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         p.set_lineno(0, p.lineno(1))
 
     # It also works for array append
-    def p_expression_left_shift(p: YaccProduction):
+    def p_expression_left_shift(self, p: YaccProduction):
         r"expression : expression ARITH_LSHIFT expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_right_shift(p: YaccProduction):
+    def p_expression_right_shift(self, p: YaccProduction):
         r"expression : expression ARITH_RSHIFT expression"
         p[0] = Operation(
             p[1].line, p[1].col, p[3].end_line, p[3].end_col, (p[1], p[3]), p[2]
@@ -1537,11 +2529,11 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         p.set_lineno(0, p.lineno(1))
 
     ## Array Operations
-    def p_expression_splat(p: YaccProduction):
+    def p_expression_splat(self, p: YaccProduction):
         r"expression : ARITH_MUL expression %prec ARRAY_SPLAT"
         p[0] = Operation(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p[2].end_line,
             p[2].end_col,
             (p[2],),
@@ -1549,353 +2541,370 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         )
         p.set_lineno(0, p.lineno(1))
 
-    def p_expression_access(p: YaccProduction):
+    def p_expression_access(self, p: YaccProduction):
         r"expression : access"
         p[0] = p[1]
         p.set_lineno(0, p.lineno(1))
 
-    def p_access(p: YaccProduction):
+    def p_access(self, p: YaccProduction):
         r"access : expression LPARENR expressionlist RPARENR"
         p[0] = Operation(
             p[1].line,
             p[1].col,
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             (p[1],) + tuple(p[3]),
             p[2] + p[4],
         )
         p.set_lineno(0, p.lineno(1))
 
     ## Reference
-    def p_expression_reference(p: YaccProduction):
+    def p_expression_reference(self, p: YaccProduction):
         r"expression : reference"
         p[0] = p[1]
         p.set_lineno(0, p[1].line)
 
-    def p_reference(p: YaccProduction):
+    def p_reference(self, p: YaccProduction):
         r"reference : ID_TYPE LPARENR expressionlist RPARENR"
         p[0] = Reference(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             p[1],
             p[3],
         )
 
     # Function calls
-    def p_statement_function(p: YaccProduction):
+    def p_statement_function(self, p: YaccProduction):
         r"statement_function : key expressionlist"
+        if p[1].value not in statement_functions_class:
+            raise InvalidPuppetScript(f"Syntax error")
         if len(p[2]) > 0:
             p[0] = globals()[statement_functions_class[p[1].value]](
                 p[1].line, p[1].col, p[2][-1].end_line, p[2][-1].end_col, p[2]
             )
         else:
             p[0] = globals()[statement_functions_class[p[1].value]](
-                p[1].line, p[1].col, p[1].line, p[1].col + len(p[1]), p[2]
+                p[1].line, p[1].col, p[1].line, p[1].col + len(p[1].value), p[2]
             )
 
-    def p_statement_function_paren(p: YaccProduction):
+    def p_statement_function_paren(self, p: YaccProduction):
         r"statement_function : key LPAREN expressionlist RPAREN"
+        if p[1].value not in statement_functions_class:
+            raise InvalidPuppetScript(f"Syntax error")
         p[0] = globals()[statement_functions_class[p[1].value]](
-            p[1].line, p[1].col, p.lineno(4), find_column(script, p.lexpos(4)) + 1, p[3]
+            p[1].line, p[1].col, p.lineno(4), self._column(p.lexpos(4)) + 1, p[3]
         )
 
-    def p_function_call_prefix(p: YaccProduction):
+    def p_function_call_prefix(self, p: YaccProduction):
         r"function_call : ID LPAREN expressionlist RPAREN %prec NO_LAMBDA"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = FunctionCall(
             id.line,
-            id.col,
+            id.col,  # pyright: ignore[reportPrivateUsage]
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             id,
             p[3],
             None,
         )
 
-    def p_function_call_type(p: YaccProduction):
+    def p_function_call_type(self, p: YaccProduction):
         r"function_call : TYPE LPAREN expressionlist RPAREN %prec NO_LAMBDA"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = FunctionCall(
             id.line,
-            id.col,
+            id.col,  # pyright: ignore[reportPrivateUsage]
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             id,
             p[3],
             None,
         )
 
-    def p_function_call_id_type(p: YaccProduction):
+    def p_function_call_id_type(self, p: YaccProduction):
         r"function_call : ID_TYPE LPAREN expressionlist RPAREN %prec NO_LAMBDA"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = FunctionCall(
             id.line,
-            id.col,
+            id.col,  # pyright: ignore[reportPrivateUsage]
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             id,
             p[3],
             None,
         )
 
-    def p_function_call_prefix_lambda(p: YaccProduction):
+    def p_function_call_prefix_lambda(self, p: YaccProduction):
         r"function_call : ID LPAREN expressionlist RPAREN lambda %prec LAMBDA"
         id = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
         p[0] = FunctionCall(
             id.line,
-            id.col,
+            id.col,  # pyright: ignore[reportPrivateUsage]
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             id,
             p[3],
             p[5],
         )
 
-    def p_function_call_chained(p: YaccProduction):
+    def p_function_call_chained(self, p: YaccProduction):
         r"function_call : expression DOT ID %prec NO_LAMBDA"
         id = Id(
             p.lineno(3),
-            find_column(script, p.lexpos(3)),
+            self._column(p.lexpos(3)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + len(p[3]),
+            self._column(p.lexpos(3)) + len(p[3]),
             p[3],
         )
         p[0] = FunctionCall(
             id.line,
-            id.col,
+            id.col,  # pyright: ignore[reportPrivateUsage]
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + len(p[3]),
+            self._column(p.lexpos(3)) + len(p[3]),
             id,
             [p[1]],
             None,
         )
 
-    def p_function_call_chained_args(p: YaccProduction):
+    def p_function_call_chained_args(self, p: YaccProduction):
         r"function_call : expression DOT ID LPAREN expressionlist RPAREN %prec NO_LAMBDA"
         id = Id(
             p.lineno(3),
-            find_column(script, p.lexpos(3)),
+            self._column(p.lexpos(3)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + len(p[3]),
+            self._column(p.lexpos(3)) + len(p[3]),
             p[3],
         )
         p[0] = FunctionCall(
             id.line,
-            id.col,
+            id.col,  # pyright: ignore[reportPrivateUsage]
             p.lineno(6),
-            find_column(script, p.lexpos(6)) + 1,
+            self._column(p.lexpos(6)) + 1,
             id,
             [p[1]] + p[5],
             None,
         )
 
-    def p_function_call_chained_lambda(p: YaccProduction):
+    def p_function_call_chained_lambda(self, p: YaccProduction):
         r"function_call : expression DOT ID lambda %prec LAMBDA"
         id = Id(
             p.lineno(3),
-            find_column(script, p.lexpos(3)),
+            self._column(p.lexpos(3)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + len(p[3]),
+            self._column(p.lexpos(3)) + len(p[3]),
             p[3],
         )
         p[0] = FunctionCall(
-            id.line, id.col, p[4].end_line, p[4].end_col, id, [p[1]], p[4]
+            id.line,
+            id.col,  # pyright: ignore[reportPrivateUsage]
+            p[4].end_line,
+            p[4].end_col,
+            id,
+            [p[1]],
+            p[4],
         )
 
-    def p_function_call_chained_lambda_args(p: YaccProduction):
+    def p_function_call_chained_lambda_args(self, p: YaccProduction):
         r"function_call : expression DOT ID LPAREN expressionlist RPAREN lambda %prec LAMBDA"
         id = Id(
             p.lineno(3),
-            find_column(script, p.lexpos(3)),
+            self._column(p.lexpos(3)),
             p.lineno(3),
-            find_column(script, p.lexpos(3)) + len(p[3]),
+            self._column(p.lexpos(3)) + len(p[3]),
             p[3],
         )
         p[0] = FunctionCall(
-            id.line, id.col, p[7].end_line, p[7].end_col, id, [p[1]] + p[5], p[7]
+            id.line,
+            id.col,  # pyright: ignore[reportPrivateUsage]
+            p[7].end_line,
+            p[7].end_col,
+            id,
+            [p[1]] + p[5],
+            p[7],
         )
 
-    def p_lambda(p: YaccProduction):
+    def p_lambda(self, p: YaccProduction):
         r"lambda : BAR parameters BAR LBRACKET block RBRACKET"
         p[0] = Lambda(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(6),
-            find_column(script, p.lexpos(6)) + 1,
+            self._column(p.lexpos(6)) + 1,
             p[2],
             p[5],
         )
 
-    def p_sensitive(p: YaccProduction):
+    def p_sensitive(self, p: YaccProduction):
         r"function_call : SENSITIVE LPAREN STRING RPAREN"
         p[0] = FunctionCall(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             p[1],
             [p[3]],
             None,
         )
 
-    def p_sensitive_id(p: YaccProduction):
+    def p_sensitive_id(self, p: YaccProduction):
         r"function_call : SENSITIVE DOT ID LPAREN STRING RPAREN"
         p[0] = FunctionCall(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(6),
-            find_column(script, p.lexpos(6)) + 1,
+            self._column(p.lexpos(6)) + 1,
             p[1],
             [p[5]],
             None,
         )
 
     # Chaining arrows
-    def p_chaining_left(p: YaccProduction):
+    def p_chaining_left(self, p: YaccProduction):
         "chaining : chaining_value CHAINING_LEFT chaining_value"
         p[0] = Chaining(p[1], p[3], p[2])
 
-    def p_chaining_right(p: YaccProduction):
+    def p_chaining_right(self, p: YaccProduction):
         "chaining : chaining_value CHAINING_RIGHT chaining_value"
         p[0] = Chaining(p[1], p[3], p[2])
 
-    def p_chaining_value(p: YaccProduction):
+    def p_chaining_value(self, p: YaccProduction):
         "chaining_value : chaining"
         p[0] = p[1]
 
-    def p_chaining_value_array(p: YaccProduction):
+    def p_chaining_value_array(self, p: YaccProduction):
         "chaining_value : referencelist"
         if len(p[1]) == 1:
             p[0] = p[1][0]
         else:
             p[0] = p[1]
 
-    def p_chaining_value_resource(p: YaccProduction):
+    def p_chaining_value_resource(self, p: YaccProduction):
         "chaining_value : resource"
         p[0] = p[1]
 
-    def p_chaining_value_class(p: YaccProduction):
+    def p_chaining_value_class(self, p: YaccProduction):
         "chaining_value : class"
         p[0] = p[1]
 
-    def p_chaining_value_case(p: YaccProduction):
+    def p_chaining_value_case(self, p: YaccProduction):
         "chaining_value : case"
         p[0] = p[1]
 
-    def p_chaining_value_id(p: YaccProduction):
+    def p_chaining_value_id(self, p: YaccProduction):
         "chaining_value : value"
         p[0] = p[1]
 
-    def p_chaining_value_collector(p: YaccProduction):
+    def p_chaining_value_collector(self, p: YaccProduction):
         "chaining_value : resource_collector"
         p[0] = p[1]
 
-    def p_referencelist(p: YaccProduction):
-        r"referencelist : reference COMMA referencelist"
-        p[0] = [p[1]] + p[3]
+    def p_referencelist(self, p: YaccProduction):
+        r"referencelist : referencelist COMMA reference"
+        p[1].append(p[3])
+        p[0] = p[1]
 
-    def p_referencelist_single(p: YaccProduction):
+    def p_referencelist_single(self, p: YaccProduction):
         r"referencelist : reference"
         p[0] = [p[1]]
 
     ### Statements ###
     # The statements are here because they need to be below the expressions
     # in order to have the correct behaviour when solving the reduce/reduce conflicts
-    def p_statement_func(p: YaccProduction):
+    def p_statement_func(self, p: YaccProduction):
         r"statement : function"
         p[0] = p[1]
 
-    def p_statement_function_call(p: YaccProduction):
+    def p_statement_function_call(self, p: YaccProduction):
         r"statement : function_call"
         p[0] = p[1]
 
-    def p_statement_assignment(p: YaccProduction):
+    def p_statement_assignment(self, p: YaccProduction):
         r"statement : assignment"
         p[0] = p[1]
 
-    def p_statement_node(p: YaccProduction):
+    def p_statement_node(self, p: YaccProduction):
         r"statement : node"
         p[0] = p[1]
 
-    def p_statement_resource(p: YaccProduction):
+    def p_statement_resource(self, p: YaccProduction):
         r"statement : resource"
         p[0] = p[1]
 
-    def p_statement_resource_collector(p: YaccProduction):
+    def p_statement_resource_collector(self, p: YaccProduction):
         r"statement : resource_collector"
         p[0] = p[1]
 
-    def p_statement_class(p: YaccProduction):
+    def p_statement_class(self, p: YaccProduction):
         r"statement : class"
         p[0] = p[1]
 
-    def p_statement_if(p: YaccProduction):
+    def p_statement_if(self, p: YaccProduction):
         r"statement : if"
         p[0] = p[1]
 
-    def p_statement_unless(p: YaccProduction):
+    def p_statement_unless(self, p: YaccProduction):
         r"statement : unless"
         p[0] = p[1]
 
-    def p_statement_case(p: YaccProduction):
+    def p_statement_case(self, p: YaccProduction):
         r"statement : case"
         p[0] = p[1]
 
-    def p_statement_chaining(p: YaccProduction):
+    def p_statement_chaining(self, p: YaccProduction):
         r"statement : chaining"
         p[0] = p[1]
 
-    def p_statement_statement_function_function(p: YaccProduction):
+    def p_statement_statement_function_function(self, p: YaccProduction):
         r"statement : statement_function"
         p[0] = p[1]
 
     # Function declaration
-    def p_function(p: YaccProduction):
+    def p_function(self, p: YaccProduction):
         r"function : FUNCTION ID LPAREN parameters RPAREN LBRACKET block RBRACKET"
         p[0] = Function(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(8),
-            find_column(script, p.lexpos(8)) + 1,
+            self._column(p.lexpos(8)) + 1,
             p[2],
             p[4],
             None,
             p[7],
         )
 
-    def p_function_return(p: YaccProduction):
+    def p_function_return(self, p: YaccProduction):
         r"function : FUNCTION ID LPAREN parameters RPAREN ARITH_RSHIFT data_type LBRACKET block RBRACKET"
         p[0] = Function(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(10),
-            find_column(script, p.lexpos(10)) + 1,
+            self._column(p.lexpos(10)) + 1,
             p[2],
             p[4],
             p[7],
@@ -1903,375 +2912,590 @@ def parse(script: str) -> Tuple[List[CodeElement], List[Comment]]:
         )
 
     # Conditional statements
-    def p_if(p: YaccProduction):
+    def p_if(self, p: YaccProduction):
         r"if : IF expression LBRACKET block RBRACKET"
         p[0] = If(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
             None,
         )
 
-    def p_if_elsif(p: YaccProduction):
+    def p_if_elsif(self, p: YaccProduction):
         r"if : IF expression LBRACKET block RBRACKET elsif"
         p[0] = If(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
             p[6],
         )
 
-    def p_elif(p: YaccProduction):
+    def p_elif(self, p: YaccProduction):
         r"elsif : ELSIF expression LBRACKET block RBRACKET"
         p[0] = If(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
             None,
         )
 
-    def p_elif_elif(p: YaccProduction):
+    def p_elif_elif(self, p: YaccProduction):
         r"elsif : ELSIF expression LBRACKET block RBRACKET elsif"
         p[0] = If(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
             p[6],
         )
 
-    def p_else(p: YaccProduction):
+    def p_else(self, p: YaccProduction):
         r"elsif : ELSE LBRACKET block RBRACKET"
         p[0] = If(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)) + 1,
+            self._column(p.lexpos(4)) + 1,
             None,
             p[3],
             None,
         )
 
-    def p_unless(p: YaccProduction):
+    def p_unless(self, p: YaccProduction):
         r"unless : UNLESS expression LBRACKET block RBRACKET"
         p[0] = Unless(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
             None,
         )
 
-    def p_unless_else(p: YaccProduction):
+    def p_unless_else(self, p: YaccProduction):
         r"unless : UNLESS expression LBRACKET block RBRACKET ELSE LBRACKET block RBRACKET"
         un_else = Unless(
             p.lineno(6),
-            find_column(script, p.lexpos(6)),
+            self._column(p.lexpos(6)),
             p.lineno(9),
-            find_column(script, p.lexpos(9)) + 1,
+            self._column(p.lexpos(9)) + 1,
             None,
             p[8],
             None,
         )
         p[0] = Unless(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
             un_else,
         )
 
-    def p_case(p: YaccProduction):
+    def p_case(self, p: YaccProduction):
         r"case : CASE expression LBRACKET matches RBRACKET"
         p[0] = Case(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[2],
             p[4],
         )
 
-    def p_matches(p: YaccProduction):
-        r"matches : match matches"
-        p[0] = [p[1]] + p[2]
+    def p_matches(self, p: YaccProduction):
+        r"matches : matches match"
+        p[1].append(p[2])
+        p[0] = p[1]
 
-    def p_matches_empty(p: YaccProduction):
+    def p_matches_empty(self, p: YaccProduction):
         r"matches : empty"
         p[0] = []
 
-    def p_match(p: YaccProduction):
+    def p_match(self, p: YaccProduction):
         r"match : expressionlist COLON LBRACKET block RBRACKET"
         p[0] = Match(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(5),
-            find_column(script, p.lexpos(5)) + 1,
+            self._column(p.lexpos(5)) + 1,
             p[1],
             p[4],
         )
 
     ### Data Type ###
-    def p_data_type(p: YaccProduction):
+    def p_data_type(self, p: YaccProduction):
         r"data_type : ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_data_type_reference(p: YaccProduction):
+    def p_data_type_reference(self, p: YaccProduction):
         r"data_type : reference"
         p[0] = p[1]
 
     ### Values ###
-    def p_value_hash(p: YaccProduction):
+    def p_value_hash(self, p: YaccProduction):
         r"value : hash"
         p[0] = p[1]
 
-    def p_value_array(p: YaccProduction):
+    def p_value_array(self, p: YaccProduction):
         r"value : array"
         p[0] = p[1]
 
-    def p_value_string(p: YaccProduction):
+    def p_value_string(self, p: YaccProduction):
         r"value : STRING"
         start_line = p.lineno(1)
         end_line = start_line + p[1].count("\n")
-        start_col = find_column(script, p.lexpos(1))
-        if start_line == end_line:
-            end_col = start_col + len(p[1].split("\n")[-1]) + 2
-        else:
-            end_col = len(p[1].split("\n")[-1]) + 2
+        start_col = self._column(p.lexpos(1))
+        # Column right after the closing quote
+        end_col = self._column(p.lexpos(1) + len(p[1]) + 2)
         p[0] = Value(start_line, start_col, end_line, end_col, p[1])
 
-    def p_value_string_docs(p: YaccProduction):
+    def p_value_string_docs(self, p: YaccProduction):
         r"value : AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(10),
-            find_column(script, p.lexpos(10)) + len(p[10]),
+            self._column(p.lexpos(10)) + len(p[10]),
             p[8],
         )
 
-    def p_value_string_docs_sub(p: YaccProduction):
+    def p_value_string_docs_sub(self, p: YaccProduction):
         r"value : AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(11),
-            find_column(script, p.lexpos(11)) + len(p[10]),
+            self._column(p.lexpos(11)) + len(p[10]),
             p[8],
         )
 
-    def p_value_string_docs_syntax(p: YaccProduction):
+    def p_value_string_docs_syntax(self, p: YaccProduction):
         r"value : AT LPAREN STRING COLON ID ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(12),
-            find_column(script, p.lexpos(12)) + len(p[10]),
+            self._column(p.lexpos(12)) + len(p[10]),
             p[10],
         )
 
-    def p_value_string_docs_syntax_sub(p: YaccProduction):
+    def p_value_string_docs_syntax_sub(self, p: YaccProduction):
         r"value : AT LPAREN STRING COLON ID ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(13),
-            find_column(script, p.lexpos(13)) + len(p[10]),
+            self._column(p.lexpos(13)) + len(p[10]),
             p[10],
         )
 
-    def p_value_string_docs_id(p: YaccProduction):
+    def p_value_string_docs_id(self, p: YaccProduction):
         r"value : AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(10),
-            find_column(script, p.lexpos(10)) + len(p[10]),
+            self._column(p.lexpos(10)) + len(p[10]),
             p[8],
         )
 
-    def p_value_string_docs_sub_id(p: YaccProduction):
+    def p_value_string_docs_sub_id(self, p: YaccProduction):
         r"value : AT LPAREN STRING ARITH_DIV ID RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(11),
-            find_column(script, p.lexpos(11)) + len(p[10]),
+            self._column(p.lexpos(11)) + len(p[10]),
             p[8],
         )
 
-    def p_value_string_docs_syntax_id(p: YaccProduction):
+    def p_value_string_docs_syntax_id(self, p: YaccProduction):
         r"value : AT LPAREN STRING COLON ID ARITH_DIV ID RPAREN start_docs STRING BAR ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(12),
-            find_column(script, p.lexpos(12)) + len(p[10]),
+            self._column(p.lexpos(12)) + len(p[10]),
             p[10],
         )
 
-    def p_value_string_docs_syntax_sub_id(p: YaccProduction):
+    def p_value_string_docs_syntax_sub_id(self, p: YaccProduction):
         r"value : AT LPAREN STRING COLON ID ARITH_DIV ID RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(13),
-            find_column(script, p.lexpos(13)) + len(p[10]),
+            self._column(p.lexpos(13)) + len(p[10]),
             p[10],
         )
 
-    def p_start_docs(p: YaccProduction):
+    def p_start_docs(self, p: YaccProduction):
         r"start_docs :"
-        lexer.begin("docs")
+        p.lexer.begin("docs")
 
-    def p_value_false(p: YaccProduction):
+    def p_value_false(self, p: YaccProduction):
         r"value : FALSE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             False,
         )
 
-    def p_value_true(p: YaccProduction):
+    def p_value_true(self, p: YaccProduction):
         r"value : TRUE"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             True,
         )
 
-    def p_value_integer(p: YaccProduction):
+    def p_value_integer(self, p: YaccProduction):
         r"value : INTEGER"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(str(p[1])),
+            self._column(p.lexpos(1)) + len(str(p[1])),
             int(p[1]),
         )
 
-    def p_value_hexa_integer(p: YaccProduction):
+    def p_value_hexa_integer(self, p: YaccProduction):
         r"value : HEXA_INTEGER"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(str(p[1])),
+            self._column(p.lexpos(1)) + len(str(p[1])),
             int(p[1], 16),
         )
 
-    def p_value_oct_integer(p: YaccProduction):
+    def p_value_oct_integer(self, p: YaccProduction):
         r"value : OCT_INTEGER"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(str(p[1])),
+            self._column(p.lexpos(1)) + len(str(p[1])),
             int(p[1], 8),
         )
 
-    def p_value_float(p: YaccProduction):
+    def p_value_float(self, p: YaccProduction):
         r"value : FLOAT"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(str(p[1])),
+            self._column(p.lexpos(1)) + len(str(p[1])),
             float(p[1]),
         )
 
-    def p_value_id(p: YaccProduction):
+    def p_value_id(self, p: YaccProduction):
         r"value : ID"
         p[0] = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_value_type_id(p: YaccProduction):
+    def p_value_type_id(self, p: YaccProduction):
         r"value : ID_TYPE"
         p[0] = Id(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             p[1],
         )
 
-    def p_value_undef(p: YaccProduction):
+    def p_value_undef(self, p: YaccProduction):
         r"value : UNDEF"
         p[0] = Value(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(1),
-            find_column(script, p.lexpos(1)) + len(p[1]),
+            self._column(p.lexpos(1)) + len(p[1]),
             None,
         )
 
-    def p_value_stat_func(p: YaccProduction):
+    def p_value_stat_func(self, p: YaccProduction):
         r"value : key"
         p[0] = p[1]
 
-    def p_value_regex(p: YaccProduction):
+    def p_value_regex(self, p: YaccProduction):
         r"value : regex"
         p[0] = p[1]
 
-    def p_regex(p: YaccProduction):
+    def p_regex(self, p: YaccProduction):
         r"regex : ARITH_DIV start_regex REGEXPRESSION ARITH_DIV"
         p[0] = Regex(
             p.lineno(1),
-            find_column(script, p.lexpos(1)),
+            self._column(p.lexpos(1)),
             p.lineno(4),
-            find_column(script, p.lexpos(4)),
+            self._column(p.lexpos(4)),
             p[3],
         )
 
-    # Needs to be declared here to be used by this function
-    lexer = lexer.clone()
-
-    def p_start_regex(p: YaccProduction):
+    def p_start_regex(self, p: YaccProduction):
         r"start_regex :"
-        lexer.begin("regex")
+        p.lexer.begin("regex")
 
-    def p_empty(p: YaccProduction):
+    def p_empty(self, p: YaccProduction):
         r"empty :"
 
-    def p_error(p: YaccProduction):
-        raise InvalidPuppetScript(f"Syntax error {p}")
+    def p_error(self, p: LexToken | None):
+        ctx = self._ctx
+        if ctx.errors is None:
+            raise InvalidPuppetScript(f"Syntax error {p}")
+        parser = self._parser
+        if p is None:
+            end = len(ctx.script)
+            ctx.error("Syntax error at end of script", end, ctx.lines.line(end))
+            self._give_up()
+            return
+        if p is not ctx.resync:
+            ctx.error(f"Syntax error {p}", p.lexpos, p.lineno)
+
+        # The stack is popped down to the innermost list of statements, and
+        # the unclosed brackets are counted on the symbols that are popped
+        states, symbols = parser.statestack, parser.symstack
+        top = len(states) - 1
+        while top > 0 and "error" not in parser.action[states[top]]:
+            top -= 1
+        depth = 0
+        for symbol in symbols[top + 1 :]:
+            if symbol.type in _OPENING:
+                depth += 1
+            elif symbol.type in _CLOSING:
+                depth -= 1
+        # PLY would pop the states one by one, and a state that reduces an
+        # empty rule by default would be entered again and again. The state
+        # above is left for PLY to pop, as it does not accept errors.
+        del states[top + 2 :]
+        del symbols[top + 2 :]
+
+        # Skip to the next top-level keyword or closing brace, or past the
+        # brace that closes the statement. Top-level keywords cannot be in an
+        # expression, so they end unclosed brackets too.
+        lexer = p.lexer
+        previous = symbols[-1].type
+        heredoc = False
+        state = lexer.current_state()
+        t = p
+        if p is ctx.resync:
+            # Resuming there failed, and after a closing bracket, resuming
+            # right after it is the next best place
+            closing = p.type in _CLOSING
+            previous = p.type
+            t = parser.token()
+            if closing:
+                depth = -1
+        while depth >= 0 and t is not None:
+            if state == "INITIAL":
+                heredoc = _switch_state(lexer, t.type, previous, heredoc)
+            previous = t.type
+            if t.type in _CLOSING:
+                depth -= 1
+                if depth < 0:
+                    break
+                if depth == 0 and t.type == "RBRACKET":
+                    t = parser.token()
+                    break
+            elif t.type in _OPENING:
+                depth += 1
+            elif t.type in _STATEMENT_KEYWORDS:
+                break
+            state = lexer.current_state()
+            t = parser.token()
+
+        if t is None:
+            self._give_up()
+            p.type = "$end"
+            return
+        # PLY resumes with the token it was given, so it becomes the one
+        # parsing resumes at
+        p.type, p.value, p.lineno, p.lexpos = t.type, t.value, t.lineno, t.lexpos
+        ctx.resync = p
+
+    def _give_up(self) -> None:
+        # The parse ends without a result, keep the top-level statements
+        symbols = self._parser.symstack
+        if len(symbols) > 1 and symbols[1].type == "statements":
+            self._ctx.partial = symbols[1].value
+
+
+def _resume_on_errors(parser: Any) -> None:
+    """Only accept errors where a list of statements can go on.
+
+    The grammar is loose enough that other reductions on an error could build
+    elements from symbols that do not fit them. Without their error actions,
+    those states are popped instead. Parses that raise on errors never see
+    an error token, so they are not affected.
+    """
+    productions, goto = parser.productions, parser.goto
+    for state, actions in parser.action.items():
+        action = actions.get("error")
+        if action is None or action > 0:
+            continue
+        name = productions[-action].name
+        if name == "empty":
+            # Only as the start of a list of statements
+            after = parser.action[goto[state]["empty"]].get("error", 0)
+            if after < 0 and productions[-after].name == "statements":
+                continue
+        elif name in ("statement", "statements"):
+            continue
+        del actions["error"]
+
+
+def grammar_signature(parser: Parser) -> str:
+    """Return the signature PLY records in the parse tables for ``parser``."""
+    pdict = {name: getattr(parser, name) for name in dir(parser)}
+    pdict["__file__"] = __file__
+    pinfo = ParserReflect(pdict, log=NullLogger())
+    pinfo.get_all()
+    return pinfo.signature()
+
+
+def tables_cache_dir() -> str:
+    """Per-user directory where regenerated parse tables are kept."""
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache, "puppetparser")
+
+
+def _import_tables(path: str) -> ModuleType | None:
+    spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+    if spec is None or spec.loader is None or not os.path.exists(path):
+        return None
+    tables = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(tables)
+    except Exception:
+        return None
+    return tables
+
+
+def _load_tables(parser: Parser, signature: str, grammar_hash: str) -> Any:
+    # The tables shipped with the package are tried first. When they do not
+    # match the grammar, the per-user cache is used, and the tables are
+    # generated into it if needed. Files are written to a private temporary
+    # directory and then renamed, so concurrent processes never read a
+    # partially written module.
+    try:
+        tables = importlib.import_module(TABLES_MODULE)
+    except ImportError:
+        tables = None
+    if tables is None or getattr(tables, "_lr_signature", None) != signature:
+        name = f"parsetab_{grammar_hash}"
+        path = os.path.join(tables_cache_dir(), name + ".py")
+        tables = _import_tables(path)
+        if tables is None or getattr(tables, "_lr_signature", None) != signature:
+            return _generate_tables(parser, name, path)
+    return yacc(module=parser, tabmodule=tables, debug=False, write_tables=False)
+
+
+def _generate_tables(parser: Parser, name: str, path: str) -> Any:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        outputdir = tempfile.mkdtemp(dir=os.path.dirname(path))
+    except OSError:
+        return yacc(module=parser, debug=False, write_tables=False)
+
+    try:
+        result = yacc(module=parser, debug=False, tabmodule=name, outputdir=outputdir)
+        try:
+            os.replace(os.path.join(outputdir, name + ".py"), path)
+        except OSError:
+            pass
+    finally:
+        shutil.rmtree(outputdir, ignore_errors=True)
+    return result
+
+
+_parser: Parser | None = None
+
+
+@overload
+def parse(
+    script: str,
+    representation: Literal["objects"] = ...,
+    share_leaves: bool = ...,
+    lexer: str = ...,
+    limits: ParseLimits | None = ...,
+    errors: List[ParseError] | None = ...,
+) -> Tuple[List[CodeElement], List[Comment]]:
+    ...
+
+
+@overload
+def parse(
+    script: str,
+    representation: Literal["arena"],
+    share_leaves: bool = ...,
+    lexer: str = ...,
+    limits: ParseLimits | None = ...,
+    errors: List[ParseError] | None = ...,
+) -> Tuple[Arena, List[Comment]]:
+    ...
+
+
+def parse(
+    script: str,
+    representation: str = "objects",
+    share_leaves: bool = False,
+    lexer: str = "scanner",
+    limits: ParseLimits | None = None,
+    errors: List[ParseError] | None = None,
+) -> Tuple[List[CodeElement] | Arena, List[Comment]]:
+    global _parser
+    if _parser is None:
+        _parser = Parser()
+    return _parser.parse(
+        script,
+        representation,  # type: ignore
+        share_leaves,
+        lexer,
+        limits,
+        errors,
+    )
+
+
+def tokenize(script: str, lexer: str = "scanner") -> Iterator[Token]:
+    global _parser
+    if _parser is None:
+        _parser = Parser()
+    return _parser.tokenize(script, lexer)
 
-    # Build the parser
-    parsedir = os.path.dirname(pf.__file__)
-    # By default, store generated parse files with the code
-    # If we don't have write permission, put them in the configured tempdir
-    if not os.access(parsedir, os.W_OK):
-        parsedir = tempfile.gettempdir()
 
-    parser = yacc(debug=False, outputdir=parsedir)
-    return parser.parse(script, lexer=lexer), comments
+def iparse(script: str, lexer: str = "scanner") -> Iterator[CodeElement]:
+    global _parser
+    if _parser is None:
+        _parser = Parser()
+    return _parser.iparse(script, lexer)
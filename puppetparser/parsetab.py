@@ -0,0 +1,239 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programnonassocNO_LAMBDAnonassocLAMBDArightCHAINING_RIGHTrightCHAINING_LEFTleftEQUALleftQUESTION_MARKleftDOTleftBOOL_ORleftBOOL_ANDnonassocCMP_LESS_THANCMP_GREATER_THANCMP_LESS_THAN_OR_EQUALCMP_GREATER_THAN_OR_EQUALnonassocCMP_EQUALCMP_NOT_EQUALleftARITH_LSHIFTARITH_RSHIFTleftARITH_ADDARITH_SUBleftARITH_MULARITH_DIVARITH_MODleftCMP_REGEX_MATCHCMP_REGEX_NOT_MATCHleftCMP_INrightARRAY_SPLATrightARITH_MINUSrightBOOL_NOTrightLPARENRleftLPARENleftBARAPPLICATION ARITH_ADD ARITH_DIV ARITH_LSHIFT ARITH_MOD ARITH_MUL ARITH_RSHIFT ARITH_SUB AT ATTR BAR BOOL_AND BOOL_NOT BOOL_OR CASE CHAINING_LEFT CHAINING_RIGHT CLASS CMP_EQUAL CMP_GREATER_THAN CMP_GREATER_THAN_OR_EQUAL CMP_IN CMP_LESS_THAN CMP_LESS_THAN_OR_EQUAL CMP_NOT_EQUAL CMP_REGEX_MATCH CMP_REGEX_NOT_MATCH COLON COMMA COMPONENT CONSUMES CONTAIN DEBUG DEFAULT DEFINE DOT DOT_COMMA ELSE ELSIF EQUAL ERR FAIL FALSE FLOAT FUNCTION HASH_ROCKET HEXA_INTEGER ID ID_TYPE IF IMPORT IN INCLUDE INFO INHERITS INTEGER LANGLEBRACKET LBRACKET LPAREN LPARENR NODE NOTICE OCT_INTEGER PLUSIGNMENT PRODUCES QUESTION_MARK RANGLEBRACKET RBRACKET REALIZE REGEXP REGEXPRESSION REQUIRE RPAREN RPARENR SENSITIVE SITE STRING TAG TRUE TYPE UNDEF UNLESS WARNINGprogram : blockclass : CLASS class_header LBRACKET block RBRACKETclass_header : ID LPAREN parameters RPARENclass_header : IDclass_header : ID LPAREN parameters RPAREN INHERITS IDclass_header : ID INHERITS IDclass : CLASS LBRACKET resource_list RBRACKETnode : NODE STRING LBRACKET block RBRACKETnode : NODE ID LBRACKET block RBRACKETnode : NODE regex LBRACKET block RBRACKETnode : NODE DEFAULT LBRACKET block RBRACKETassignment : ID EQUAL expressionassignment : access EQUAL expressionassignment : array EQUAL arrayassignment : array EQUAL hashassignment : TYPE ID_TYPE EQUAL expressionblock : statementsblock : statements expressionstatements : statements statementstatements : emptystatements : statements errorresource : ID LBRACKET resource_list RBRACKETresource : key LBRACKET resource_list RBRACKETresource_list : resource_list_itemsresource_list : resource_list_items DOT_COMMAresource_list : emptyresource_list_items : resource_list_items DOT_COMMA resource_bodyresource_list_items : resource_bodyresource_body : expression COLON attributesresource : AT ID LBRACKET resource_list RBRACKETresource : AT AT ID LBRACKET resource_list RBRACKETresource : reference LBRACKET expression COLON attributes RBRACKETresource : reference LBRACKET attributes RBRACKETresource : resource_collector LBRACKET attributes RBRACKETresource : ID_TYPE LBRACKET attributes RBRACKETresource : DEFINE ID LPAREN parameters RPAREN LBRACKET block RBRACKETresource : DEFINE ID LBRACKET block RBRACKETresource_collector : ID_TYPE LANGLEBRACKET rc_expression RANGLEBRACKETresource_collector : ID_TYPE LANGLEBRACKET RANGLEBRACKETrc_expression : rc_expression CMP_EQUAL rc_expressionrc_expression : rc_expression CMP_NOT_EQUAL rc_expressionrc_expression : rc_expression BOOL_AND rc_expressionrc_expression : rc_expression BOOL_OR rc_expressionrc_expression : LPAREN rc_expression RPARENrc_expression : expressionparameters : parameters_itemsparameters : parameters_items COMMAparameters : emptyparameters_items : parameters_items COMMA parameterparameters_items : parameterparameter : data_type ID EQUAL expressionparameter : data_type IDparameter : IDparameter : ID EQUAL expressionparameter : ID ARITH_MUL ID EQUAL expressionparameter : ID ARITH_MUL IDparameter : ARITH_MUL IDparameter : ARITH_MUL ID EQUAL expressionattributes : attributes_itemsattributes : attributes_items COMMAattributes : emptyattributes_items : attributes_items COMMA attributeattributes_items : attributeattribute : ID HASH_ROCKET expressionattribute : key HASH_ROCKET expressionattribute : ARITH_MUL HASH_ROCKET expressionattribute : ID PLUSIGNMENT expressionattribute : key PLUSIGNMENT expressionattribute : ARITH_MUL PLUSIGNMENT expressionkey : DEFAULTkey : NODEkey : SITEkey : IMPORTkey : UNLESSkey : TYPEkey : INCLUDEkey : REQUIREkey : CONTAINkey : TAGkey : DEBUGkey : INFOkey : NOTICEkey : WARNINGkey : ERRkey : FAILkey : REALIZEarray : LPARENR expressionlist RPARENRhash : LBRACKET keyvalue_pairs RBRACKETkeyvalue_pairs : keyvalue_pairs_itemskeyvalue_pairs : keyvalue_pairs_items COMMAkeyvalue_pairs : emptykeyvalue_pairs_items : keyvalue_pairs_items COMMA keyvaluekeyvalue_pairs_items : keyvaluekeyvalue : expression HASH_ROCKET expressionkeyvalue : key HASH_ROCKET expressionexpressionlist : expressionlist_itemsexpressionlist : expressionlist_items COMMAexpressionlist : emptyexpressionlist_items : expressionlist_items COMMA expressionexpressionlist_items : expressionexpression : valueexpression : function_callexpression : statement_functionexpression : LPAREN expression RPARENexpression : assignmentexpression : expression LPARENR INTEGER COMMA INTEGER RPARENRexpression : expression QUESTION_MARK hashexpression : expression CMP_EQUAL expressionexpression : expression CMP_NOT_EQUAL expressionexpression : expression CMP_LESS_THAN expressionexpression : expression CMP_GREATER_THAN expressionexpression : expression CMP_LESS_THAN_OR_EQUAL expressionexpression : expression CMP_GREATER_THAN_OR_EQUAL expressionexpression : expression CMP_REGEX_MATCH expressionexpression : expression CMP_REGEX_NOT_MATCH expressionexpression : expression CMP_IN expressionexpression : expression BOOL_AND expressionexpression : expression BOOL_OR expressionexpression : BOOL_NOT expressionexpression : ARITH_SUB expression %prec ARITH_MINUSexpression : expression ARITH_ADD expressionexpression : expression ARITH_SUB expressionexpression : expression ARITH_DIV expressionexpression : expression ARITH_MUL expressionexpression : expression ARITH_MOD expressionexpression : expression ARITH_LSHIFT expressionexpression : expression ARITH_RSHIFT expressionexpression : ARITH_MUL expression %prec ARRAY_SPLATexpression : accessaccess : expression LPARENR expressionlist RPARENRexpression : referencereference : ID_TYPE LPARENR expressionlist RPARENRstatement_function : key expressionliststatement_function : key LPAREN expressionlist RPARENfunction_call : ID LPAREN expressionlist RPAREN %prec NO_LAMBDAfunction_call : TYPE LPAREN expressionlist RPAREN %prec NO_LAMBDAfunction_call : ID_TYPE LPAREN expressionlist RPAREN %prec NO_LAMBDAfunction_call : ID LPAREN expressionlist RPAREN lambda %prec LAMBDAfunction_call : expression DOT ID %prec NO_LAMBDAfunction_call : expression DOT ID LPAREN expressionlist RPAREN %prec NO_LAMBDAfunction_call : expression DOT ID lambda %prec LAMBDAfunction_call : expression DOT ID LPAREN expressionlist RPAREN lambda %prec LAMBDAlambda : BAR parameters BAR LBRACKET block RBRACKETfunction_call : SENSITIVE LPAREN STRING RPARENfunction_call : SENSITIVE DOT ID LPAREN STRING RPARENchaining : chaining_value CHAINING_LEFT chaining_valuechaining : chaining_value CHAINING_RIGHT chaining_valuechaining_value : chainingchaining_value : referencelistchaining_value : resourcechaining_value : classchaining_value : casechaining_value : valuechaining_value : resource_collectorreferencelist : referencelist COMMA referencereferencelist : referencestatement : functionstatement : function_callstatement : assignmentstatement : nodestatement : resourcestatement : resource_collectorstatement : classstatement : ifstatement : unlessstatement : casestatement : chainingstatement : statement_functionfunction : FUNCTION ID LPAREN parameters RPAREN LBRACKET block RBRACKETfunction : FUNCTION ID LPAREN parameters RPAREN ARITH_RSHIFT data_type LBRACKET block RBRACKETif : IF expression LBRACKET block RBRACKETif : IF expression LBRACKET block RBRACKET elsifelsif : ELSIF expression LBRACKET block RBRACKETelsif : ELSIF expression LBRACKET block RBRACKET elsifelsif : ELSE LBRACKET block RBRACKETunless : UNLESS expression LBRACKET block RBRACKETunless : UNLESS expression LBRACKET block RBRACKET ELSE LBRACKET block RBRACKETcase : CASE expression LBRACKET matches RBRACKETmatches : matches matchmatches : emptymatch : expressionlist COLON LBRACKET block RBRACKETdata_type : ID_TYPEdata_type : referencevalue : hashvalue : arrayvalue : STRINGvalue : AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID_TYPEvalue : AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ARITH_SUB ID_TYPEvalue : AT LPAREN STRING COLON ID ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID_TYPEvalue : AT LPAREN STRING COLON ID ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ARITH_SUB ID_TYPEvalue : AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR IDvalue : AT LPAREN STRING ARITH_DIV ID RPAREN start_docs STRING BAR ARITH_SUB ID_TYPEvalue : AT LPAREN STRING COLON ID ARITH_DIV ID RPAREN start_docs STRING BAR ID_TYPEvalue : AT LPAREN STRING COLON ID ARITH_DIV ID RPAREN start_docs STRING BAR ARITH_SUB ID_TYPEstart_docs :value : FALSEvalue : TRUEvalue : INTEGERvalue : HEXA_INTEGERvalue : OCT_INTEGERvalue : FLOATvalue : IDvalue : ID_TYPEvalue : UNDEFvalue : keyvalue : regexregex : ARITH_DIV start_regex REGEXPRESSION ARITH_DIVstart_regex :empty :'
+    
+_lr_action_items = {'error':([0,3,4,6,7,9,10,12,14,15,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,193,194,195,203,207,223,227,228,229,230,232,233,237,238,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,264,272,277,278,279,280,287,288,291,292,293,294,295,316,339,345,355,356,357,358,360,361,363,364,365,368,369,371,372,376,379,384,386,391,392,405,406,407,414,415,416,417,421,428,429,431,433,437,438,439,440,443,444,446,448,449,],[-209,7,-20,-19,-21,-158,-168,-159,-198,-184,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,-209,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-75,-14,-15,-39,-12,-88,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-33,-34,-137,-132,-35,-38,-135,-22,-134,-23,-136,-16,-144,-7,-30,-138,-8,-9,-10,-11,-37,-2,-171,-176,-178,-106,-140,-32,-31,-145,-209,-209,-172,-142,-209,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'LPAREN':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,97,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,132,138,139,144,146,147,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,186,187,193,194,195,198,203,204,207,219,221,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,11,-20,-19,-21,-158,-168,11,-159,11,-198,-184,11,11,11,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,116,118,122,-196,-197,-199,-200,-201,-204,126,-206,128,130,11,-71,-70,11,11,11,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-101,-102,-103,-105,-131,116,118,122,126,-71,-74,-96,-98,-100,-119,-120,-128,11,11,11,11,204,11,11,11,-133,11,11,11,222,126,128,231,11,235,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,258,-104,-87,11,-13,11,122,126,-75,-14,-15,11,-39,204,-12,11,296,-88,11,11,11,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,116,-203,-185,-147,-155,-130,11,-141,-99,-207,-33,11,11,11,11,11,11,-34,11,-137,-132,-35,-38,204,204,204,204,-135,-22,11,-134,-23,-136,-16,-144,-7,11,-180,11,-30,-138,11,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,11,11,-209,-172,11,-142,-209,11,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'BOOL_NOT':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,16,-20,-19,-21,-158,-168,16,-159,16,-198,-184,16,16,16,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,16,-206,-75,16,-71,-70,16,16,16,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-101,-102,-103,-105,-131,-203,-202,16,-71,-74,-96,-98,-100,-119,-120,-128,16,16,16,16,16,16,16,16,-133,16,16,16,16,-75,16,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,16,-13,16,16,-75,-14,-15,16,-39,16,-12,16,-88,16,16,16,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,16,-141,-99,-207,-33,16,16,16,16,16,16,-34,16,-137,-132,-35,-38,16,16,16,16,-135,-22,16,-134,-23,-136,-16,-144,-7,16,-180,16,-30,-138,16,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,16,16,-209,-172,16,-142,-209,16,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'ARITH_SUB':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,137,138,139,146,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,186,187,193,194,195,198,203,204,205,207,212,214,217,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,286,287,288,289,291,292,293,294,295,307,308,316,321,322,323,328,329,331,332,333,334,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,377,379,381,383,384,386,387,391,392,397,400,401,404,405,406,407,413,414,415,416,417,421,422,423,428,429,430,431,433,437,438,439,440,441,442,443,444,446,448,449,],[-209,17,-20,84,-19,-21,-101,-102,-103,17,-105,17,-198,-184,17,17,17,-129,-131,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,17,-206,-75,17,-71,-70,17,17,17,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,84,-101,-102,-103,-105,-131,-203,-202,17,-71,-74,-96,-98,84,-119,-120,-128,17,17,17,17,17,17,17,17,-133,17,17,17,84,17,-75,17,84,84,84,-198,-107,84,84,84,84,84,84,-114,-115,-116,84,84,-121,-122,-123,-124,-125,84,84,-139,-104,-87,17,84,84,17,-202,17,-75,-14,-15,17,-39,17,84,84,84,84,84,17,-88,17,17,17,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,17,-141,84,-207,-33,17,17,17,17,17,17,-34,17,-137,-132,-35,-38,17,17,17,17,84,-135,-22,17,-134,-23,-136,84,-144,84,84,-7,17,-180,17,84,84,84,84,84,84,-30,-138,17,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,84,-209,17,17,-209,-172,17,-142,-209,17,84,84,84,-209,-209,-209,84,-169,-209,-36,-209,-143,432,434,-175,-177,-181,-187,-191,-170,-173,-188,-192,445,447,-174,-193,-189,-194,-190,]),'ARITH_MUL':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,137,138,139,146,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,186,187,193,194,195,198,203,204,205,207,212,214,217,219,222,223,224,225,226,227,228,229,230,231,232,233,235,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,286,287,288,289,290,291,292,293,294,295,297,307,308,316,321,322,323,328,329,331,332,333,334,339,345,349,353,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,377,379,381,383,384,386,387,391,392,397,400,401,404,405,406,407,413,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,19,-20,86,-19,-21,-101,-102,-103,19,-105,19,-198,-184,19,19,19,-129,-131,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,19,-206,-75,19,-71,-70,19,19,19,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,86,-101,-102,-103,-105,-131,-203,-202,19,-71,-74,-96,-98,86,-119,-120,-128,19,183,192,19,19,192,19,19,19,19,-133,19,19,19,86,19,-75,19,86,86,86,-198,-107,86,86,86,86,86,86,-114,-115,-116,86,86,86,86,-123,-124,-125,86,86,-139,-104,-87,19,86,86,19,-202,19,-75,-14,-15,19,-39,19,86,86,86,86,86,19,303,-88,19,19,19,-209,-209,-209,-209,303,-209,-209,303,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,19,-141,303,86,-207,192,-33,19,19,192,19,19,19,19,-34,19,-137,-132,-35,-38,19,19,19,19,86,-135,-22,19,192,-134,-23,-136,86,-144,350,86,86,-7,19,-180,19,86,86,86,86,86,86,-30,-138,19,303,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,86,-209,19,19,-209,-172,19,-142,-209,19,86,86,86,-209,-209,-209,86,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'STRING':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,116,118,119,121,122,123,124,125,126,127,128,130,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,296,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,373,374,376,379,381,383,384,386,387,391,392,393,394,397,405,406,407,411,412,414,415,416,417,421,424,425,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,32,-20,-19,-21,-158,-168,32,-159,32,-198,-184,32,32,32,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,32,-206,-75,32,140,-70,32,32,32,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-101,-102,-103,-105,-131,-203,-202,32,-71,-74,-96,-98,-100,-119,-120,-128,32,32,197,32,32,32,32,32,32,-133,32,32,32,220,32,-75,32,32,32,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,32,-13,32,32,-75,-14,-15,32,-39,32,-12,32,-88,32,32,32,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,32,-141,-99,-207,-33,32,32,32,32,32,32,-34,32,-137,-132,-35,-38,32,32,32,32,-135,-22,32,-134,-23,-136,-16,-144,348,-7,32,-180,32,-30,-138,32,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-195,-195,-145,-209,32,32,-209,-172,32,-142,-209,409,410,32,-209,-209,-209,-195,-195,-169,-209,-36,-209,-143,435,436,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'AT':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,33,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,33,-20,-19,-21,-158,-168,97,-159,97,-198,-184,97,97,97,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,115,-196,-197,-199,-200,-201,-204,97,-206,-75,97,-71,-70,97,97,97,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-101,-102,-103,-105,-131,-203,-202,97,-71,-74,-96,-98,-100,-119,-120,-128,97,97,97,97,97,97,97,97,-133,97,97,97,97,-75,97,250,250,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,97,-13,97,97,-75,-14,-15,97,-39,97,-12,97,-88,97,97,97,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,115,-203,-185,-147,-155,-130,97,-141,-99,-207,-33,97,97,97,97,97,97,-34,97,-137,-132,-35,-38,97,97,97,97,-135,-22,97,-134,-23,-136,-16,-144,-7,97,-180,97,-30,-138,97,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,97,97,-209,-172,97,-142,-209,97,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'FALSE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,36,-20,-19,-21,-158,-168,36,-159,36,-198,-184,36,36,36,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,36,-206,-75,36,-71,-70,36,36,36,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-101,-102,-103,-105,-131,-203,-202,36,-71,-74,-96,-98,-100,-119,-120,-128,36,36,36,36,36,36,36,36,-133,36,36,36,36,-75,36,36,36,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,36,-13,36,36,-75,-14,-15,36,-39,36,-12,36,-88,36,36,36,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,36,-141,-99,-207,-33,36,36,36,36,36,36,-34,36,-137,-132,-35,-38,36,36,36,36,-135,-22,36,-134,-23,-136,-16,-144,-7,36,-180,36,-30,-138,36,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,36,36,-209,-172,36,-142,-209,36,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'TRUE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,37,-20,-19,-21,-158,-168,37,-159,37,-198,-184,37,37,37,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,37,-206,-75,37,-71,-70,37,37,37,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-101,-102,-103,-105,-131,-203,-202,37,-71,-74,-96,-98,-100,-119,-120,-128,37,37,37,37,37,37,37,37,-133,37,37,37,37,-75,37,37,37,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,37,-13,37,37,-75,-14,-15,37,-39,37,-12,37,-88,37,37,37,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,37,-141,-99,-207,-33,37,37,37,37,37,37,-34,37,-137,-132,-35,-38,37,37,37,37,-135,-22,37,-134,-23,-136,-16,-144,-7,37,-180,37,-30,-138,37,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,37,37,-209,-172,37,-142,-209,37,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'INTEGER':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,256,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,14,-20,-19,-21,-158,-168,14,-159,14,-198,-184,14,14,14,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,14,-206,-75,14,-71,-70,14,14,14,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,154,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,-101,-102,-103,-105,-131,-203,-202,14,-71,-74,-96,-98,-100,-119,-120,-128,14,14,14,14,14,14,14,14,-133,14,14,14,14,-75,14,14,14,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,14,-13,14,14,-75,-14,-15,14,-39,14,-12,14,-88,14,14,14,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,324,-130,14,-141,-99,-207,-33,14,14,14,14,14,14,-34,14,-137,-132,-35,-38,14,14,14,14,-135,-22,14,-134,-23,-136,-16,-144,-7,14,-180,14,-30,-138,14,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,14,14,-209,-172,14,-142,-209,14,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'HEXA_INTEGER':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,38,-20,-19,-21,-158,-168,38,-159,38,-198,-184,38,38,38,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,38,-206,-75,38,-71,-70,38,38,38,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-101,-102,-103,-105,-131,-203,-202,38,-71,-74,-96,-98,-100,-119,-120,-128,38,38,38,38,38,38,38,38,-133,38,38,38,38,-75,38,38,38,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,38,-13,38,38,-75,-14,-15,38,-39,38,-12,38,-88,38,38,38,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,38,-141,-99,-207,-33,38,38,38,38,38,38,-34,38,-137,-132,-35,-38,38,38,38,38,-135,-22,38,-134,-23,-136,-16,-144,-7,38,-180,38,-30,-138,38,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,38,38,-209,-172,38,-142,-209,38,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'OCT_INTEGER':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,39,-20,-19,-21,-158,-168,39,-159,39,-198,-184,39,39,39,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,39,-206,-75,39,-71,-70,39,39,39,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-101,-102,-103,-105,-131,-203,-202,39,-71,-74,-96,-98,-100,-119,-120,-128,39,39,39,39,39,39,39,39,-133,39,39,39,39,-75,39,39,39,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,39,-13,39,39,-75,-14,-15,39,-39,39,-12,39,-88,39,39,39,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,39,-141,-99,-207,-33,39,39,39,39,39,39,-34,39,-137,-132,-35,-38,39,39,39,39,-135,-22,39,-134,-23,-136,-16,-144,-7,39,-180,39,-30,-138,39,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,39,39,-209,-172,39,-142,-209,39,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'FLOAT':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,40,-20,-19,-21,-158,-168,40,-159,40,-198,-184,40,40,40,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,40,-206,-75,40,-71,-70,40,40,40,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-101,-102,-103,-105,-131,-203,-202,40,-71,-74,-96,-98,-100,-119,-120,-128,40,40,40,40,40,40,40,40,-133,40,40,40,40,-75,40,40,40,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,40,-13,40,40,-75,-14,-15,40,-39,40,-12,40,-88,40,40,40,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,40,-141,-99,-207,-33,40,40,40,40,40,40,-34,40,-137,-132,-35,-38,40,40,40,40,-135,-22,40,-134,-23,-136,-16,-144,-7,40,-180,40,-30,-138,40,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,40,40,-209,-172,40,-142,-209,40,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'ID':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,33,36,37,38,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,115,118,119,120,121,122,123,124,125,126,127,128,131,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,222,223,224,225,226,227,228,229,230,231,232,233,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,299,303,304,305,316,321,322,323,339,345,349,350,353,355,356,357,358,360,361,363,364,365,366,368,369,371,372,375,376,379,381,383,384,385,386,387,391,392,397,405,406,407,414,415,416,417,421,422,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,35,-20,-19,-21,-158,-168,99,-159,99,-198,-184,99,99,99,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,117,-196,-197,-199,-200,-201,-204,99,-206,-75,132,99,141,-70,144,147,99,99,99,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,175,-101,-102,-103,-105,-131,-203,-202,99,-71,-74,-96,-98,-100,-119,-120,-128,99,186,190,196,99,99,190,99,99,99,99,-133,99,99,99,221,99,-75,99,248,248,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,99,-13,99,99,-75,-14,-15,99,-39,99,-12,99,297,-88,99,99,99,-209,-209,-209,-209,297,-209,-209,297,318,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,117,-203,-185,-147,-155,-130,99,-141,297,-99,-207,190,-33,99,99,190,99,99,99,99,-34,99,337,338,-137,-132,-35,-38,99,99,99,99,-135,-22,99,190,-134,-23,-136,-16,-144,352,354,-182,-183,-7,99,-180,99,-30,-138,99,378,297,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,395,-145,-209,99,99,-209,403,-172,99,-142,-209,99,-209,-209,-209,-169,-209,-36,-209,-143,433,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'ID_TYPE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,153,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,222,223,224,225,226,227,228,229,230,231,232,233,235,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,260,261,262,264,265,266,268,269,270,271,272,273,274,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,353,355,356,357,358,360,361,363,364,365,366,368,369,371,372,375,376,379,380,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,422,428,429,430,431,432,433,434,437,438,439,440,441,442,443,444,445,446,447,448,449,],[-209,34,-20,-19,-21,-158,-168,98,-159,98,-198,-184,98,98,98,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,98,-206,129,98,-71,-70,98,98,98,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-101,-102,-103,-105,-131,-203,-202,98,-71,-74,-96,-98,-100,-119,-120,-128,98,98,98,98,98,98,98,98,-133,98,98,98,98,129,98,251,251,255,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,98,-13,98,98,-75,-14,-15,98,-39,98,-12,98,304,-88,98,98,98,-209,-209,-209,-209,304,-209,-209,304,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,98,-141,304,-99,-207,-33,98,98,98,98,98,98,-34,98,336,-137,-132,-35,-38,98,98,98,98,-135,-22,98,-134,-23,-136,-16,-144,-7,98,-180,98,-30,-138,98,304,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,396,-145,-209,304,98,98,-209,-172,98,-142,-209,98,-209,-209,-209,-169,-209,-36,-209,-143,431,-175,-177,-181,-187,439,-191,440,-170,-173,-188,-192,444,446,-174,-193,448,-189,449,-194,-190,]),'UNDEF':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,41,-20,-19,-21,-158,-168,41,-159,41,-198,-184,41,41,41,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,41,-206,-75,41,-71,-70,41,41,41,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-101,-102,-103,-105,-131,-203,-202,41,-71,-74,-96,-98,-100,-119,-120,-128,41,41,41,41,41,41,41,41,-133,41,41,41,41,-75,41,41,41,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,41,-13,41,41,-75,-14,-15,41,-39,41,-12,41,-88,41,41,41,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,41,-141,-99,-207,-33,41,41,41,41,41,41,-34,41,-137,-132,-35,-38,41,41,41,41,-135,-22,41,-134,-23,-136,-16,-144,-7,41,-180,41,-30,-138,41,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,41,41,-209,-172,41,-142,-209,41,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'TYPE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,44,-20,-19,-21,-158,-168,44,-159,44,-198,-184,44,44,44,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,44,-206,-75,139,-71,-70,44,44,44,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-101,-102,-103,-105,-131,-203,-202,44,-71,-74,-96,-98,-100,-119,-120,-128,44,44,193,44,44,193,44,44,44,44,-133,44,139,44,44,-75,44,193,193,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,44,-13,44,44,-75,-14,-15,44,-39,44,-12,44,-88,139,44,44,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,44,-141,-99,-207,193,-33,44,44,193,44,44,44,44,-34,44,-137,-132,-35,-38,44,44,44,44,-135,-22,44,193,-134,-23,-136,-16,-144,-7,44,-180,44,-30,-138,44,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,44,44,-209,-172,44,-142,-209,44,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'SENSITIVE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,138,139,146,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,45,-20,-19,-21,-158,-168,45,-159,45,-198,-184,45,45,45,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,45,-206,-75,45,-71,-70,45,45,45,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-101,-102,-103,-105,-131,-203,-202,45,-71,-74,-96,-98,-100,-119,-120,-128,45,45,45,45,45,45,45,45,-133,45,45,45,45,-75,45,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,45,-13,45,45,-75,-14,-15,45,-39,45,-12,45,-88,45,45,45,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,45,-141,-99,-207,-33,45,45,45,45,45,45,-34,45,-137,-132,-35,-38,45,45,45,45,-135,-22,45,-134,-23,-136,-16,-144,-7,45,-180,45,-30,-138,45,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,45,45,-209,-172,45,-142,-209,45,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'FUNCTION':([0,3,4,6,7,9,10,12,14,15,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,193,194,195,203,207,223,227,228,229,230,232,233,237,238,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,264,272,277,278,279,280,287,288,291,292,293,294,295,316,339,345,355,356,357,358,360,361,363,364,365,368,369,371,372,376,379,384,386,391,392,405,406,407,414,415,416,417,421,428,429,431,433,437,438,439,440,443,444,446,448,449,],[-209,46,-20,-19,-21,-158,-168,-159,-198,-184,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,-209,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-75,-14,-15,-39,-12,-88,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-33,-34,-137,-132,-35,-38,-135,-22,-134,-23,-136,-16,-144,-7,-30,-138,-8,-9,-10,-11,-37,-2,-171,-176,-178,-106,-140,-32,-31,-145,-209,-209,-172,-142,-209,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'NODE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,48,-20,-19,-21,-158,-168,101,-159,101,-198,-184,101,101,101,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,101,-206,-75,101,-71,-70,101,101,101,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-101,-102,-103,-105,-131,-203,-202,101,-71,-74,-96,-98,-100,-119,-120,-128,101,101,101,101,101,101,101,101,101,101,-133,101,101,101,101,-75,101,101,101,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,101,-13,101,101,-75,-14,-15,101,-39,101,-12,101,-88,101,101,101,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,101,-141,-99,-207,101,-33,101,101,101,101,101,101,101,-34,101,-137,-132,-35,-38,101,101,101,101,-135,-22,101,101,-134,-23,-136,-16,-144,-7,101,-180,101,-30,-138,101,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,101,101,-209,-172,101,-142,-209,101,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'DEFINE':([0,3,4,6,7,9,10,12,14,15,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,193,194,195,203,207,223,227,228,229,230,232,233,237,238,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,264,272,277,278,279,280,287,288,291,292,293,294,295,316,339,345,355,356,357,358,360,361,363,364,365,368,369,371,372,376,379,384,386,391,392,405,406,407,414,415,416,417,421,428,429,431,433,437,438,439,440,443,444,446,448,449,],[-209,50,-20,-19,-21,-158,-168,-159,-198,-184,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,-209,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,50,50,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-75,-14,-15,-39,-12,-88,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-33,-34,-137,-132,-35,-38,-135,-22,-134,-23,-136,-16,-144,-7,-30,-138,-8,-9,-10,-11,-37,-2,-171,-176,-178,-106,-140,-32,-31,-145,-209,-209,-172,-142,-209,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'CLASS':([0,3,4,6,7,9,10,12,14,15,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,193,194,195,203,207,223,227,228,229,230,232,233,237,238,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,264,272,277,278,279,280,287,288,291,292,293,294,295,316,339,345,355,356,357,358,360,361,363,364,365,368,369,371,372,376,379,384,386,391,392,405,406,407,414,415,416,417,421,428,429,431,433,437,438,439,440,443,444,446,448,449,],[-209,51,-20,-19,-21,-158,-168,-159,-198,-184,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,-209,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,51,51,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-75,-14,-15,-39,-12,-88,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-33,-34,-137,-132,-35,-38,-135,-22,-134,-23,-136,-16,-144,-7,-30,-138,-8,-9,-10,-11,-37,-2,-171,-176,-178,-106,-140,-32,-31,-145,-209,-209,-172,-142,-209,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'IF':([0,3,4,6,7,9,10,12,14,15,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,193,194,195,203,207,223,227,228,229,230,232,233,237,238,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,264,272,277,278,279,280,287,288,291,292,293,294,295,316,339,345,355,356,357,358,360,361,363,364,365,368,369,371,372,376,379,384,386,391,392,405,406,407,414,415,416,417,421,428,429,431,433,437,438,439,440,443,444,446,448,449,],[-209,52,-20,-19,-21,-158,-168,-159,-198,-184,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,-209,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-75,-14,-15,-39,-12,-88,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-33,-34,-137,-132,-35,-38,-135,-22,-134,-23,-136,-16,-144,-7,-30,-138,-8,-9,-10,-11,-37,-2,-171,-176,-178,-106,-140,-32,-31,-145,-209,-209,-172,-142,-209,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'UNLESS':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,53,-20,-19,-21,-158,-168,102,-159,102,-198,-184,102,102,102,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,102,-206,-75,102,-71,-70,102,102,102,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-101,-102,-103,-105,-131,-203,-202,102,-71,-74,-96,-98,-100,-119,-120,-128,102,102,102,102,102,102,102,102,102,102,-133,102,102,102,102,-75,102,102,102,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,102,-13,102,102,-75,-14,-15,102,-39,102,-12,102,-88,102,102,102,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,102,-141,-99,-207,102,-33,102,102,102,102,102,102,102,-34,102,-137,-132,-35,-38,102,102,102,102,-135,-22,102,102,-134,-23,-136,-16,-144,-7,102,-180,102,-30,-138,102,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,102,102,-209,-172,102,-142,-209,102,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'CASE':([0,3,4,6,7,9,10,12,14,15,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,193,194,195,203,207,223,227,228,229,230,232,233,237,238,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,264,272,277,278,279,280,287,288,291,292,293,294,295,316,339,345,355,356,357,358,360,361,363,364,365,368,369,371,372,376,379,384,386,391,392,405,406,407,414,415,416,417,421,428,429,431,433,437,438,439,440,443,444,446,448,449,],[-209,54,-20,-19,-21,-158,-168,-159,-198,-184,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,-209,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,54,54,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-75,-14,-15,-39,-12,-88,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-33,-34,-137,-132,-35,-38,-135,-22,-134,-23,-136,-16,-144,-7,-30,-138,-8,-9,-10,-11,-37,-2,-171,-176,-178,-106,-140,-32,-31,-145,-209,-209,-172,-142,-209,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'LBRACKET':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,47,48,49,51,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,114,117,118,119,121,122,123,124,125,126,127,128,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,196,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,291,292,293,294,295,304,305,316,318,321,322,323,339,345,349,351,355,356,357,358,359,360,361,362,363,364,365,366,368,369,370,371,372,376,379,381,383,384,386,387,388,389,390,391,392,397,399,403,404,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,47,-20,-19,-21,-158,-168,47,-159,47,-198,-184,47,47,47,-129,112,-157,-160,-161,113,-163,-164,-165,-166,-167,-185,-186,120,124,-196,-197,-199,-200,-201,-204,127,-206,-75,47,-71,-70,146,47,47,47,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-101,-102,-103,-105,-131,-203,-202,47,-71,-74,-96,-98,-100,-119,-120,-128,47,47,47,198,47,47,47,47,47,47,-133,47,47,47,47,-75,227,228,229,230,232,233,47,-4,237,238,239,47,47,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,47,-13,47,47,-75,-14,-15,273,47,-39,47,-12,47,-88,47,47,47,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,113,112,124,323,120,-185,-147,-155,-130,47,-141,-99,-207,-33,47,47,47,47,47,47,-34,47,-137,-132,-35,-38,47,47,47,47,-135,-22,47,-134,-23,-136,-16,-144,-182,-183,-7,-6,47,-180,47,-30,-138,47,379,-8,-9,-10,-11,384,-37,-2,-3,-171,-176,-178,-179,-106,-140,392,-32,-31,-145,-209,47,47,-209,-172,47,405,406,407,-142,-209,47,415,-5,417,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'LPARENR':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,114,118,119,121,122,123,124,125,126,127,128,137,138,139,146,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,183,186,187,193,194,195,198,203,204,205,207,212,214,217,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,255,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,286,287,288,289,291,292,293,294,295,304,307,308,316,321,322,323,328,329,331,332,333,334,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,377,379,381,383,384,386,387,391,392,397,400,401,404,405,406,407,413,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,13,-20,70,-19,-21,-101,-102,-103,13,-105,13,-198,-184,13,13,13,-129,-131,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,119,-202,-196,-197,-199,-200,-201,-204,13,-206,-75,13,-71,-70,13,13,13,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,70,-101,-102,-103,-105,-131,119,-202,13,-71,-74,-96,-98,70,70,70,70,13,13,13,13,13,13,13,13,13,-133,13,13,13,70,13,-75,13,70,70,70,13,13,-198,-107,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-139,-104,-87,13,70,70,13,-202,13,-75,-14,-15,13,-39,13,70,70,70,70,70,13,-88,13,13,13,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,119,-185,-147,-155,119,-130,13,-141,70,-207,-33,13,13,13,13,13,13,-34,13,-137,-132,-35,-38,13,13,13,13,70,-135,-22,13,-134,-23,-136,70,-144,119,70,70,-7,13,-180,13,70,70,70,70,70,70,-30,-138,13,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,70,-209,13,13,-209,-172,13,-142,-209,13,70,70,70,-209,-209,-209,70,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'DEFAULT':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,49,-20,-19,-21,-158,-168,49,-159,49,-198,-184,49,49,49,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,49,-206,-75,49,143,-70,49,49,49,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-101,-102,-103,-105,-131,-203,-202,49,-71,-74,-96,-98,-100,-119,-120,-128,49,49,49,49,49,49,49,49,49,49,-133,49,49,49,49,-75,49,49,49,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,49,-13,49,49,-75,-14,-15,49,-39,49,-12,49,-88,49,49,49,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,49,-141,-99,-207,49,-33,49,49,49,49,49,49,49,-34,49,-137,-132,-35,-38,49,49,49,49,-135,-22,49,49,-134,-23,-136,-16,-144,-7,49,-180,49,-30,-138,49,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,49,49,-209,-172,49,-142,-209,49,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'SITE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,56,-20,-19,-21,-158,-168,56,-159,56,-198,-184,56,56,56,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,56,-206,-75,56,-71,-70,56,56,56,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-101,-102,-103,-105,-131,-203,-202,56,-71,-74,-96,-98,-100,-119,-120,-128,56,56,56,56,56,56,56,56,56,56,-133,56,56,56,56,-75,56,56,56,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,56,-13,56,56,-75,-14,-15,56,-39,56,-12,56,-88,56,56,56,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,56,-141,-99,-207,56,-33,56,56,56,56,56,56,56,-34,56,-137,-132,-35,-38,56,56,56,56,-135,-22,56,56,-134,-23,-136,-16,-144,-7,56,-180,56,-30,-138,56,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,56,56,-209,-172,56,-142,-209,56,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'IMPORT':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,57,-20,-19,-21,-158,-168,57,-159,57,-198,-184,57,57,57,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,57,-206,-75,57,-71,-70,57,57,57,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-101,-102,-103,-105,-131,-203,-202,57,-71,-74,-96,-98,-100,-119,-120,-128,57,57,57,57,57,57,57,57,57,57,-133,57,57,57,57,-75,57,57,57,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,57,-13,57,57,-75,-14,-15,57,-39,57,-12,57,-88,57,57,57,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,57,-141,-99,-207,57,-33,57,57,57,57,57,57,57,-34,57,-137,-132,-35,-38,57,57,57,57,-135,-22,57,57,-134,-23,-136,-16,-144,-7,57,-180,57,-30,-138,57,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,57,57,-209,-172,57,-142,-209,57,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'INCLUDE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,58,-20,-19,-21,-158,-168,58,-159,58,-198,-184,58,58,58,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,58,-206,-75,58,-71,-70,58,58,58,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-101,-102,-103,-105,-131,-203,-202,58,-71,-74,-96,-98,-100,-119,-120,-128,58,58,58,58,58,58,58,58,58,58,-133,58,58,58,58,-75,58,58,58,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,58,-13,58,58,-75,-14,-15,58,-39,58,-12,58,-88,58,58,58,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,58,-141,-99,-207,58,-33,58,58,58,58,58,58,58,-34,58,-137,-132,-35,-38,58,58,58,58,-135,-22,58,58,-134,-23,-136,-16,-144,-7,58,-180,58,-30,-138,58,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,58,58,-209,-172,58,-142,-209,58,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'REQUIRE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,59,-20,-19,-21,-158,-168,59,-159,59,-198,-184,59,59,59,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,59,-206,-75,59,-71,-70,59,59,59,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-101,-102,-103,-105,-131,-203,-202,59,-71,-74,-96,-98,-100,-119,-120,-128,59,59,59,59,59,59,59,59,59,59,-133,59,59,59,59,-75,59,59,59,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,59,-13,59,59,-75,-14,-15,59,-39,59,-12,59,-88,59,59,59,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,59,-141,-99,-207,59,-33,59,59,59,59,59,59,59,-34,59,-137,-132,-35,-38,59,59,59,59,-135,-22,59,59,-134,-23,-136,-16,-144,-7,59,-180,59,-30,-138,59,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,59,59,-209,-172,59,-142,-209,59,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'CONTAIN':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,60,-20,-19,-21,-158,-168,60,-159,60,-198,-184,60,60,60,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,60,-206,-75,60,-71,-70,60,60,60,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-101,-102,-103,-105,-131,-203,-202,60,-71,-74,-96,-98,-100,-119,-120,-128,60,60,60,60,60,60,60,60,60,60,-133,60,60,60,60,-75,60,60,60,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,60,-13,60,60,-75,-14,-15,60,-39,60,-12,60,-88,60,60,60,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,60,-141,-99,-207,60,-33,60,60,60,60,60,60,60,-34,60,-137,-132,-35,-38,60,60,60,60,-135,-22,60,60,-134,-23,-136,-16,-144,-7,60,-180,60,-30,-138,60,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,60,60,-209,-172,60,-142,-209,60,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'TAG':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,61,-20,-19,-21,-158,-168,61,-159,61,-198,-184,61,61,61,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,61,-206,-75,61,-71,-70,61,61,61,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-101,-102,-103,-105,-131,-203,-202,61,-71,-74,-96,-98,-100,-119,-120,-128,61,61,61,61,61,61,61,61,61,61,-133,61,61,61,61,-75,61,61,61,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,61,-13,61,61,-75,-14,-15,61,-39,61,-12,61,-88,61,61,61,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,61,-141,-99,-207,61,-33,61,61,61,61,61,61,61,-34,61,-137,-132,-35,-38,61,61,61,61,-135,-22,61,61,-134,-23,-136,-16,-144,-7,61,-180,61,-30,-138,61,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,61,61,-209,-172,61,-142,-209,61,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'DEBUG':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,62,-20,-19,-21,-158,-168,62,-159,62,-198,-184,62,62,62,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,62,-206,-75,62,-71,-70,62,62,62,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-101,-102,-103,-105,-131,-203,-202,62,-71,-74,-96,-98,-100,-119,-120,-128,62,62,62,62,62,62,62,62,62,62,-133,62,62,62,62,-75,62,62,62,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,62,-13,62,62,-75,-14,-15,62,-39,62,-12,62,-88,62,62,62,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,62,-141,-99,-207,62,-33,62,62,62,62,62,62,62,-34,62,-137,-132,-35,-38,62,62,62,62,-135,-22,62,62,-134,-23,-136,-16,-144,-7,62,-180,62,-30,-138,62,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,62,62,-209,-172,62,-142,-209,62,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'INFO':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,63,-20,-19,-21,-158,-168,63,-159,63,-198,-184,63,63,63,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,63,-206,-75,63,-71,-70,63,63,63,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-101,-102,-103,-105,-131,-203,-202,63,-71,-74,-96,-98,-100,-119,-120,-128,63,63,63,63,63,63,63,63,63,63,-133,63,63,63,63,-75,63,63,63,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,63,-13,63,63,-75,-14,-15,63,-39,63,-12,63,-88,63,63,63,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,63,-141,-99,-207,63,-33,63,63,63,63,63,63,63,-34,63,-137,-132,-35,-38,63,63,63,63,-135,-22,63,63,-134,-23,-136,-16,-144,-7,63,-180,63,-30,-138,63,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,63,63,-209,-172,63,-142,-209,63,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'NOTICE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,64,-20,-19,-21,-158,-168,64,-159,64,-198,-184,64,64,64,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,64,-206,-75,64,-71,-70,64,64,64,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-101,-102,-103,-105,-131,-203,-202,64,-71,-74,-96,-98,-100,-119,-120,-128,64,64,64,64,64,64,64,64,64,64,-133,64,64,64,64,-75,64,64,64,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,64,-13,64,64,-75,-14,-15,64,-39,64,-12,64,-88,64,64,64,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,64,-141,-99,-207,64,-33,64,64,64,64,64,64,64,-34,64,-137,-132,-35,-38,64,64,64,64,-135,-22,64,64,-134,-23,-136,-16,-144,-7,64,-180,64,-30,-138,64,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,64,64,-209,-172,64,-142,-209,64,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'WARNING':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,65,-20,-19,-21,-158,-168,65,-159,65,-198,-184,65,65,65,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,65,-206,-75,65,-71,-70,65,65,65,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-101,-102,-103,-105,-131,-203,-202,65,-71,-74,-96,-98,-100,-119,-120,-128,65,65,65,65,65,65,65,65,65,65,-133,65,65,65,65,-75,65,65,65,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,65,-13,65,65,-75,-14,-15,65,-39,65,-12,65,-88,65,65,65,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,65,-141,-99,-207,65,-33,65,65,65,65,65,65,65,-34,65,-137,-132,-35,-38,65,65,65,65,-135,-22,65,65,-134,-23,-136,-16,-144,-7,65,-180,65,-30,-138,65,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,65,65,-209,-172,65,-142,-209,65,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'ERR':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,66,-20,-19,-21,-158,-168,66,-159,66,-198,-184,66,66,66,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,66,-206,-75,66,-71,-70,66,66,66,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-101,-102,-103,-105,-131,-203,-202,66,-71,-74,-96,-98,-100,-119,-120,-128,66,66,66,66,66,66,66,66,66,66,-133,66,66,66,66,-75,66,66,66,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,66,-13,66,66,-75,-14,-15,66,-39,66,-12,66,-88,66,66,66,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,66,-141,-99,-207,66,-33,66,66,66,66,66,66,66,-34,66,-137,-132,-35,-38,66,66,66,66,-135,-22,66,66,-134,-23,-136,-16,-144,-7,66,-180,66,-30,-138,66,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,66,66,-209,-172,66,-142,-209,66,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'FAIL':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,67,-20,-19,-21,-158,-168,67,-159,67,-198,-184,67,67,67,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,67,-206,-75,67,-71,-70,67,67,67,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-101,-102,-103,-105,-131,-203,-202,67,-71,-74,-96,-98,-100,-119,-120,-128,67,67,67,67,67,67,67,67,67,67,-133,67,67,67,67,-75,67,67,67,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,67,-13,67,67,-75,-14,-15,67,-39,67,-12,67,-88,67,67,67,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,67,-141,-99,-207,67,-33,67,67,67,67,67,67,67,-34,67,-137,-132,-35,-38,67,67,67,67,-135,-22,67,67,-134,-23,-136,-16,-144,-7,67,-180,67,-30,-138,67,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,67,67,-209,-172,67,-142,-209,67,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'REALIZE':([0,3,4,6,7,9,10,11,12,13,14,15,16,17,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,113,118,119,120,121,122,123,124,125,126,127,128,138,139,146,151,152,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,187,193,194,195,198,203,204,207,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,263,264,265,266,267,268,269,270,271,272,273,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,295,316,321,322,323,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,381,383,384,386,387,391,392,397,405,406,407,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,68,-20,-19,-21,-158,-168,68,-159,68,-198,-184,68,68,68,-129,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-196,-197,-199,-200,-201,-204,68,-206,-75,68,-71,-70,68,68,68,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-101,-102,-103,-105,-131,-203,-202,68,-71,-74,-96,-98,-100,-119,-120,-128,68,68,68,68,68,68,68,68,68,68,-133,68,68,68,68,-75,68,68,68,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,68,-13,68,68,-75,-14,-15,68,-39,68,-12,68,-88,68,68,68,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,68,-141,-99,-207,68,-33,68,68,68,68,68,68,68,-34,68,-137,-132,-35,-38,68,68,68,68,-135,-22,68,68,-134,-23,-136,-16,-144,-7,68,-180,68,-30,-138,68,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,68,68,-209,-172,68,-142,-209,68,-209,-209,-209,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'ARITH_DIV':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,47,48,49,52,53,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,111,112,118,119,121,122,123,124,125,126,127,128,137,138,139,146,148,149,150,151,152,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,183,186,187,193,194,195,197,198,203,204,205,207,212,214,217,219,223,224,225,226,227,228,229,230,232,233,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,258,259,261,262,264,265,266,268,269,270,271,272,273,277,278,279,280,281,282,283,284,286,287,288,289,291,292,293,294,295,307,308,316,321,322,323,328,329,331,332,333,334,338,339,345,349,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,377,379,381,383,384,386,387,391,392,397,400,401,404,405,406,407,413,414,415,416,417,421,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-209,18,-20,85,-19,-21,-101,-102,-103,18,-105,18,-198,-184,18,18,18,-129,-131,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,18,-206,-75,18,18,-70,18,18,18,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,85,-101,-102,-103,-105,-131,-203,-202,18,-71,-74,-96,-98,85,-119,-120,-128,18,18,18,18,18,18,18,18,-133,18,18,18,85,18,-75,18,85,85,85,18,18,-198,-107,85,85,85,85,85,85,-114,-115,-116,85,85,85,85,-123,-124,-125,85,85,-139,-104,-87,18,262,85,85,18,-202,18,-75,-14,-15,274,18,-39,18,85,85,85,85,85,18,-88,18,18,18,-209,-209,-209,-209,-209,-209,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,18,-141,85,-207,-33,18,18,18,18,18,18,-34,18,-137,-132,-35,-38,18,18,18,18,85,-135,-22,18,-134,-23,-136,85,-144,85,85,-7,18,-180,18,85,85,85,85,85,85,375,-30,-138,18,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,85,-209,18,18,-209,-172,18,-142,-209,18,85,85,85,-209,-209,-209,85,-169,-209,-36,-209,-143,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,12,14,15,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,193,194,195,203,207,223,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,264,272,277,278,279,280,287,288,291,292,293,294,295,316,339,345,355,356,357,358,360,361,363,364,365,368,369,371,372,376,386,391,414,416,421,428,429,431,433,437,438,439,440,443,444,446,448,449,],[-209,0,-1,-17,-20,-18,-19,-21,-101,-102,-103,-105,-198,-184,-129,-131,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-75,-14,-15,-39,-12,-88,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-33,-34,-137,-132,-35,-38,-135,-22,-134,-23,-136,-16,-144,-7,-30,-138,-8,-9,-10,-11,-37,-2,-171,-176,-178,-106,-140,-32,-31,-145,-172,-142,-169,-36,-143,-175,-177,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'RBRACKET':([3,4,5,6,7,8,9,10,12,14,15,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,47,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,112,113,120,124,125,127,133,134,135,136,146,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,184,185,188,189,193,194,195,198,201,203,207,208,209,210,211,215,216,223,224,227,228,229,230,232,233,234,237,238,239,240,241,242,243,244,245,246,247,248,249,251,252,253,254,257,259,261,262,263,264,267,272,273,276,277,278,279,280,287,288,289,290,291,292,293,294,295,306,307,308,309,310,311,312,314,315,316,319,320,321,322,323,327,328,329,330,331,332,333,334,335,339,345,346,347,355,356,357,358,360,361,363,364,365,366,368,369,371,372,376,379,384,386,391,392,398,402,405,406,407,408,414,415,416,417,418,419,420,421,426,427,428,429,430,431,433,437,438,439,440,443,444,446,448,449,],[-17,-20,-18,-19,-21,-101,-102,-103,-105,-198,-184,-129,-131,-157,-160,-161,-162,-163,-164,-165,-166,-167,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-209,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-209,-209,-209,-209,-133,-209,223,-89,-91,-93,-209,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,264,-59,-61,-63,272,-75,-14,-15,-209,279,-39,-12,288,-24,-26,-28,292,-26,-88,-90,-209,-209,-209,-209,-209,-209,316,-209,-209,-209,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,-147,-155,-130,-141,-99,-207,-209,-33,-60,-34,-209,339,-137,-132,-35,-38,-135,-22,-25,-209,-134,-23,-136,-16,-144,-92,-94,-95,355,356,357,358,360,361,-7,363,364,365,-180,-209,371,-66,-69,-62,-64,-67,-65,-68,372,-30,-138,-27,-29,-8,-9,-10,-11,-37,-2,-171,-176,-178,-179,-106,-140,-32,-31,-145,-209,-209,-172,-142,-209,414,416,-209,-209,-209,421,-169,-209,-36,-209,428,429,430,-143,437,438,-175,-177,-181,-187,-191,-170,-173,-188,-192,-174,-193,-189,-194,-190,]),'QUESTION_MARK':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[71,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,71,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,71,-119,-120,-128,-133,71,-205,-75,71,71,71,-198,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,71,71,-202,-205,-14,-15,71,71,71,71,71,-88,-130,-141,71,-207,-137,-132,71,-135,-134,-136,71,-144,71,71,71,71,71,71,71,71,-138,-106,-140,-145,71,-142,71,71,71,71,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_EQUAL':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,202,205,207,212,214,217,223,257,259,261,262,277,278,285,286,287,291,293,294,295,307,308,328,329,331,332,333,334,340,341,342,343,344,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[72,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,72,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,72,-119,-120,-128,-133,72,-205,-75,72,72,72,-198,-107,None,None,72,72,72,72,-114,-115,-116,72,72,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,72,72,-202,-205,-14,-15,281,72,72,72,72,72,-88,-130,-141,72,-207,-137,-132,281,72,-135,-134,-136,72,-144,72,72,72,72,72,72,72,72,None,None,281,281,-44,-138,-106,-140,-145,72,-142,72,72,72,72,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_NOT_EQUAL':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,202,205,207,212,214,217,223,257,259,261,262,277,278,285,286,287,291,293,294,295,307,308,328,329,331,332,333,334,340,341,342,343,344,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[73,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,73,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,73,-119,-120,-128,-133,73,-205,-75,73,73,73,-198,-107,None,None,73,73,73,73,-114,-115,-116,73,73,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,73,73,-202,-205,-14,-15,282,73,73,73,73,73,-88,-130,-141,73,-207,-137,-132,282,73,-135,-134,-136,73,-144,73,73,73,73,73,73,73,73,None,None,282,282,-44,-138,-106,-140,-145,73,-142,73,73,73,73,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_LESS_THAN':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[74,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,74,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,74,-119,-120,-128,-133,74,-205,-75,74,74,74,-198,-107,-108,-109,None,None,None,None,-114,-115,-116,74,74,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,74,74,-202,-205,-14,-15,74,74,74,74,74,-88,-130,-141,74,-207,-137,-132,74,-135,-134,-136,74,-144,74,74,74,74,74,74,74,74,-138,-106,-140,-145,74,-142,74,74,74,74,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_GREATER_THAN':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[75,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,75,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,75,-119,-120,-128,-133,75,-205,-75,75,75,75,-198,-107,-108,-109,None,None,None,None,-114,-115,-116,75,75,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,75,75,-202,-205,-14,-15,75,75,75,75,75,-88,-130,-141,75,-207,-137,-132,75,-135,-134,-136,75,-144,75,75,75,75,75,75,75,75,-138,-106,-140,-145,75,-142,75,75,75,75,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_LESS_THAN_OR_EQUAL':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[76,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,76,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,76,-119,-120,-128,-133,76,-205,-75,76,76,76,-198,-107,-108,-109,None,None,None,None,-114,-115,-116,76,76,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,76,76,-202,-205,-14,-15,76,76,76,76,76,-88,-130,-141,76,-207,-137,-132,76,-135,-134,-136,76,-144,76,76,76,76,76,76,76,76,-138,-106,-140,-145,76,-142,76,76,76,76,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_GREATER_THAN_OR_EQUAL':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[77,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,77,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,77,-119,-120,-128,-133,77,-205,-75,77,77,77,-198,-107,-108,-109,None,None,None,None,-114,-115,-116,77,77,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,77,77,-202,-205,-14,-15,77,77,77,77,77,-88,-130,-141,77,-207,-137,-132,77,-135,-134,-136,77,-144,77,77,77,77,77,77,77,77,-138,-106,-140,-145,77,-142,77,77,77,77,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_REGEX_MATCH':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[78,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,78,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,78,-119,-120,-128,-133,78,-205,-75,78,78,78,-198,-107,78,78,78,78,78,78,-114,-115,-116,78,78,78,78,78,78,78,78,78,-139,-104,-87,-97,78,78,-202,-205,-14,-15,78,78,78,78,78,-88,-130,-141,78,-207,-137,-132,78,-135,-134,-136,78,-144,78,78,78,78,78,78,78,78,-138,-106,-140,-145,78,-142,78,78,78,78,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_REGEX_NOT_MATCH':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[79,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,79,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,79,-119,-120,-128,-133,79,-205,-75,79,79,79,-198,-107,79,79,79,79,79,79,-114,-115,-116,79,79,79,79,79,79,79,79,79,-139,-104,-87,-97,79,79,-202,-205,-14,-15,79,79,79,79,79,-88,-130,-141,79,-207,-137,-132,79,-135,-134,-136,79,-144,79,79,79,79,79,79,79,79,-138,-106,-140,-145,79,-142,79,79,79,79,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CMP_IN':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[80,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,80,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,80,-119,-120,-128,-133,80,-205,-75,80,80,80,-198,-107,80,80,80,80,80,80,80,80,-116,80,80,80,80,80,80,80,80,80,-139,-104,-87,-97,80,80,-202,-205,-14,-15,80,80,80,80,80,-88,-130,-141,80,-207,-137,-132,80,-135,-134,-136,80,-144,80,80,80,80,80,80,80,80,-138,-106,-140,-145,80,-142,80,80,80,80,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'BOOL_AND':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,202,205,207,212,214,217,223,257,259,261,262,277,278,285,286,287,291,293,294,295,307,308,328,329,331,332,333,334,340,341,342,343,344,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[81,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,81,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,81,-119,-120,-128,-133,81,-205,-75,81,81,81,-198,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,81,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,81,81,-202,-205,-14,-15,283,81,81,81,81,81,-88,-130,-141,81,-207,-137,-132,283,81,-135,-134,-136,81,-144,81,81,81,81,81,81,81,81,-40,-41,-42,283,-44,-138,-106,-140,-145,81,-142,81,81,81,81,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'BOOL_OR':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,202,205,207,212,214,217,223,257,259,261,262,277,278,285,286,287,291,293,294,295,307,308,328,329,331,332,333,334,340,341,342,343,344,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[82,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,82,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,82,-119,-120,-128,-133,82,-205,-75,82,82,82,-198,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,82,82,-202,-205,-14,-15,284,82,82,82,82,82,-88,-130,-141,82,-207,-137,-132,284,82,-135,-134,-136,82,-144,82,82,82,82,82,82,82,82,-40,-41,-42,-43,-44,-138,-106,-140,-145,82,-142,82,82,82,82,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'ARITH_ADD':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[83,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,83,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,83,-119,-120,-128,-133,83,-205,-75,83,83,83,-198,-107,83,83,83,83,83,83,-114,-115,-116,83,83,-121,-122,-123,-124,-125,83,83,-139,-104,-87,-97,83,83,-202,-205,-14,-15,83,83,83,83,83,-88,-130,-141,83,-207,-137,-132,83,-135,-134,-136,83,-144,83,83,83,83,83,83,83,83,-138,-106,-140,-145,83,-142,83,83,83,83,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'ARITH_MOD':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[87,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,87,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,87,-119,-120,-128,-133,87,-205,-75,87,87,87,-198,-107,87,87,87,87,87,87,-114,-115,-116,87,87,87,87,-123,-124,-125,87,87,-139,-104,-87,-97,87,87,-202,-205,-14,-15,87,87,87,87,87,-88,-130,-141,87,-207,-137,-132,87,-135,-134,-136,87,-144,87,87,87,87,87,87,87,87,-138,-106,-140,-145,87,-142,87,87,87,87,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'ARITH_LSHIFT':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[88,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,88,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,88,-119,-120,-128,-133,88,-205,-75,88,88,88,-198,-107,88,88,88,88,88,88,-114,-115,-116,88,88,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,88,88,-202,-205,-14,-15,88,88,88,88,88,-88,-130,-141,88,-207,-137,-132,88,-135,-134,-136,88,-144,88,88,88,88,88,88,88,88,-138,-106,-140,-145,88,-142,88,88,88,88,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'ARITH_RSHIFT':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,351,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[89,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,89,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,89,-119,-120,-128,-133,89,-205,-75,89,89,89,-198,-107,89,89,89,89,89,89,-114,-115,-116,89,89,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,89,89,-202,-205,-14,-15,89,89,89,89,89,-88,-130,-141,89,-207,-137,-132,89,-135,-134,-136,89,-144,89,89,89,89,89,89,89,89,-138,380,-106,-140,-145,89,-142,89,89,89,89,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'DOT':([5,8,9,10,12,14,15,20,21,31,32,34,35,36,37,38,39,40,41,42,43,44,45,48,49,53,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,148,149,150,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,205,207,212,214,217,223,257,259,261,262,277,278,286,287,291,293,294,295,307,308,328,329,331,332,333,334,345,368,369,376,377,391,400,401,404,413,421,431,433,439,440,444,446,448,449,],[90,-101,-102,-103,-105,-198,-184,-129,-131,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,131,-71,-70,-74,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,90,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,90,-119,-120,-128,-133,90,-205,-75,90,90,90,-198,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,90,90,-202,-205,-14,-15,90,90,90,90,90,-88,-130,-141,90,-207,-137,-132,90,-135,-134,-136,90,-144,90,90,90,90,90,90,90,90,-138,-106,-140,-145,90,-142,90,90,90,90,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'CHAINING_LEFT':([8,14,15,21,24,25,26,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,101,102,177,193,203,223,240,241,242,243,244,245,246,247,248,249,251,252,253,254,262,264,272,278,279,280,288,292,316,339,360,361,365,371,372,416,431,433,439,440,444,446,448,449,],[-153,-198,-184,-156,-150,-154,-151,-152,-148,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,151,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-71,-74,-87,-75,-39,-88,151,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,151,-155,-207,-33,-34,-132,-35,-38,-22,-23,-7,-30,-37,-2,-178,-32,-31,-36,-187,-191,-188,-192,-193,-189,-194,-190,]),'CHAINING_RIGHT':([8,14,15,21,24,25,26,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,48,49,53,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,101,102,177,193,203,223,240,241,242,243,244,245,246,247,248,249,251,252,253,254,262,264,272,278,279,280,288,292,316,339,360,361,365,371,372,416,431,433,439,440,444,446,448,449,],[-153,-198,-184,-156,-150,-154,-151,-152,-148,-185,-186,-203,-202,-196,-197,-199,-200,-201,-204,-205,-206,-75,-71,-70,-74,152,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-149,-71,-74,-87,-75,-39,-88,-146,-148,-150,-151,-152,-153,-154,-156,-202,-205,-203,-185,152,-155,-207,-33,-34,-132,-35,-38,-22,-23,-7,-30,-37,-2,-178,-32,-31,-36,-187,-191,-188,-192,-193,-189,-194,-190,]),'RPARENR':([13,14,15,20,31,32,36,37,38,39,40,41,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,70,92,93,94,95,96,98,99,100,101,102,103,104,105,106,107,108,110,119,125,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,194,195,200,207,223,257,259,261,262,277,278,287,291,293,294,295,324,345,368,369,376,391,421,431,433,439,440,444,446,448,449,],[-209,-198,-184,-129,-185,-186,-196,-197,-199,-200,-201,-204,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-209,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,177,-96,-98,-100,-119,-120,-128,-209,-133,-198,257,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-14,-15,278,-12,-88,-130,-141,-99,-207,-137,-132,-135,-134,-136,-16,-144,368,-138,-106,-140,-145,-142,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'RPAREN':([14,15,20,31,32,36,37,38,39,40,41,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,91,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,118,122,125,126,128,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,194,195,199,205,206,207,213,214,218,220,222,223,231,235,257,258,259,261,262,277,278,285,286,287,291,293,294,295,297,298,300,301,302,313,317,325,336,337,340,341,342,343,344,345,348,352,353,354,368,369,376,377,378,382,391,395,396,400,401,413,421,431,433,439,440,444,446,448,449,],[-198,-184,-129,-185,-186,-196,-197,-199,-200,-201,-204,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,176,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-209,-209,-133,-209,-209,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-14,-15,277,-45,287,-12,291,176,293,295,-209,-88,-209,-209,-130,-209,-141,-99,-207,-137,-132,344,176,-135,-134,-136,-16,-144,-53,351,-46,-48,-50,359,362,369,373,374,-40,-41,-42,-43,-44,-138,376,-52,-47,-57,-106,-140,-145,-54,-56,-49,-142,411,412,-51,-58,-55,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'COMMA':([14,15,20,21,31,32,36,37,38,39,40,41,42,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,69,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,134,136,138,154,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,184,187,188,194,195,207,214,223,247,254,257,259,261,262,277,278,287,291,293,294,295,297,300,302,306,307,308,328,329,330,331,332,333,334,345,352,354,368,369,376,377,378,382,391,400,401,413,421,431,433,439,440,444,446,448,449,],[-198,-184,-129,-156,-185,-186,-196,-197,-199,-200,-201,-204,-209,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,153,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,178,-98,-100,-119,-120,-128,-133,224,-93,-209,256,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,267,-209,-63,-14,-15,-12,-100,-88,-156,-155,-130,-141,-99,-207,-137,-132,-135,-134,-136,-16,-144,-53,353,-50,-92,-94,-95,-66,-69,-62,-64,-67,-65,-68,-138,-52,-57,-106,-140,-145,-54,-56,-49,-142,-51,-58,-55,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'HASH_ROCKET':([14,15,20,31,32,36,37,38,39,40,41,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,137,138,139,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,183,186,187,190,191,192,193,194,195,207,217,223,257,259,261,262,277,278,287,291,293,294,295,345,368,369,376,391,421,431,433,439,440,444,446,448,449,],[-198,-184,-129,-185,-186,-196,-197,-199,-200,-201,-204,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,225,226,-75,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,265,268,270,268,270,265,-75,-14,-15,-12,225,-88,-130,-141,-99,-207,-137,-132,-135,-134,-136,-16,-144,-138,-106,-140,-145,-142,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'COLON':([14,15,20,31,32,36,37,38,39,40,41,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,138,139,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,186,187,194,195,197,207,212,217,223,239,257,259,261,262,277,278,287,291,293,294,295,321,322,345,366,367,368,369,376,391,421,430,431,433,439,440,444,446,448,449,],[-198,-184,-129,-185,-186,-196,-197,-199,-200,-201,-204,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,-205,-75,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,263,-202,-205,-14,-15,275,-12,290,290,-88,-209,-130,-141,-99,-207,-137,-132,-135,-134,-136,-16,-144,-209,-180,-138,-179,390,-106,-140,-145,-142,-143,-181,-187,-191,-188,-192,-193,-189,-194,-190,]),'RANGLEBRACKET':([14,15,20,31,32,36,37,38,39,40,41,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,121,125,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,194,195,202,205,207,223,257,259,261,262,277,278,287,291,293,294,295,340,341,342,343,344,345,368,369,376,391,421,431,433,439,440,444,446,448,449,],[-198,-184,-129,-185,-186,-196,-197,-199,-200,-201,-204,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,203,-133,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-14,-15,280,-45,-12,-88,-130,-141,-99,-207,-137,-132,-135,-134,-136,-16,-144,-40,-41,-42,-43,-44,-138,-106,-140,-145,-142,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'DOT_COMMA':([14,15,20,31,32,36,37,38,39,40,41,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,184,185,188,194,195,207,209,211,223,257,259,261,262,267,277,278,287,290,291,293,294,295,328,329,330,331,332,333,334,345,346,347,368,369,376,391,421,431,433,439,440,444,446,448,449,],[-198,-184,-129,-185,-186,-196,-197,-199,-200,-201,-204,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,-139,-104,-87,-97,-13,-59,-61,-63,-14,-15,-12,289,-28,-88,-130,-141,-99,-207,-60,-137,-132,-135,-209,-134,-136,-16,-144,-66,-69,-62,-64,-67,-65,-68,-138,-27,-29,-106,-140,-145,-142,-143,-187,-191,-188,-192,-193,-189,-194,-190,]),'BAR':([14,15,20,31,32,36,37,38,39,40,41,43,44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,92,93,94,95,96,98,99,100,101,102,104,105,106,107,108,110,125,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,194,195,207,223,257,259,260,261,262,277,278,287,291,293,294,295,297,300,301,302,326,345,352,353,354,368,369,376,377,378,382,391,400,401,409,410,413,421,431,433,435,436,439,440,444,446,448,449,],[-198,-184,-129,-185,-186,-196,-197,-199,-200,-201,-204,-206,-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-101,-102,-103,-105,-131,-203,-202,-205,-71,-74,-96,-98,-100,-119,-120,-128,-133,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-121,-122,-123,-124,-125,-126,-127,260,-104,-87,-97,-13,-14,-15,-12,-88,-130,-141,-209,-99,-207,-137,-132,260,-134,-136,-16,-144,-53,-46,-48,-50,370,-138,-52,-47,-57,-106,260,-145,-54,-56,-49,-142,-51,-58,422,423,-55,-143,-187,-191,441,442,-188,-192,-193,-189,-194,-190,]),'REGEXPRESSION':([18,109,],[-208,179,]),'EQUAL':([20,31,35,99,129,177,186,257,297,352,354,378,],[111,114,123,123,219,-87,123,-130,349,381,383,397,]),'LANGLEBRACKET':([34,251,],[121,121,]),'PLUSIGNMENT':([44,49,56,57,58,59,60,61,62,63,64,65,66,67,68,101,102,183,186,187,190,191,192,193,],[-75,-70,-72,-73,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-71,-74,266,269,271,269,271,266,-75,]),'INHERITS':([147,362,],[236,385,]),'ELSIF':([363,438,],[387,387,]),'ELSE':([363,364,438,],[388,389,388,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'block':([0,227,228,229,230,232,233,237,238,379,384,392,405,406,407,415,417,],[2,309,310,311,312,314,315,319,320,398,402,408,418,419,420,426,427,]),'statements':([0,227,228,229,230,232,233,237,238,379,384,392,405,406,407,415,417,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'empty':([0,13,42,47,70,100,112,113,118,119,120,122,124,126,127,128,138,146,187,198,222,227,228,229,230,231,232,233,235,237,238,239,258,260,263,273,290,321,323,379,384,392,405,406,407,415,417,],[4,105,105,135,105,105,185,185,105,105,185,105,210,105,216,105,105,210,105,210,301,4,4,4,4,301,4,4,301,4,4,322,105,301,185,210,185,105,210,4,4,4,4,4,4,4,4,]),'expression':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[5,91,106,107,108,110,106,137,148,149,150,106,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,106,180,181,106,106,205,106,207,212,214,217,106,106,212,261,110,106,212,286,294,137,307,308,106,328,329,331,332,333,334,212,205,205,205,205,212,106,212,377,400,401,404,413,]),'statement':([3,],[6,]),'value':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,151,152,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[8,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,245,245,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),'function_call':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[9,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'statement_function':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[10,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'assignment':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[12,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'hash':([3,11,13,16,17,19,42,47,52,53,54,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,114,118,119,121,122,123,124,126,127,128,138,146,151,152,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[15,15,15,15,15,15,15,15,15,15,15,15,156,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,195,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'access':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'reference':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,151,152,153,178,183,187,198,204,219,222,224,225,226,231,235,258,260,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,353,380,381,383,387,397,],[21,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,247,247,254,96,96,96,96,96,96,305,96,96,96,305,305,96,305,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,305,305,96,96,96,96,]),'function':([3,],[22,]),'node':([3,],[23,]),'resource':([3,151,152,],[24,242,242,]),'resource_collector':([3,151,152,],[25,246,246,]),'class':([3,151,152,],[26,243,243,]),'if':([3,],[27,]),'unless':([3,],[28,]),'case':([3,151,152,],[29,244,244,]),'chaining':([3,151,152,],[30,241,241,]),'array':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,114,118,119,121,122,123,124,126,127,128,138,146,151,152,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,194,31,31,31,31,31,31,31,31,31,31,31,252,252,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'key':([3,11,13,16,17,19,42,47,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,113,118,119,120,121,122,123,124,126,127,128,138,146,151,152,178,183,187,198,204,219,224,225,226,258,263,265,266,267,268,269,270,271,273,281,282,283,284,289,290,321,323,349,381,383,387,397,],[42,100,100,100,100,100,100,138,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,187,191,100,100,191,100,100,100,100,100,138,100,100,100,249,249,100,100,100,100,100,100,138,100,100,100,191,100,100,191,100,100,100,100,100,100,100,100,100,100,191,100,100,100,100,100,100,100,]),'regex':([3,11,13,16,17,19,42,47,48,52,53,54,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,100,111,112,118,119,121,122,123,124,126,127,128,138,146,151,152,178,183,187,198,204,219,224,225,226,258,265,266,268,269,270,271,273,281,282,283,284,289,321,323,349,381,383,387,397,],[43,43,43,43,43,43,43,43,142,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'chaining_value':([3,151,152,],[55,240,253,]),'referencelist':([3,151,152,],[69,69,69,]),'expressionlist':([13,42,70,100,118,119,122,126,128,138,187,258,321,],[103,125,155,125,199,200,206,213,218,125,125,325,367,]),'expressionlist_items':([13,42,70,100,118,119,122,126,128,138,187,258,321,],[104,104,104,104,104,104,104,104,104,104,104,104,104,]),'start_regex':([18,],[109,]),'keyvalue_pairs':([47,127,],[133,133,]),'keyvalue_pairs_items':([47,127,],[134,134,]),'keyvalue':([47,127,224,],[136,136,306,]),'class_header':([51,],[145,]),'attributes':([112,113,120,263,290,],[182,189,201,327,347,]),'attributes_items':([112,113,120,263,290,],[184,184,184,184,184,]),'attribute':([112,113,120,263,267,290,],[188,188,188,188,330,188,]),'rc_expression':([121,204,281,282,283,284,],[202,285,340,341,342,343,]),'resource_list':([124,127,146,198,273,323,],[208,215,234,276,335,215,]),'resource_list_items':([124,127,146,198,273,323,],[209,209,209,209,209,209,]),'resource_body':([124,127,146,198,273,289,323,],[211,211,211,211,211,346,211,]),'lambda':([175,287,369,],[259,345,391,]),'parameters':([222,231,235,260,],[298,313,317,326,]),'data_type':([222,231,235,260,353,380,],[299,299,299,299,299,399,]),'parameters_items':([222,231,235,260,],[300,300,300,300,]),'parameter':([222,231,235,260,353,],[302,302,302,302,382,]),'matches':([239,],[321,]),'match':([321,],[366,]),'elsif':([363,438,],[386,443,]),'start_docs':([373,374,411,412,],[393,394,424,425,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> block','program',1,'p_program','parser.py',983),
+  ('class -> CLASS class_header LBRACKET block RBRACKET','class',5,'p_class','parser.py',987),
+  ('class_header -> ID LPAREN parameters RPAREN','class_header',4,'p_class_header','parser.py',1000),
+  ('class_header -> ID','class_header',1,'p_class_header_no_parameters','parser.py',1006),
+  ('class_header -> ID LPAREN parameters RPAREN INHERITS ID','class_header',6,'p_class_header_pars_inherits','parser.py',1012),
+  ('class_header -> ID INHERITS ID','class_header',3,'p_class_header_inherits','parser.py',1020),
+  ('class -> CLASS LBRACKET resource_list RBRACKET','class',4,'p_class_resource_declaration','parser.py',1028),
+  ('node -> NODE STRING LBRACKET block RBRACKET','node',5,'p_node','parser.py',1052),
+  ('node -> NODE ID LBRACKET block RBRACKET','node',5,'p_node_id','parser.py',1063),
+  ('node -> NODE regex LBRACKET block RBRACKET','node',5,'p_node_regex','parser.py',1074),
+  ('node -> NODE DEFAULT LBRACKET block RBRACKET','node',5,'p_node_default','parser.py',1085),
+  ('assignment -> ID EQUAL expression','assignment',3,'p_assignment','parser.py',1096),
+  ('assignment -> access EQUAL expression','assignment',3,'p_assignment_access','parser.py',1114),
+  ('assignment -> array EQUAL array','assignment',3,'p_assignment_array','parser.py',1120),
+  ('assignment -> array EQUAL hash','assignment',3,'p_assignment_hash','parser.py',1139),
+  ('assignment -> TYPE ID_TYPE EQUAL expression','assignment',4,'p_assignment_type_alias','parser.py',1160),
+  ('block -> statements','block',1,'p_block','parser.py',1178),
+  ('block -> statements expression','block',2,'p_block_return','parser.py',1182),
+  ('statements -> statements statement','statements',2,'p_statements','parser.py',1187),
+  ('statements -> empty','statements',1,'p_statements_empty','parser.py',1192),
+  ('statements -> statements error','statements',2,'p_statements_error','parser.py',1196),
+  ('resource -> ID LBRACKET resource_list RBRACKET','resource',4,'p_resource_id','parser.py',1203),
+  ('resource -> key LBRACKET resource_list RBRACKET','resource',4,'p_resource','parser.py',1257),
+  ('resource_list -> resource_list_items','resource_list',1,'p_resource_list','parser.py',1302),
+  ('resource_list -> resource_list_items DOT_COMMA','resource_list',2,'p_resource_list_trailing','parser.py',1306),
+  ('resource_list -> empty','resource_list',1,'p_resource_list_empty','parser.py',1310),
+  ('resource_list_items -> resource_list_items DOT_COMMA resource_body','resource_list_items',3,'p_resource_list_items','parser.py',1314),
+  ('resource_list_items -> resource_body','resource_list_items',1,'p_resource_list_items_single','parser.py',1319),
+  ('resource_body -> expression COLON attributes','resource_body',3,'p_resource_body','parser.py',1323),
+  ('resource -> AT ID LBRACKET resource_list RBRACKET','resource',5,'p_virtual_resource','parser.py',1344),
+  ('resource -> AT AT ID LBRACKET resource_list RBRACKET','resource',6,'p_exported_resource','parser.py',1394),
+  ('resource -> reference LBRACKET expression COLON attributes RBRACKET','resource',6,'p_abstract_resource','parser.py',1445),
+  ('resource -> reference LBRACKET attributes RBRACKET','resource',4,'p_change_resource','parser.py',1459),
+  ('resource -> resource_collector LBRACKET attributes RBRACKET','resource',4,'p_change_resource_collector','parser.py',1471),
+  ('resource -> ID_TYPE LBRACKET attributes RBRACKET','resource',4,'p_resource_default','parser.py',1483),
+  ('resource -> DEFINE ID LPAREN parameters RPAREN LBRACKET block RBRACKET','resource',8,'p_resource_declaration','parser.py',1502),
+  ('resource -> DEFINE ID LBRACKET block RBRACKET','resource',5,'p_resource_declaration_no_parameters','parser.py',1514),
+  ('resource_collector -> ID_TYPE LANGLEBRACKET rc_expression RANGLEBRACKET','resource_collector',4,'p_resource_collector','parser.py',1526),
+  ('resource_collector -> ID_TYPE LANGLEBRACKET RANGLEBRACKET','resource_collector',3,'p_resource_collector_empty','parser.py',1537),
+  ('rc_expression -> rc_expression CMP_EQUAL rc_expression','rc_expression',3,'p_resource_collector_expression_equal','parser.py',1548),
+  ('rc_expression -> rc_expression CMP_NOT_EQUAL rc_expression','rc_expression',3,'p_resource_collector_expression_not_equal','parser.py',1554),
+  ('rc_expression -> rc_expression BOOL_AND rc_expression','rc_expression',3,'p_resource_collector_expression_and','parser.py',1560),
+  ('rc_expression -> rc_expression BOOL_OR rc_expression','rc_expression',3,'p_resource_collector_expression_or','parser.py',1566),
+  ('rc_expression -> LPAREN rc_expression RPAREN','rc_expression',3,'p_resource_collector_expression_paren','parser.py',1572),
+  ('rc_expression -> expression','rc_expression',1,'p_resource_collector_expression_value','parser.py',1576),
+  ('parameters -> parameters_items','parameters',1,'p_parameters','parser.py',1580),
+  ('parameters -> parameters_items COMMA','parameters',2,'p_parameters_trailing','parser.py',1584),
+  ('parameters -> empty','parameters',1,'p_parameters_empty','parser.py',1588),
+  ('parameters_items -> parameters_items COMMA parameter','parameters_items',3,'p_parameters_items','parser.py',1592),
+  ('parameters_items -> parameter','parameters_items',1,'p_parameters_items_single','parser.py',1597),
+  ('parameter -> data_type ID EQUAL expression','parameter',4,'p_parameter','parser.py',1601),
+  ('parameter -> data_type ID','parameter',2,'p_parameter_no_default','parser.py',1607),
+  ('parameter -> ID','parameter',1,'p_parameter_only_name','parser.py',1619),
+  ('parameter -> ID EQUAL expression','parameter',3,'p_parameter_default_without_type','parser.py',1631),
+  ('parameter -> ID ARITH_MUL ID EQUAL expression','parameter',5,'p_parameter_extra','parser.py',1643),
+  ('parameter -> ID ARITH_MUL ID','parameter',3,'p_parameter_no_default_extra','parser.py',1655),
+  ('parameter -> ARITH_MUL ID','parameter',2,'p_parameter_only_name_extra','parser.py',1667),
+  ('parameter -> ARITH_MUL ID EQUAL expression','parameter',4,'p_parameter_default_without_type_extra','parser.py',1679),
+  ('attributes -> attributes_items','attributes',1,'p_attributes','parser.py',1691),
+  ('attributes -> attributes_items COMMA','attributes',2,'p_attributes_trailing','parser.py',1695),
+  ('attributes -> empty','attributes',1,'p_attributes_empty','parser.py',1699),
+  ('attributes_items -> attributes_items COMMA attribute','attributes_items',3,'p_attributes_items','parser.py',1703),
+  ('attributes_items -> attribute','attributes_items',1,'p_attributes_items_single','parser.py',1708),
+  ('attribute -> ID HASH_ROCKET expression','attribute',3,'p_attribute','parser.py',1712),
+  ('attribute -> key HASH_ROCKET expression','attribute',3,'p_attribute_key','parser.py',1723),
+  ('attribute -> ARITH_MUL HASH_ROCKET expression','attribute',3,'p_attribute_splat','parser.py',1727),
+  ('attribute -> ID PLUSIGNMENT expression','attribute',3,'p_attribute_plussign','parser.py',1738),
+  ('attribute -> key PLUSIGNMENT expression','attribute',3,'p_attribute_key_plussign','parser.py',1749),
+  ('attribute -> ARITH_MUL PLUSIGNMENT expression','attribute',3,'p_attribute_splat_plussign','parser.py',1753),
+  ('key -> DEFAULT','key',1,'p_key_default','parser.py',1764),
+  ('key -> NODE','key',1,'p_key_node','parser.py',1774),
+  ('key -> SITE','key',1,'p_key_site','parser.py',1784),
+  ('key -> IMPORT','key',1,'p_key_import','parser.py',1794),
+  ('key -> UNLESS','key',1,'p_key_unless','parser.py',1804),
+  ('key -> TYPE','key',1,'p_key_type','parser.py',1814),
+  ('key -> INCLUDE','key',1,'p_key_include','parser.py',1824),
+  ('key -> REQUIRE','key',1,'p_key_require','parser.py',1834),
+  ('key -> CONTAIN','key',1,'p_key_contain','parser.py',1844),
+  ('key -> TAG','key',1,'p_key_tag','parser.py',1854),
+  ('key -> DEBUG','key',1,'p_key_debug','parser.py',1864),
+  ('key -> INFO','key',1,'p_key_info','parser.py',1874),
+  ('key -> NOTICE','key',1,'p_key_notice','parser.py',1884),
+  ('key -> WARNING','key',1,'p_key_warning','parser.py',1894),
+  ('key -> ERR','key',1,'p_key_err','parser.py',1904),
+  ('key -> FAIL','key',1,'p_attributekey_fail','parser.py',1914),
+  ('key -> REALIZE','key',1,'p_key_realize','parser.py',1924),
+  ('array -> LPARENR expressionlist RPARENR','array',3,'p_array','parser.py',1934),
+  ('hash -> LBRACKET keyvalue_pairs RBRACKET','hash',3,'p_hash','parser.py',1944),
+  ('keyvalue_pairs -> keyvalue_pairs_items','keyvalue_pairs',1,'p_keyvalue_pairs','parser.py',1957),
+  ('keyvalue_pairs -> keyvalue_pairs_items COMMA','keyvalue_pairs',2,'p_keyvalue_pairs_trailing','parser.py',1961),
+  ('keyvalue_pairs -> empty','keyvalue_pairs',1,'p_keyvalue_pairs_empty','parser.py',1965),
+  ('keyvalue_pairs_items -> keyvalue_pairs_items COMMA keyvalue','keyvalue_pairs_items',3,'p_keyvalue_pairs_items','parser.py',1969),
+  ('keyvalue_pairs_items -> keyvalue','keyvalue_pairs_items',1,'p_keyvalue_pairs_items_single','parser.py',1974),
+  ('keyvalue -> expression HASH_ROCKET expression','keyvalue',3,'p_keyvalue','parser.py',1978),
+  ('keyvalue -> key HASH_ROCKET expression','keyvalue',3,'p_keyvalue_key','parser.py',1982),
+  ('expressionlist -> expressionlist_items','expressionlist',1,'p_expressionlist','parser.py',1986),
+  ('expressionlist -> expressionlist_items COMMA','expressionlist',2,'p_expressionlist_trailing','parser.py',1991),
+  ('expressionlist -> empty','expressionlist',1,'p_expressionlist_empty','parser.py',1996),
+  ('expressionlist_items -> expressionlist_items COMMA expression','expressionlist_items',3,'p_expressionlist_items','parser.py',2000),
+  ('expressionlist_items -> expression','expressionlist_items',1,'p_expressionlist_items_single','parser.py',2006),
+  ('expression -> value','expression',1,'p_expression','parser.py',2012),
+  ('expression -> function_call','expression',1,'p_expression_function_call','parser.py',2017),
+  ('expression -> statement_function','expression',1,'p_expression_statement_function','parser.py',2022),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_paren','parser.py',2027),
+  ('expression -> assignment','expression',1,'p_expression_assignment','parser.py',2032),
+  ('expression -> expression LPARENR INTEGER COMMA INTEGER RPARENR','expression',6,'p_expression_access_section','parser.py',2037),
+  ('expression -> expression QUESTION_MARK hash','expression',3,'p_expression_selector','parser.py',2050),
+  ('expression -> expression CMP_EQUAL expression','expression',3,'p_expression_equal','parser.py',2063),
+  ('expression -> expression CMP_NOT_EQUAL expression','expression',3,'p_expression_not_equal','parser.py',2070),
+  ('expression -> expression CMP_LESS_THAN expression','expression',3,'p_expression_less_than','parser.py',2077),
+  ('expression -> expression CMP_GREATER_THAN expression','expression',3,'p_expression_greater_than','parser.py',2084),
+  ('expression -> expression CMP_LESS_THAN_OR_EQUAL expression','expression',3,'p_expression_less_than_or_equal','parser.py',2091),
+  ('expression -> expression CMP_GREATER_THAN_OR_EQUAL expression','expression',3,'p_expression_greater_than_or_equal','parser.py',2098),
+  ('expression -> expression CMP_REGEX_MATCH expression','expression',3,'p_expression_regex_match','parser.py',2105),
+  ('expression -> expression CMP_REGEX_NOT_MATCH expression','expression',3,'p_expression_regex_not_match','parser.py',2112),
+  ('expression -> expression CMP_IN expression','expression',3,'p_expression_in','parser.py',2119),
+  ('expression -> expression BOOL_AND expression','expression',3,'p_expression_and','parser.py',2127),
+  ('expression -> expression BOOL_OR expression','expression',3,'p_expression_or','parser.py',2134),
+  ('expression -> BOOL_NOT expression','expression',2,'p_expression_not','parser.py',2141),
+  ('expression -> ARITH_SUB expression','expression',2,'p_expression_negation','parser.py',2154),
+  ('expression -> expression ARITH_ADD expression','expression',3,'p_expression_addition','parser.py',2167),
+  ('expression -> expression ARITH_SUB expression','expression',3,'p_expression_subtraction','parser.py',2175),
+  ('expression -> expression ARITH_DIV expression','expression',3,'p_expression_division','parser.py',2182),
+  ('expression -> expression ARITH_MUL expression','expression',3,'p_expression_multiplication','parser.py',2189),
+  ('expression -> expression ARITH_MOD expression','expression',3,'p_expression_modulo','parser.py',2196),
+  ('expression -> expression ARITH_LSHIFT expression','expression',3,'p_expression_left_shift','parser.py',2204),
+  ('expression -> expression ARITH_RSHIFT expression','expression',3,'p_expression_right_shift','parser.py',2211),
+  ('expression -> ARITH_MUL expression','expression',2,'p_expression_splat','parser.py',2219),
+  ('expression -> access','expression',1,'p_expression_access','parser.py',2231),
+  ('access -> expression LPARENR expressionlist RPARENR','access',4,'p_access','parser.py',2236),
+  ('expression -> reference','expression',1,'p_expression_reference','parser.py',2249),
+  ('reference -> ID_TYPE LPARENR expressionlist RPARENR','reference',4,'p_reference','parser.py',2254),
+  ('statement_function -> key expressionlist','statement_function',2,'p_statement_function','parser.py',2266),
+  ('statement_function -> key LPAREN expressionlist RPAREN','statement_function',4,'p_statement_function_paren','parser.py',2277),
+  ('function_call -> ID LPAREN expressionlist RPAREN','function_call',4,'p_function_call_prefix','parser.py',2283),
+  ('function_call -> TYPE LPAREN expressionlist RPAREN','function_call',4,'p_function_call_type','parser.py',2302),
+  ('function_call -> ID_TYPE LPAREN expressionlist RPAREN','function_call',4,'p_function_call_id_type','parser.py',2321),
+  ('function_call -> ID LPAREN expressionlist RPAREN lambda','function_call',5,'p_function_call_prefix_lambda','parser.py',2340),
+  ('function_call -> expression DOT ID','function_call',3,'p_function_call_chained','parser.py',2359),
+  ('function_call -> expression DOT ID LPAREN expressionlist RPAREN','function_call',6,'p_function_call_chained_args','parser.py',2378),
+  ('function_call -> expression DOT ID lambda','function_call',4,'p_function_call_chained_lambda','parser.py',2397),
+  ('function_call -> expression DOT ID LPAREN expressionlist RPAREN lambda','function_call',7,'p_function_call_chained_lambda_args','parser.py',2410),
+  ('lambda -> BAR parameters BAR LBRACKET block RBRACKET','lambda',6,'p_lambda','parser.py',2423),
+  ('function_call -> SENSITIVE LPAREN STRING RPAREN','function_call',4,'p_sensitive','parser.py',2434),
+  ('function_call -> SENSITIVE DOT ID LPAREN STRING RPAREN','function_call',6,'p_sensitive_id','parser.py',2446),
+  ('chaining -> chaining_value CHAINING_LEFT chaining_value','chaining',3,'p_chaining_left','parser.py',2459),
+  ('chaining -> chaining_value CHAINING_RIGHT chaining_value','chaining',3,'p_chaining_right','parser.py',2463),
+  ('chaining_value -> chaining','chaining_value',1,'p_chaining_value','parser.py',2467),
+  ('chaining_value -> referencelist','chaining_value',1,'p_chaining_value_array','parser.py',2471),
+  ('chaining_value -> resource','chaining_value',1,'p_chaining_value_resource','parser.py',2478),
+  ('chaining_value -> class','chaining_value',1,'p_chaining_value_class','parser.py',2482),
+  ('chaining_value -> case','chaining_value',1,'p_chaining_value_case','parser.py',2486),
+  ('chaining_value -> value','chaining_value',1,'p_chaining_value_id','parser.py',2490),
+  ('chaining_value -> resource_collector','chaining_value',1,'p_chaining_value_collector','parser.py',2494),
+  ('referencelist -> referencelist COMMA reference','referencelist',3,'p_referencelist','parser.py',2498),
+  ('referencelist -> reference','referencelist',1,'p_referencelist_single','parser.py',2503),
+  ('statement -> function','statement',1,'p_statement_func','parser.py',2510),
+  ('statement -> function_call','statement',1,'p_statement_function_call','parser.py',2514),
+  ('statement -> assignment','statement',1,'p_statement_assignment','parser.py',2518),
+  ('statement -> node','statement',1,'p_statement_node','parser.py',2522),
+  ('statement -> resource','statement',1,'p_statement_resource','parser.py',2526),
+  ('statement -> resource_collector','statement',1,'p_statement_resource_collector','parser.py',2530),
+  ('statement -> class','statement',1,'p_statement_class','parser.py',2534),
+  ('statement -> if','statement',1,'p_statement_if','parser.py',2538),
+  ('statement -> unless','statement',1,'p_statement_unless','parser.py',2542),
+  ('statement -> case','statement',1,'p_statement_case','parser.py',2546),
+  ('statement -> chaining','statement',1,'p_statement_chaining','parser.py',2550),
+  ('statement -> statement_function','statement',1,'p_statement_statement_function_function','parser.py',2554),
+  ('function -> FUNCTION ID LPAREN parameters RPAREN LBRACKET block RBRACKET','function',8,'p_function','parser.py',2559),
+  ('function -> FUNCTION ID LPAREN parameters RPAREN ARITH_RSHIFT data_type LBRACKET block RBRACKET','function',10,'p_function_return','parser.py',2572),
+  ('if -> IF expression LBRACKET block RBRACKET','if',5,'p_if','parser.py',2586),
+  ('if -> IF expression LBRACKET block RBRACKET elsif','if',6,'p_if_elsif','parser.py',2598),
+  ('elsif -> ELSIF expression LBRACKET block RBRACKET','elsif',5,'p_elif','parser.py',2610),
+  ('elsif -> ELSIF expression LBRACKET block RBRACKET elsif','elsif',6,'p_elif_elif','parser.py',2622),
+  ('elsif -> ELSE LBRACKET block RBRACKET','elsif',4,'p_else','parser.py',2634),
+  ('unless -> UNLESS expression LBRACKET block RBRACKET','unless',5,'p_unless','parser.py',2646),
+  ('unless -> UNLESS expression LBRACKET block RBRACKET ELSE LBRACKET block RBRACKET','unless',9,'p_unless_else','parser.py',2658),
+  ('case -> CASE expression LBRACKET matches RBRACKET','case',5,'p_case','parser.py',2679),
+  ('matches -> matches match','matches',2,'p_matches','parser.py',2690),
+  ('matches -> empty','matches',1,'p_matches_empty','parser.py',2695),
+  ('match -> expressionlist COLON LBRACKET block RBRACKET','match',5,'p_match','parser.py',2699),
+  ('data_type -> ID_TYPE','data_type',1,'p_data_type','parser.py',2711),
+  ('data_type -> reference','data_type',1,'p_data_type_reference','parser.py',2721),
+  ('value -> hash','value',1,'p_value_hash','parser.py',2726),
+  ('value -> array','value',1,'p_value_array','parser.py',2730),
+  ('value -> STRING','value',1,'p_value_string','parser.py',2734),
+  ('value -> AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID_TYPE','value',10,'p_value_string_docs','parser.py',2743),
+  ('value -> AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE','value',11,'p_value_string_docs_sub','parser.py',2753),
+  ('value -> AT LPAREN STRING COLON ID ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID_TYPE','value',12,'p_value_string_docs_syntax','parser.py',2763),
+  ('value -> AT LPAREN STRING COLON ID ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE','value',13,'p_value_string_docs_syntax_sub','parser.py',2773),
+  ('value -> AT LPAREN STRING ARITH_DIV ID_TYPE RPAREN start_docs STRING BAR ID','value',10,'p_value_string_docs_id','parser.py',2783),
+  ('value -> AT LPAREN STRING ARITH_DIV ID RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE','value',11,'p_value_string_docs_sub_id','parser.py',2793),
+  ('value -> AT LPAREN STRING COLON ID ARITH_DIV ID RPAREN start_docs STRING BAR ID_TYPE','value',12,'p_value_string_docs_syntax_id','parser.py',2803),
+  ('value -> AT LPAREN STRING COLON ID ARITH_DIV ID RPAREN start_docs STRING BAR ARITH_SUB ID_TYPE','value',13,'p_value_string_docs_syntax_sub_id','parser.py',2813),
+  ('start_docs -> <empty>','start_docs',0,'p_start_docs','parser.py',2823),
+  ('value -> FALSE','value',1,'p_value_false','parser.py',2827),
+  ('value -> TRUE','value',1,'p_value_true','parser.py',2837),
+  ('value -> INTEGER','value',1,'p_value_integer','parser.py',2847),
+  ('value -> HEXA_INTEGER','value',1,'p_value_hexa_integer','parser.py',2857),
+  ('value -> OCT_INTEGER','value',1,'p_value_oct_integer','parser.py',2867),
+  ('value -> FLOAT','value',1,'p_value_float','parser.py',2877),
+  ('value -> ID','value',1,'p_value_id','parser.py',2887),
+  ('value -> ID_TYPE','value',1,'p_value_type_id','parser.py',2897),
+  ('value -> UNDEF','value',1,'p_value_undef','parser.py',2907),
+  ('value -> key','value',1,'p_value_stat_func','parser.py',2917),
+  ('value -> regex','value',1,'p_value_regex','parser.py',2921),
+  ('regex -> ARITH_DIV start_regex REGEXPRESSION ARITH_DIV','regex',4,'p_regex','parser.py',2925),
+  ('start_regex -> <empty>','start_regex',0,'p_start_regex','parser.py',2935),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',2939),
+]
@@ -0,0 +1,348 @@
+"""Structural queries over the object model.
+
+A query is a path of steps, such as
+``Resource[type=file]/Attribute[key=mode]/Value:str``. Each step names the
+class of the elements it matches, or ``*`` for any, and can be followed by
+conditions on their fields in brackets and, for ``Value`` and ``*``, by the
+type of their value after a colon. Steps are separated by ``/`` for children and by ``//`` for
+descendants, and the first step matches anywhere in the tree.
+
+Classes match exactly, as element kinds: ``Value`` matches literals but not
+identifiers, hashes, arrays or regexes, which have their own classes. A
+condition ``field=literal`` or ``field!=literal`` compares the field, or its
+value when it is a :class:`~puppetparser.model.Value`, with the literal,
+which is a quoted string, a number, ``true``, ``false``, ``undef`` or a bare
+word; ``[field]`` alone tests that the field is set. The types are ``str``,
+``int``, ``float``, ``bool`` and ``undef``.
+
+:func:`compile` turns a query into a :class:`Query` once, and
+:meth:`Query.run` matches it against an :class:`Index` of a tree, whose
+tables of elements by class and of resources by type are built when they are
+first needed.
+"""
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    NoReturn,
+    Tuple,
+    Union,
+    cast,
+)
+
+from puppetparser.arena import FIELDS, KINDS
+from puppetparser.batch import ParseResult
+from puppetparser.model import CodeElement, Resource, Value
+from puppetparser.visitor import children, unique, walk
+
+Tree = Union[CodeElement, Iterable[CodeElement]]
+
+
+class _Models(Dict[type, type | None]):
+    # The model class of an element, through the bases of arena views
+    def __missing__(self, cls: type) -> type | None:
+        model = next((base for base in cls.__mro__ if base in FIELDS), None)
+        self[cls] = model
+        return model
+
+
+_MODELS = _Models()
+
+
+class Index:
+    """The elements of a tree by class, and its resources by type.
+
+    Both tables are built on first use, and kept for the next queries.
+    """
+
+    def __init__(self, tree: Tree, path: str = "") -> None:
+        self.tree = tree
+        self.path = path
+        self._all: List[CodeElement] = []
+        self._by_class: Dict[type, List[CodeElement]] | None = None
+        self._by_type: Dict[Any, List[CodeElement]] | None = None
+
+    def _build(self) -> Dict[type, List[CodeElement]]:
+        self._all = list(unique(walk(self.tree)))
+        by_cls: Dict[type, List[CodeElement]] = {}
+        for element in self._all:
+            try:
+                by_cls[element.__class__].append(element)
+            except KeyError:
+                by_cls[element.__class__] = [element]
+        # Arena views are filed under their model class
+        by_class: Dict[type, List[CodeElement]] = {}
+        for cls, nodes in by_cls.items():
+            model = _MODELS[cls]
+            if model in by_class:
+                nodes = [e for e in self._all if _MODELS[e.__class__] is model]
+            if model is not None:
+                by_class[model] = nodes
+        self._by_class = by_class
+        return by_class
+
+    def of_class(self, cls: type | None) -> List[CodeElement]:
+        """Elements of class ``cls`` in preorder, or all of them if None."""
+        by_class = self._by_class if self._by_class is not None else self._build()
+        if cls is not None:
+            return by_class.get(cls, [])
+        return self._all
+
+    def resources_of_type(self, type: Any) -> List[CodeElement]:
+        """Resources whose type is ``type``, in preorder."""
+        if self._by_type is None:
+            by_type: Dict[Any, List[CodeElement]] = {}
+            for element in self.of_class(Resource):
+                resource = cast(Resource, element)
+                by_type.setdefault(_value(resource.type), []).append(resource)
+            self._by_type = by_type
+        return self._by_type.get(type, [])
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, Value):
+        payload: Any = cast(Value[Any], value).value
+        return payload
+    return value
+
+
+_TYPES: Dict[str, type] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "undef": type(None),
+}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<sep>//|/)
+      | (?P<name>\*|[A-Za-z_][A-Za-z_0-9]*)
+      | (?P<punct>!=|[\[\],=:])
+      | '(?P<single>(?:[^'\\]|\\.)*)'
+      | "(?P<double>(?:[^"\\]|\\.)*)"
+      | (?P<word>[^\s/\[\],=!:'"]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _literal(kind: str, text: str) -> Any:
+    if kind in ("single", "double"):
+        return re.sub(r"\\(.)", r"\1", text)
+    if text in ("true", "false"):
+        return text == "true"
+    if text == "undef":
+        return None
+    for number in (int, float):
+        try:
+            return number(text)
+        except ValueError:
+            pass
+    return text
+
+
+Test = Callable[[Any], bool]
+
+
+class _Step(NamedTuple):
+    descendant: bool
+    cls: type | None
+    tests: Tuple[Test, ...]
+    # Whether the elements are the resources of a type, from the index
+    indexed: bool
+    resource_type: Any
+
+
+def _equals(field: str, literal: Any, negate: bool) -> Test:
+    literal_cls = literal.__class__
+
+    def test(element: Any) -> bool:
+        value = _value(getattr(element, field, None))
+        return (value.__class__ is literal_cls and value == literal) is not negate
+
+    return test
+
+
+def _is_set(field: str) -> Test:
+    def test(element: Any) -> bool:
+        return getattr(element, field, None) is not None
+
+    return test
+
+
+def _of_type(cls: type) -> Test:
+    def test(element: Any) -> bool:
+        if not isinstance(element, Value):
+            return False
+        payload: Any = cast(Value[Any], element).value
+        return payload.__class__ is cls
+
+    return test
+
+
+class _Compiler:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens: List[Tuple[str, str, int]] = []
+        pos = 0
+        while pos < len(text):
+            match = _TOKEN.match(text, pos)
+            if match is None or match.end() == pos:
+                if text[pos:].strip():
+                    self.error(pos, "unexpected character")
+                break
+            kind = match.lastgroup or ""
+            self.tokens.append((kind, match.group(kind), match.start(kind)))
+            pos = match.end()
+        self.next = 0
+
+    def error(self, pos: int, message: str) -> NoReturn:
+        raise ValueError(f"Invalid query {self.text!r} at {pos}: {message}")
+
+    def peek(self, value: str | None = None) -> bool:
+        if self.next >= len(self.tokens):
+            return False
+        kind, text, _ = self.tokens[self.next]
+        return value is None or (text == value and kind in ("sep", "punct"))
+
+    def take(self, *kinds: str) -> Tuple[str, str, int]:
+        if self.next >= len(self.tokens):
+            self.error(len(self.text), "unexpected end")
+        token = self.tokens[self.next]
+        if token[0] not in kinds:
+            self.error(token[2], f"unexpected {token[1]!r}")
+        self.next += 1
+        return token
+
+    def expect(self, value: str) -> None:
+        _, text, pos = self.take("punct", "sep")
+        if text != value:
+            self.error(pos, f"expected {value!r}")
+
+    def steps(self) -> List[_Step]:
+        steps = [self.step(True, True)]
+        while self.peek():
+            _, sep, _ = self.take("sep")
+            steps.append(self.step(sep == "//", False))
+        return steps
+
+    def step(self, descendant: bool, first: bool) -> _Step:
+        _, name, pos = self.take("name")
+        cls = None
+        if name != "*":
+            cls = next((kind for kind in KINDS if kind.__name__ == name), None)
+            if cls is None:
+                self.error(pos, f"unknown class {name!r}")
+        conditions: List[Tuple[str, str, Any]] = []
+        while self.peek("["):
+            self.expect("[")
+            while True:
+                _, field, pos = self.take("name")
+                if cls is not None and field not in FIELDS[cls]:
+                    self.error(pos, f"{name} has no field {field!r}")
+                op, literal = "", None
+                if self.peek("=") or self.peek("!="):
+                    _, op, _ = self.take("punct")
+                    kind, text, _ = self.take("name", "word", "single", "double")
+                    literal = _literal(kind, text)
+                conditions.append((field, op, literal))
+                if not self.peek(","):
+                    break
+                self.expect(",")
+            self.expect("]")
+
+        # The first step looks resources up by type in the index
+        indexed, resource_type = False, None
+        if first and cls is Resource:
+            for i, (field, op, literal) in enumerate(conditions):
+                if field == "type" and op == "=":
+                    indexed, resource_type = True, literal
+                    del conditions[i]
+                    break
+        tests: List[Test] = []
+        for field, op, literal in conditions:
+            if op:
+                tests.append(_equals(field, literal, op == "!="))
+            else:
+                tests.append(_is_set(field))
+        if self.peek(":"):
+            self.expect(":")
+            _, type_name, pos = self.take("name")
+            if cls is not None and cls is not Value:
+                self.error(pos, f"{name} has no type, only Value does")
+            if type_name not in _TYPES:
+                self.error(pos, f"unknown type {type_name!r}")
+            tests.append(_of_type(_TYPES[type_name]))
+        return _Step(descendant, cls, tuple(tests), indexed, resource_type)
+
+
+class Query:
+    """A compiled query. See :mod:`puppetparser.query` for the syntax."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.steps = _Compiler(text).steps()
+
+    def __repr__(self) -> str:
+        return f"Query({self.text!r})"
+
+    def run(self, index: Index | Tree) -> List[CodeElement]:
+        """The elements that match, from an index or a tree, in the order in
+        which the last step finds them."""
+        if not isinstance(index, Index):
+            index = Index(index)
+        first = self.steps[0]
+        if first.indexed:
+            nodes = index.resources_of_type(first.resource_type)
+        else:
+            nodes = index.of_class(first.cls)
+        nodes = _filter(nodes, first.tests)
+        models = _MODELS
+        for step in self.steps[1:]:
+            cls, tests = step.cls, step.tests
+            found: List[CodeElement] = []
+            for node in nodes:
+                below = walk(children(node)) if step.descendant else children(node)
+                for child in below:
+                    if cls is not None and models[child.__class__] is not cls:
+                        continue
+                    if all(test(child) for test in tests):
+                        found.append(child)
+            # Nodes under several of the previous ones are found once
+            nodes = list(unique(found))
+        return nodes
+
+    def run_many(
+        self, indexes: Iterable[Index | ParseResult]
+    ) -> Iterator[Tuple[str, List[CodeElement]]]:
+        """Run on many parses, given as indexes or as results of
+        :func:`puppetparser.parse_many`, and yield the path and the matches
+        of those that have any. Results that failed to parse are skipped.
+        Indexes are kept by the caller between queries, and results are
+        indexed again for each query."""
+        for item in indexes:
+            if isinstance(item, ParseResult):
+                if item.elements is None:
+                    continue
+                item = Index(item.elements, item.path)
+            matches = self.run(item)
+            if matches:
+                yield item.path, matches
+
+
+def _filter(nodes: List[CodeElement], tests: Tuple[Test, ...]) -> List[CodeElement]:
+    if not tests:
+        return list(nodes)
+    return [node for node in nodes if all(test(node) for test in tests)]
+
+
+def compile(text: str) -> Query:
+    """Compile ``text`` into a :class:`Query`. Raises ValueError if it is not
+    a valid query."""
+    return Query(text)
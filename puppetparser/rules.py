@@ -0,0 +1,249 @@
+"""Checks of the object model that share a single traversal.
+
+A :class:`Rule` declares the classes of elements it looks at with
+``visit_<Class>`` methods, as a :class:`~puppetparser.visitor.Visitor` does,
+and reports :class:`Finding` objects. An :class:`Engine` walks each tree once
+for all of its rules, calling on each element the list of methods that its
+class dispatches to, and can time each rule. :func:`check_many` parses and
+checks many scripts on a pool of worker processes.
+"""
+import os
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
+
+from puppetparser.arena import FIELDS
+from puppetparser.batch import (
+    Source,
+    parse_source,
+    run_on_pool,
+    source_name,
+    worker_parser,
+)
+from puppetparser.model import CodeElement
+from puppetparser.parser import Parser
+from puppetparser.visitor import unique, walk
+
+
+class Finding(NamedTuple):
+    path: str
+    rule: str
+    message: str
+    line: int
+    col: int
+    end_line: int
+    end_col: int
+
+
+class Rule:
+    """Base class of checks.
+
+    Subclasses define ``visit_<Class>`` methods that take an element of that
+    class, or of a class derived from it, and call :meth:`report` on what
+    they find. ``visit_Value`` is thus also called on identifiers, and a
+    check that is only about strings tests the type of ``node.value``.
+
+    ``name`` identifies the rule in findings and timings, and defaults to
+    the name of the class. A rule is used by a single engine at a time, and
+    can keep state between the elements of a script; :meth:`start` is
+    called before each script.
+    """
+
+    name: str = ""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "name" not in cls.__dict__:
+            cls.name = cls.__name__
+
+    def __init__(self) -> None:
+        self.path = ""
+        self.findings: List[Finding] = []
+
+    def start(self, path: str) -> None:
+        pass
+
+    def report(self, element: CodeElement, message: str) -> None:
+        self.findings.append(
+            Finding(
+                self.path,
+                self.name,
+                message,
+                element.line,
+                element.col,
+                element.end_line,
+                element.end_col,
+            )
+        )
+
+
+_Calls = Tuple[Callable[[Any], Any], ...]
+# Wraps the method of the i-th rule
+_Wrap = Callable[[int, Callable[[Any], Any]], Callable[[Any], Any]]
+
+
+def _untimed(i: int, method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return method
+
+
+class _CallsByClass(Dict[type, _Calls]):
+    # Bound visit_ methods of the rules for each element class, from the most
+    # derived model class that each rule has one for
+    def __init__(self, rules: Sequence[Rule], wrap: _Wrap) -> None:
+        super().__init__()
+        self.rules = rules
+        self.wrap = wrap
+
+    def __missing__(self, cls: type) -> _Calls:
+        models = [base for base in cls.__mro__ if base in FIELDS]
+        calls: List[Callable[[Any], Any]] = []
+        for i, rule in enumerate(self.rules):
+            for model in models:
+                method = getattr(rule, "visit_" + model.__name__, None)
+                if method is not None:
+                    calls.append(self.wrap(i, method))
+                    break
+        self[cls] = tuple(calls)
+        return self[cls]
+
+
+class Engine:
+    """Runs many rules in one traversal of each tree.
+
+    With ``timing``, the time spent in the methods of each rule is added up
+    in :attr:`timings`, by rule name. This costs two clock reads per call,
+    so it is off by default.
+    """
+
+    def __init__(self, rules: Iterable[Rule], timing: bool = False) -> None:
+        self.rules = list(rules)
+        self.timing = timing
+        self._times = [0.0] * len(self.rules)
+        wrap: _Wrap = self._timed if timing else _untimed
+        self._calls = _CallsByClass(self.rules, wrap)
+
+    def _timed(self, i: int, method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        times, clock = self._times, time.perf_counter
+
+        def call(element: Any) -> None:
+            start = clock()
+            method(element)
+            times[i] += clock() - start
+
+        return call
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Seconds spent in each rule so far, or nothing without timing."""
+        timings: Dict[str, float] = {}
+        if not self.timing:
+            return timings
+        for rule, seconds in zip(self.rules, self._times):
+            timings[rule.name] = timings.get(rule.name, 0.0) + seconds
+        return timings
+
+    def run(
+        self, tree: CodeElement | Iterable[CodeElement], path: str = ""
+    ) -> List[Finding]:
+        """Check ``tree``, a list of elements, an element or an arena, and
+        return the findings of all rules in the order of the traversal. Rules
+        see a node that is reachable from several places once."""
+        findings: List[Finding] = []
+        for rule in self.rules:
+            rule.path = path
+            rule.findings = findings
+            rule.start(path)
+        by_class = self._calls
+        for element in unique(walk(tree)):
+            calls = by_class[element.__class__]
+            if calls:
+                for call in calls:
+                    call(element)
+        return findings
+
+
+class CheckResult(NamedTuple):
+    path: str
+    findings: List[Finding] | None
+    error: Exception | None
+    timings: Dict[str, float]
+
+
+_worker_engine: Engine | None = None
+
+
+def init_worker(rules: Sequence[Rule], timing: bool = False) -> None:
+    """Executor initializer that builds the engine of a worker process."""
+    global _worker_engine
+    _worker_engine = Engine(rules, timing)
+    worker_parser()
+
+
+def _check_one(parser: Parser, engine: Engine, item: Source) -> CheckResult:
+    parsed = parse_source(parser, item)
+    if parsed.error is not None:
+        return CheckResult(parsed.path, None, parsed.error, {})
+    before = engine.timings
+    try:
+        findings = engine.run(parsed.elements or [], parsed.path)
+    except Exception as e:
+        return CheckResult(parsed.path, None, e, {})
+    timings = {k: v - before[k] for k, v in engine.timings.items()}
+    return CheckResult(parsed.path, findings, None, timings)
+
+
+def check_in_worker(item: Source) -> CheckResult:
+    """Parse and check a path or ``(name, source)`` pair with the worker's
+    parser and engine."""
+    assert _worker_engine is not None
+    return _check_one(worker_parser(), _worker_engine, item)
+
+
+def _failed(error: Exception, item: Source) -> CheckResult:
+    return CheckResult(source_name(item), None, error, {})
+
+
+def check_many(
+    rules: Sequence[Rule],
+    paths_or_sources: Iterable[Source],
+    workers: int | None = None,
+    ordered: bool = True,
+    timing: bool = False,
+) -> Iterator[CheckResult]:
+    """Parse and check many scripts on a pool of worker processes.
+
+    Items are given and results yielded as in
+    :func:`puppetparser.batch.parse_many`. Each worker checks its scripts with
+    its own copy of ``rules``, which must be picklable. A script that fails
+    to parse, or that makes a rule raise, has ``error`` set. With
+    ``timing``, the ``timings`` of each result are those of its script.
+    """
+    items = list(paths_or_sources)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(items))
+
+    if workers <= 1:
+        parser, engine = Parser(), Engine(rules, timing)
+        for item in items:
+            yield _check_one(parser, engine, item)
+        return
+
+    yield from run_on_pool(
+        check_in_worker,
+        items,
+        workers,
+        ordered,
+        _failed,
+        initializer=init_worker,
+        initargs=(list(rules), timing),
+    )
@@ -0,0 +1,226 @@
+"""Declarations and dependencies of a script, without parsing it.
+
+:func:`skim` scans the script with a single regex and matches braces to skip
+the bodies of blocks, which is enough to find the declarations made at the
+top level of a script and the classes it includes, requires or contains.
+The script is not validated.
+"""
+import re
+from typing import List, NamedTuple, Tuple
+
+from puppetparser.parser import OPERAND_END, keywords
+
+# One of the alternatives always matches after the skipped characters, so
+# that the regex never backtracks: unterminated strings and heredocs take the
+# rest of the script, as comments do
+_TOKEN = re.compile(
+    r"""
+    [^#/'"@A-Za-z_$:0-9={}()\[\],]*           # skipped, nothing starts there
+    (?:(\#[^\n]*|/\*[\s\S]*?(?:\*/|\Z))          # comment
+    |('(?:[^'\\]|\\[\s\S])*(?:'|\Z)
+     |"(?:[^"\\]|\\[\s\S])*(?:"|\Z))             # string
+    |(@\([^)]*(?:\)[^|]*)?)                   # heredoc, up to its end tag
+    |((?:[A-Za-z_$]|::)(?:[A-Za-z0-9_\-]|::)*)  # word
+    |(\d[\w.]*)                               # number
+    |(=>|[{}()\[\],=/])                      # punctuation
+    |[:@]|\Z)                                 # nothing
+    """,
+    re.VERBOSE,
+)
+_REGEX = re.compile(r"/(?:[^\\/]|\\[\s\S])+/")
+
+_COMMENT, _STRING, _HEREDOC, _WORD, _NUMBER, _PUNCT = range(1, 7)
+
+# Keywords after which a slash starts a regex
+_OPERATORS = {word for word, type in keywords.items() if type not in OPERAND_END}
+
+_DECLARATIONS = {"class", "define", "node", "function", "type"}
+_STATEMENT_FUNCTIONS = {"include", "require", "contain"}
+_KEYWORDS = _DECLARATIONS | _STATEMENT_FUNCTIONS
+
+
+class Declaration(NamedTuple):
+    kind: str
+    name: str
+    parameters: List[str]
+    line: int
+
+
+class Skim(NamedTuple):
+    declarations: List[Declaration]
+    includes: List[str]
+    requires: List[str]
+    contains: List[str]
+
+
+def _tokens(script: str) -> List[Tuple[int, str, int]]:
+    tokens: List[Tuple[int, str, int]] = []
+    append = tokens.append
+    # Same rule as the parser, a slash after an operand is a division
+    operand = False
+    pos: int | None = 0
+    while pos is not None:
+        matches, pos = _TOKEN.finditer(script, pos), None
+        for m in matches:
+            kind = m.lastindex or 0
+            if kind == _WORD:
+                text = m.group(kind)
+                operand = text not in _OPERATORS
+            elif kind == _PUNCT:
+                text = m.group(kind)
+                if text == "/" and not operand:
+                    regex = _REGEX.match(script, m.start(kind))
+                    if regex is not None:
+                        # Scanning starts again after the regex
+                        append((_STRING, regex.group(), regex.start()))
+                        operand = True
+                        pos = regex.end()
+                        break
+                operand = text in ")]"
+            elif kind == _COMMENT or not kind:
+                continue
+            else:
+                operand = True
+                if kind == _NUMBER:
+                    continue
+                text = m.group(kind)
+            append((kind, text, m.start(kind)))
+    return tokens
+
+
+def _value(kind: int, text: str) -> str:
+    return text[1:-1] if kind == _STRING else text
+
+
+def skim(script: str) -> Skim:
+    """Top-level declarations and statement function targets of ``script``.
+
+    Declarations are classes, defined types, nodes, functions and type
+    aliases, with the names of their parameters. Targets of ``include``,
+    ``require`` and ``contain`` are collected from the whole script.
+    """
+    tokens = _tokens(script)
+    result = Skim([], [], [], [])
+    targets = {
+        "include": result.includes,
+        "require": result.requires,
+        "contain": result.contains,
+    }
+    depth = 0
+    line, line_start = 1, 0
+    i, n = 0, len(tokens)
+    while i < n:
+        kind, text, pos = tokens[i]
+        i += 1
+        if text == "{":
+            depth += 1
+        elif text == "}":
+            depth = max(depth - 1, 0)
+        elif text not in _KEYWORDS or kind != _WORD:
+            continue
+        elif i < n and tokens[i][1] == "=>":
+            continue
+        elif text in _STATEMENT_FUNCTIONS:
+            i = _arguments(tokens, i, targets[text])
+        elif depth == 0 and text in _DECLARATIONS and i < n:
+            name_kind, name, _ = tokens[i]
+            if text == "node" or name_kind == _WORD:
+                line += script.count("\n", line_start, pos)
+                line_start = pos
+                parameters: List[str] = []
+                i = _parameters(tokens, i + 1, parameters)
+                result.declarations.append(
+                    Declaration(text, _value(name_kind, name), parameters, line)
+                )
+    return result
+
+
+def _arguments(tokens: List[Tuple[int, str, int]], i: int, targets: List[str]) -> int:
+    # Names and strings given to a statement function, with or without
+    # parentheses, in arrays or not
+    n = len(tokens)
+    if i < n and tokens[i][1] == "(":
+        i += 1
+    while i < n:
+        kind, text, _ = tokens[i]
+        if kind == _WORD or kind == _STRING:
+            targets.append(_value(kind, text))
+            i += 1
+        elif text == "[":
+            i += 1
+            while i < n and tokens[i][1] != "]":
+                kind, text, _ = tokens[i]
+                if kind == _WORD or kind == _STRING:
+                    targets.append(_value(kind, text))
+                i += 1
+            i += 1
+        if i < n and tokens[i][1] == ",":
+            i += 1
+        else:
+            break
+    if i < n and tokens[i][1] == ")":
+        i += 1
+    return i
+
+
+def _parameters(tokens: List[Tuple[int, str, int]], i: int, names: List[str]) -> int:
+    # Names of the parameters in the parentheses that follow a declaration
+    if i >= len(tokens) or tokens[i][1] != "(":
+        return i
+    nesting = 0
+    expect_name = True
+    for i in range(i + 1, len(tokens)):
+        kind, text, _ = tokens[i]
+        if kind == _PUNCT:
+            if text in "([{":
+                nesting += 1
+            elif text in ")]}":
+                if nesting == 0:
+                    return i + 1
+                nesting -= 1
+            elif nesting == 0:
+                expect_name = text == ","
+        elif expect_name and nesting == 0 and kind == _WORD and not text[0].isupper():
+            names.append(text)
+            expect_name = False
+    return len(tokens)
+
+
+# Words after a closing brace that continue the statement it closes
+_CONTINUATIONS = {"else", "elsif", "and", "or", "in"}
+_SPACES = re.compile(r"(?:\s+|#[^\n]*|/\*[\s\S]*?\*/)*")
+
+
+def statement_starts(script: str) -> List[int]:
+    """Offsets of lines that start a top-level statement of ``script``.
+
+    A line starts a statement when its first token is at the top level and
+    is either a declaration keyword, or a word that only spaces and comments
+    separate from a closing brace. The script is not validated, and none is
+    found if it has a regex over several lines, which the parser counts as a
+    single line.
+    """
+    starts: List[int] = []
+    depth = 0
+    closed = -1
+    for kind, text, pos in _tokens(script):
+        if kind == _STRING and text[0] == "/" and "\n" in text:
+            return []
+        if depth == 0 and kind == _WORD:
+            line_start = script.rfind("\n", 0, pos) + 1
+            if line_start > 0 and not script[line_start:pos].strip():
+                if text in _DECLARATIONS or (
+                    text not in _CONTINUATIONS
+                    and closed >= 0
+                    and _SPACES.fullmatch(script, closed, line_start)
+                ):
+                    starts.append(line_start)
+        closed = -1
+        if kind == _PUNCT:
+            if text in "([{":
+                depth += 1
+            elif text in ")]}":
+                depth = max(depth - 1, 0)
+                if depth == 0 and text == "}":
+                    closed = pos + 1
+    return starts
@@ -0,0 +1,250 @@
+"""Iterative traversal of the object model.
+
+:data:`CHILDREN` gives the fields of each model class that can hold
+elements. :func:`walk` yields the elements of a tree in preorder, and
+:class:`Visitor` calls a ``visit_<Class>`` method on each of them. Both keep
+an explicit stack, so long ``elsif`` chains and deep expressions do not hit
+the recursion limit, and look up what to do with an element by its class
+once, instead of testing it with ``isinstance``.
+"""
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+)
+
+from puppetparser.arena import FIELDS, KINDS, VIEWS
+from puppetparser.model import CodeElement, Comment, Id, Regex
+
+# The value of these is always a string
+_LEAVES = (Id, Regex, Comment)
+
+
+class _Children(Dict[type, Tuple[str, ...] | None]):
+    # Classes that are not in the model, such as arena views, take the fields
+    # of the model class they derive from. Other values have None.
+    def __missing__(self, cls: type) -> Tuple[str, ...] | None:
+        fields = None
+        if issubclass(cls, CodeElement):
+            model = next(base for base in cls.__mro__ if base in FIELDS)
+            fields = self[model]
+        self[cls] = fields
+        return fields
+
+
+CHILDREN: Dict[type, Tuple[str, ...] | None] = _Children(
+    (cls, () if cls in _LEAVES else FIELDS[cls]) for cls in KINDS
+)
+"""Fields of each model class that can hold elements, alone or in lists,
+tuples and dictionaries, in the order of :data:`puppetparser.arena.FIELDS`."""
+
+# Functions that give the values of the fields of an element in reverse
+# order, as a tuple, or alone when there is a single field, and None for
+# values that are not elements
+_Getter = Tuple[Callable[[Any], Any], bool]
+
+
+def _no_fields(element: CodeElement) -> Tuple[()]:
+    return ()
+
+
+class _Getters(Dict[type, _Getter | None]):
+    def __missing__(self, cls: type) -> _Getter | None:
+        fields = CHILDREN[cls]
+        getter: _Getter | None = None
+        if fields is None:
+            pass
+        elif len(fields) == 1:
+            getter = (attrgetter(fields[0]), True)
+        elif fields:
+            getter = (attrgetter(*reversed(fields)), False)
+        else:
+            getter = (_no_fields, False)
+        self[cls] = getter
+        return getter
+
+
+_GETTERS = _Getters()
+
+
+def _stack(tree: CodeElement | Iterable[CodeElement]) -> List[Any]:
+    # Stack from which the first element of tree is popped first
+    if isinstance(tree, CodeElement):
+        return [tree]
+    stack = list(tree)
+    stack.reverse()
+    return stack
+
+
+def _push_dict(stack: List[Any], value: Dict[Any, Any]) -> None:
+    for k, v in reversed(value.items()):
+        stack.append(v)
+        stack.append(k)
+
+
+def children(element: CodeElement) -> List[CodeElement]:
+    """The elements directly under ``element``, in the order of its fields."""
+    result: List[CodeElement] = []
+    stack = [getattr(element, name) for name in CHILDREN[element.__class__] or ()]
+    stack.reverse()
+    while stack:
+        value = stack.pop()
+        cls = value.__class__
+        if cls is list or cls is tuple:
+            stack.extend(reversed(value))
+        elif cls is dict:
+            _push_dict(stack, value)
+        elif CHILDREN[cls] is not None:
+            result.append(value)
+    return result
+
+
+def walk(tree: CodeElement | Iterable[CodeElement]) -> Iterator[CodeElement]:
+    """Yield ``tree``, or each element of it, and everything under it in
+    preorder, which is the order in which :class:`~puppetparser.arena.Arena`
+    numbers them.
+
+    An element reachable from several places, such as the type of the
+    resources of a resource expression, is yielded at each of them, and
+    :func:`unique` yields it once.
+    """
+    stack = _stack(tree)
+    pop, append, extend = stack.pop, stack.append, stack.extend
+    getters = _GETTERS
+    while stack:
+        value = pop()
+        cls = value.__class__
+        if cls is list or cls is tuple:
+            extend(reversed(value))
+            continue
+        getter = getters[cls]
+        if getter is not None:
+            yield value
+            get, single = getter
+            if single:
+                append(get(value))
+            else:
+                extend(get(value))
+        elif cls is dict:
+            _push_dict(stack, value)
+
+
+class _Keys(Dict[type, Callable[[Any], int]]):
+    # Arena views are created on each access, and are told apart by their
+    # index in the arena rather than by identity
+    def __missing__(self, cls: type) -> Callable[[Any], int]:
+        key: Callable[[Any], int] = attrgetter("index") if cls in _VIEWS else id
+        self[cls] = key
+        return key
+
+
+_VIEWS = frozenset(VIEWS)
+_KEYS = _Keys()
+
+
+def unique(elements: Iterable[CodeElement]) -> Iterator[CodeElement]:
+    """Yield each of ``elements`` of a tree once, skipping the nodes that were
+    already yielded, such as those that :func:`walk` reaches from several
+    places."""
+    seen: Set[int] = set()
+    add, keys = seen.add, _KEYS
+    for element in elements:
+        key = keys[element.__class__](element)
+        if key not in seen:
+            add(key)
+            yield element
+
+
+SKIP = object()
+"""Returned by a ``visit_<Class>`` method to skip the children of the
+element."""
+
+
+class _Leave:
+    __slots__ = ("method", "element")
+
+    def __init__(self, method: Callable[[Any, Any], Any], element: Any) -> None:
+        self.method = method
+        self.element = element
+
+
+_Entry = Tuple[Callable[[Any, Any], Any] | None, Callable[[Any, Any], Any] | None]
+
+
+class _Dispatch(Dict[type, _Entry]):
+    # visit_ and leave_ methods of a visitor class for each element class,
+    # from the most derived model class that has one
+    def __init__(self, visitor: type) -> None:
+        super().__init__()
+        self.visitor = visitor
+
+    def __missing__(self, cls: type) -> _Entry:
+        models = [base for base in cls.__mro__ if base in FIELDS]
+        entry = (self._method("visit_", models), self._method("leave_", models))
+        self[cls] = entry
+        return entry
+
+    def _method(self, prefix: str, models: List[type]) -> Any:
+        for model in models:
+            method = getattr(self.visitor, prefix + model.__name__, None)
+            if method is not None:
+                return method
+        return None
+
+
+class Visitor:
+    """Base class of visitors of the object model.
+
+    :meth:`visit` goes through a tree in preorder and calls, on each
+    element, the ``visit_<Class>`` method of its class, or of the closest of
+    its bases that has one: ``visit_Value`` is also called on identifiers,
+    unless there is a ``visit_Id``. ``leave_<Class>`` methods are called
+    likewise once the children of the element were visited. A
+    ``visit_<Class>`` method can return :data:`SKIP` to skip the children.
+
+    Methods are looked up once per class of element, for each subclass of
+    :class:`Visitor`.
+    """
+
+    # Visitor itself has no methods to dispatch to, each subclass gets its own
+    _dispatch: ClassVar[_Dispatch] = _Dispatch(object)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = _Dispatch(cls)
+
+    def visit(self, tree: CodeElement | Iterable[CodeElement]) -> None:
+        stack = _stack(tree)
+        pop, append, extend = stack.pop, stack.append, stack.extend
+        getters, dispatch = _GETTERS, self._dispatch
+        while stack:
+            value = pop()
+            cls = value.__class__
+            if cls is list or cls is tuple:
+                extend(reversed(value))
+                continue
+            getter = getters[cls]
+            if getter is not None:
+                visit, leave = dispatch[cls]
+                if visit is not None and visit(self, value) is SKIP:
+                    if leave is not None:
+                        leave(self, value)
+                    continue
+                if leave is not None:
+                    append(_Leave(leave, value))
+                get, single = getter
+                if single:
+                    append(get(value))
+                else:
+                    extend(get(value))
+            elif cls is dict:
+                _push_dict(stack, value)
+            elif cls is _Leave:
+                value.method(self, value.element)
@@ -18,9 +18,11 @@ class Lexer:
     lineno: int
 
     def begin(self, state: str) -> None: ...
+    def current_state(self) -> str: ...
 
 class LexToken:
     value: str
     lexer: Lexer
     lexpos: int
+    lineno: int
     type: str
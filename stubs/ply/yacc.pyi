@@ -1,10 +1,13 @@
+from types import ModuleType
 from typing import Any
 
+from ply.lex import Lexer
+
 def yacc(
     method: str = "LALR",
     debug: bool = True,
     module: Any = None,
-    tabmodule: str = "parsetab",
+    tabmodule: str | ModuleType = "parsetab",
     start: Any = None,
     check_recursion: bool = True,
     optimize: bool = False,
@@ -16,7 +19,26 @@ def yacc(
     picklefile: str | None = None,
 ) -> Any: ...
 
+class NullLogger: ...
+
+class ParserReflect:
+    error: bool
+
+    def __init__(self, pdict: dict[str, Any], log: Any = None) -> None: ...
+    def get_all(self) -> None: ...
+    def signature(self) -> str: ...
+
+class YaccSymbol:
+    type: str
+    value: Any
+
 class YaccProduction:
+    lexer: Lexer
+    parser: Any
+    slice: list[Any]
+    stack: list[Any] | None
+
+    def __init__(self, s: list[Any] | None, stack: list[Any] | None = None) -> None: ...
     def __getitem__(self, n: int) -> Any: ...
     def __setitem__(self, n: int, v: Any) -> Any: ...
     def lineno(self, n: int) -> int: ...
@@ -0,0 +1,36 @@
+import unittest
+
+import puppetparser
+from puppetparser.parser import InvalidPuppetScript, parse
+from puppetparser.skim import skim
+
+
+class TestClass(unittest.TestCase):
+    def test_colons(self):
+        # Took exponential time in the number of colons
+        code = "$a = " + "::" * 200 + "a"
+        tokens = list(puppetparser.tokenize(code))
+        self.assertEqual(tokens[-1].type, "ID")
+        self.assertEqual(tokens[-1].value, "::" * 200 + "a")
+
+    def test_type_after_dash(self):
+        types = [t.type for t in puppetparser.tokenize("$a = 1 -Foo::Bar")]
+        self.assertEqual(types, ["ID", "EQUAL", "INTEGER", "ARITH_SUB", "ID_TYPE"])
+
+    def test_unterminated(self):
+        for code in ["$a = '" + "a\\'" * 1000, '$a = "' + "\\" * 1001]:
+            with self.subTest(code=code[:10]):
+                with self.assertRaises(InvalidPuppetScript):
+                    parse(code)
+
+    def test_escapes(self):
+        tokens = list(puppetparser.tokenize("$a = 'a\\'b\\\\' =~ /x\\/y/"))
+        self.assertEqual(tokens[2].value, "a\\'b\\\\")
+        self.assertEqual(tokens[5].value, "x\\/y")
+
+    def test_skim(self):
+        # Unterminated strings take the rest of the script
+        result = skim("$a = 1" + " " * 10000 + ": @ '\\'" + "\nclass a { }")
+        self.assertEqual(result.declarations, [])
+        result = skim("class a { } $a = /" + "\\a" * 1000)
+        self.assertEqual([d.name for d in result.declarations], ["a"])
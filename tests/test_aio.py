@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from puppetparser import aio
+from puppetparser.model import Resource
+from puppetparser.parser import InvalidPuppetScript
+
+
+class TestClass(unittest.IsolatedAsyncioTestCase):
+    async def test_parse(self):
+        res, comments = await aio.parse("# c\nfile { '/tmp/a': }")
+        self.assertIsInstance(res[0], Resource)
+        self.assertEqual(comments[0].content, " c")
+
+        with self.assertRaises(InvalidPuppetScript):
+            await aio.parse("file { '/tmp/a': ensure => }")
+
+    async def test_parse_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            paths = []
+            for i in range(20):
+                paths.append(os.path.join(root, f"{i}.pp"))
+                with open(paths[-1], "w") as f:
+                    f.write(
+                        "file { '/tmp/a': ensure => }" if i == 3 else "file { 'a': }"
+                    )
+            paths.append(os.path.join(root, "missing.pp"))
+
+            with ThreadPoolExecutor(2) as executor:
+                results = {
+                    r.path: r
+                    async for r in aio.parse_files(
+                        paths, concurrency=4, executor=executor
+                    )
+                }
+            self.assertEqual(set(results), set(paths))
+            self.assertIsInstance(results[paths[0]].elements[0], Resource)
+            self.assertIsInstance(results[paths[3]].error, InvalidPuppetScript)
+            self.assertIsInstance(results[paths[20]].error, FileNotFoundError)
+
+    async def test_parse_files_break(self):
+        paths = ["missing.pp"] * 50
+        async for result in aio.parse_files(paths, concurrency=2):
+            self.assertIsInstance(result.error, FileNotFoundError)
+            break
@@ -0,0 +1,82 @@
+import unittest
+
+from puppetparser.model import (
+    Attribute,
+    CodeElement,
+    Hash,
+    Lambda,
+    PuppetClass,
+    Resource,
+    Value,
+)
+from puppetparser.parser import parse
+
+
+class TestClass(unittest.TestCase):
+    code = """
+        class apache (String $content = '') {
+            package { 'apache2': ensure => present }
+            file { '/etc/motd':
+                content => { 'a' => 1, 'b' => [$content, undef] },
+            }
+            $x.each |$a| { notice($a) }
+        }
+        file { '/tmp/b': }
+    """
+
+    def test_views(self):
+        res, comments = parse(self.code, representation="arena")
+        self.assertEqual(len(res), 2)
+        self.assertEqual(comments, [])
+
+        cls = res[0]
+        self.assertIsInstance(cls, PuppetClass)
+        self.assertEqual((cls.line, cls.col, cls.end_line), (2, 9, 8))
+        self.assertEqual(cls.name, "apache")
+        self.assertEqual(cls.parameters[0].name, "$content")
+        self.assertEqual(cls.parameters[0].default, Value(0, 0, 0, 0, ""))
+
+        package, file = cls.block[0], cls.block[1]
+        self.assertIsInstance(package, Resource)
+        self.assertEqual(package.title.value, "apache2")
+        self.assertIsInstance(file.attributes[0], Attribute)
+        content = file.attributes[0].value
+        self.assertIsInstance(content, Hash)
+        self.assertEqual({k.value: v.value for k, v in content.value.items()}["a"], 1)
+        self.assertIsInstance(cls.block[2].lamb, Lambda)
+        self.assertEqual(cls.block[2].lamb.parameters[0].name, "$a")
+
+        self.assertEqual(package, cls.block[0])
+        self.assertEqual(hash(package), hash(cls.block[0]))
+
+    def test_same_as_objects(self):
+        objects, _ = parse(self.code)
+        arena, _ = parse(self.code, representation="arena")
+        for o, a in zip(objects[0].block + objects, arena[0].block + arena[:]):
+            self.assertEqual(type(o), a.__class__.__mro__[2])
+            self.assertEqual(
+                (o.line, o.col, o.end_line, o.end_col),
+                (a.line, a.col, a.end_line, a.end_col),
+            )
+
+    def test_bulk(self):
+        arena, _ = parse(self.code, representation="arena")
+        resources = list(arena.nodes_of_kind(Resource))
+        self.assertEqual(
+            [r.title.value for r in resources], ["apache2", "/etc/motd", "/tmp/b"]
+        )
+        self.assertEqual(len(arena.indices_of_kind(CodeElement)), arena.node_count)
+
+        index = resources[0].index
+        self.assertEqual(arena.kind(index), Resource)
+        parent = arena.parent(index)
+        self.assertEqual(arena.kind(parent), PuppetClass)
+        self.assertEqual(arena.parent(parent), -1)
+        self.assertIn(index, list(arena.children(parent)))
+        self.assertEqual(arena.span(index)[0], 3)
+        for child in range(index + 1, arena.end(index)):
+            self.assertGreaterEqual(arena.span(child)[0], 3)
+
+    def test_unknown_representation(self):
+        with self.assertRaises(ValueError):
+            parse("", representation="tree")  # type: ignore
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+import puppetparser
+from puppetparser.model import Resource
+from puppetparser.parser import InvalidPuppetScript
+
+
+class TestClass(unittest.TestCase):
+    sources = [
+        ("a.pp", "file { '/tmp/a': }"),
+        ("b.pp", "file { '/tmp/b': ensure => }"),
+        ("c.pp", "# c\n" + "package { 'c': }\n" * 50),
+    ]
+
+    def check(self, results: list[puppetparser.ParseResult]):
+        self.assertEqual([r.path for r in results], ["a.pp", "b.pp", "c.pp"])
+        self.assertIsInstance(results[0].elements[0], Resource)
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].elements)
+        self.assertIsInstance(results[1].error, InvalidPuppetScript)
+        self.assertEqual(len(results[2].elements), 50)
+        self.assertEqual(results[2].comments[0].content, " c")
+
+    def test_parse_many_in_process(self):
+        self.check(list(puppetparser.parse_many(self.sources, workers=1)))
+
+    def test_parse_many_pool(self):
+        self.check(list(puppetparser.parse_many(self.sources, workers=2)))
+
+    def test_parse_many_deep(self):
+        # The tree is too deep to be pickled back from a worker
+        code = "if $a { }" + "".join(f" elsif $a == {i} {{ }}" for i in range(600))
+        sources = [("deep.pp", code), ("a.pp", "$a = 1")]
+        for workers in (1, 2):
+            results = list(puppetparser.parse_many(sources, workers=workers))
+            self.assertEqual([r.error for r in results], [None, None])
+            self.assertEqual(results[0].elements[0].line, 1)
+
+    def test_parse_many_as_completed(self):
+        results = puppetparser.parse_many(self.sources, workers=2, ordered=False)
+        self.check(sorted(results, key=lambda r: r.path))
+
+    def test_parse_many_paths(self):
+        with tempfile.TemporaryDirectory() as root:
+            paths = []
+            for name, source in self.sources:
+                paths.append(os.path.join(root, name))
+                with open(paths[-1], "w") as f:
+                    f.write(source)
+            paths.append(os.path.join(root, "missing.pp"))
+
+            results = list(puppetparser.parse_many(paths, workers=2))
+            self.assertEqual([r.path for r in results], paths)
+            self.assertIsInstance(results[0].elements[0], Resource)
+            self.assertIsInstance(results[1].error, InvalidPuppetScript)
+            self.assertIsInstance(results[3].error, FileNotFoundError)
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from puppetparser.cache import ParseCache
+from puppetparser.model import Resource
+from puppetparser.parser import InvalidPuppetScript
+
+
+class TestClass(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hit(self):
+        script = "# c\nfile { '/tmp/a': ensure => present }"
+        res, comments = self.cache.parse(script)
+        cached_res, cached_comments = self.cache.parse(script)
+        self.assertEqual((self.cache.stats.hits, self.cache.stats.misses), (1, 1))
+        self.assertIsInstance(cached_res[0], Resource)
+        self.assertEqual(cached_res[0].end_line, res[0].end_line)
+        self.assertEqual(cached_res[0].attributes[0].value.value, "present")
+        self.assertEqual(cached_comments[0].content, comments[0].content)
+
+        other = ParseCache(self.tmp.name, parser=self.cache.parser)
+        other.parse(script)
+        self.assertEqual(other.stats.hits, 1)
+
+    def test_pickle_version(self):
+        script = "file { '/tmp/a': }"
+        self.cache.parse(script)
+        with mock.patch("puppetparser.cache.PICKLE_VERSION", 1):
+            other = ParseCache(self.tmp.name, parser=self.cache.parser)
+        other.parse(script)
+        self.assertEqual((other.stats.hits, other.stats.misses), (0, 1))
+
+    def test_errors_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(InvalidPuppetScript):
+                self.cache.parse("file { '/tmp/a': ensure => }")
+        self.assertEqual(self.cache.stats.misses, 2)
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_corrupt_entry(self):
+        script = "file { '/tmp/a': }"
+        self.cache.parse(script)
+        key = self.cache.key(script)
+        with open(os.path.join(self.tmp.name, key[:2], key[2:] + ".pkl"), "wb") as f:
+            f.write(b"\x80")
+        res, _ = self.cache.parse(script)
+        self.assertIsInstance(res[0], Resource)
+        self.assertEqual(self.cache.stats.misses, 2)
+        self.assertEqual(self.cache.parse(script)[0][0].line, 1)
+
+    def test_eviction(self):
+        scripts = [f"file {{ '/tmp/{i}': }}" for i in range(6)]
+        self.cache.parse(scripts[0])
+        self.cache.max_size = self.cache.size() * 5
+        for i, script in enumerate(scripts[:5]):
+            self.cache.parse(script)
+            key = self.cache.key(script)
+            path = os.path.join(self.tmp.name, key[:2], key[2:] + ".pkl")
+            os.utime(path, (i, i))
+        # Marks the oldest entry as recently used
+        self.cache.parse(scripts[0])
+
+        self.cache.parse(scripts[5])
+        self.assertLessEqual(self.cache.size(), self.cache.max_size)
+        self.assertEqual(self.cache.stats.evictions, 2)
+        hits = self.cache.stats.hits
+        for script in (scripts[0], scripts[3], scripts[5]):
+            self.cache.parse(script)
+        self.assertEqual(self.cache.stats.hits, hits + 3)
+        self.cache.parse(scripts[1])
+        self.assertEqual(self.cache.stats.hits, hits + 3)
@@ -43,3 +43,19 @@ Kek */
         self.assertEqual(comments[2].end_line, 12)
         self.assertEqual(comments[3].content, " Hi")
         self.assertEqual(comments[3].line, 14)
+
+    def test_block_comment(self):
+        code = "$a = 1 /** a * b **/ $b = 2\n/*\n * x\n*/\n/* open"
+
+        res, comments = parse(code)
+        self.assertEqual(len(res), 2)
+        self.assertEqual(len(comments), 2)
+        self.assertEqual(comments[0].content, "* a * b *")
+        self.assertEqual(comments[0].line, 1)
+        self.assertEqual(comments[0].col, 8)
+        self.assertEqual(comments[0].end_line, 1)
+        self.assertEqual(comments[0].end_col, 9)
+        self.assertEqual(comments[1].content, "\n * x\n")
+        self.assertEqual(comments[1].line, 2)
+        self.assertEqual(comments[1].end_line, 4)
+        self.assertEqual(comments[1].end_col, 0)
@@ -0,0 +1,48 @@
+import unittest
+
+from puppetparser.model import Assignment, Node, PuppetClass, Resource
+from puppetparser.parser import InvalidPuppetScript, Parser, iparse, parse
+from tests.utility import tree
+
+
+class TestClass(unittest.TestCase):
+    code = """# header
+class a ($x = 1) {
+  file { '/tmp/a': content => "${x}" }
+}
+node 'web' { include a }
+$b = /x/
+file { '/tmp/b': } -> service { 'b': }
+if $b { $c = 1 }
+notice($b)
+$b + 1
+"""
+
+    def test_same_as_parse(self):
+        self.assertEqual(tree(list(iparse(self.code))), tree(parse(self.code)[0]))
+        for code in ["", "# only a comment", "$a = 1", "1 + 2"]:
+            self.assertEqual(tree(list(iparse(code))), tree(parse(code)[0]))
+
+    def test_streamed(self):
+        parser = Parser()
+        elements = parser.iparse(self.code + "$d = = 1\n")
+        self.assertIsInstance(next(elements), PuppetClass)
+        self.assertIsInstance(next(elements), Node)
+        self.assertIsInstance(next(elements), Assignment)
+        with self.assertRaises(InvalidPuppetScript):
+            list(elements)
+
+    def test_interleaved(self):
+        parser = Parser()
+        elements = parser.iparse(self.code)
+        first = next(elements)
+        other, _ = parser.parse("\n\nfile { '/tmp/c': }")
+        self.assertIsInstance(other[0], Resource)
+        self.assertEqual(other[0].line, 3)
+        rest = list(elements)
+        self.assertEqual(tree([first] + rest), tree(parse(self.code)[0]))
+        self.assertEqual(rest[-1].line, 10)
+
+    def test_lexer(self):
+        code = self.code
+        self.assertEqual(tree(list(iparse(code, "ply"))), tree(parse(code)[0]))
@@ -0,0 +1,47 @@
+import pickle
+import unittest
+
+from puppetparser.parser import InvalidPuppetScript, LimitExceeded, ParseLimits, parse
+
+
+class TestClass(unittest.TestCase):
+    def test_within_limits(self):
+        code = "class a { $a = [1, {'b' => (2)}] }"
+        limits = ParseLimits(max_size=100, max_tokens=100, max_depth=4, timeout=60)
+        self.assertEqual(
+            pickle.dumps(parse(code, limits=limits)), pickle.dumps(parse(code))
+        )
+
+    def test_max_size(self):
+        with self.assertRaises(LimitExceeded) as cm:
+            parse("$a = 1", limits=ParseLimits(max_size=5))
+        self.assertEqual(cm.exception.limit, "max_size")
+        self.assertEqual(cm.exception.value, 5)
+
+    def test_max_tokens(self):
+        parse("$a = 1 + 2", limits=ParseLimits(max_tokens=5))
+        with self.assertRaises(LimitExceeded) as cm:
+            parse("$a = 1 + 2 + 3", limits=ParseLimits(max_tokens=5))
+        self.assertEqual(cm.exception.limit, "max_tokens")
+
+    def test_max_depth(self):
+        code = "$a = " + "[" * 3 + "1" + "]" * 3
+        parse(code, limits=ParseLimits(max_depth=3))
+        for nested in [code, "class a { if true { $a = (1) } }"]:
+            with self.subTest(code=nested):
+                with self.assertRaises(LimitExceeded) as cm:
+                    parse(nested, limits=ParseLimits(max_depth=2))
+                self.assertEqual(cm.exception.limit, "max_depth")
+
+    def test_timeout(self):
+        code = "$a = 1\n" * 1000
+        with self.assertRaises(LimitExceeded) as cm:
+            parse(code, limits=ParseLimits(timeout=0))
+        self.assertEqual(cm.exception.limit, "timeout")
+
+    def test_exception(self):
+        error = LimitExceeded("max_depth", 2)
+        self.assertIsInstance(error, InvalidPuppetScript)
+        copy = pickle.loads(pickle.dumps(error))
+        self.assertEqual((copy.limit, copy.value), ("max_depth", 2))
+        self.assertEqual(str(copy), str(error))
@@ -0,0 +1,57 @@
+import threading
+import unittest
+
+from puppetparser.memo import ParseMemo
+from puppetparser.model import Resource
+
+
+class TestClass(unittest.TestCase):
+    def test_shared_and_copies(self):
+        memo = ParseMemo()
+        script = "# c\nfile { '/tmp/a': ensure => present }"
+        res, comments = memo.parse(script)
+        self.assertIs(memo.parse(script)[0], res)
+
+        copy, copy_comments = memo.parse(script, copy=True)
+        self.assertIsNot(copy, res)
+        self.assertIsInstance(copy[0], Resource)
+        self.assertEqual(copy[0].attributes[0].value.value, "present")
+        self.assertEqual(copy_comments[0].content, comments[0].content)
+        self.assertIsNot(memo.parse(script, copy=True)[0], copy)
+        self.assertEqual((memo.stats.hits, memo.stats.misses), (3, 1))
+
+    def test_eviction(self):
+        memo = ParseMemo(max_entries=2)
+        scripts = [f"file {{ '/tmp/{i}': }}" for i in range(3)]
+        for script in scripts:
+            memo.parse(script)
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.stats.evictions, 1)
+        memo.parse(scripts[0])
+        self.assertEqual(memo.stats.misses, 4)
+
+        memo = ParseMemo(max_memory=1)
+        for script in scripts:
+            memo.parse(script)
+        self.assertEqual(len(memo), 1)
+        memo.parse(scripts[2])
+        self.assertEqual(memo.stats.hits, 1)
+        memo.clear()
+        self.assertEqual((len(memo), memo.memory), (0, 0))
+
+    def test_threads(self):
+        memo = ParseMemo(max_entries=5)
+        scripts = [f"file {{ '/tmp/{i}': }}" for i in range(8)]
+
+        def work():
+            for _ in range(20):
+                for script in scripts:
+                    self.assertIsInstance(memo.parse(script)[0][0], Resource)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(memo.stats.hits + memo.stats.misses, 4 * 20 * 8)
+        self.assertEqual(len(memo), 5)
@@ -0,0 +1,35 @@
+import inspect
+import pickle
+import unittest
+
+import puppetparser.model
+from puppetparser.model import CodeElement, Value
+from puppetparser.parser import parse
+
+
+class TestClass(unittest.TestCase):
+    def test_slots(self):
+        for _, cls in inspect.getmembers(puppetparser.model, inspect.isclass):
+            if issubclass(cls, CodeElement):
+                self.assertFalse(hasattr(object.__new__(cls), "__dict__"), cls)
+
+        value = Value[int](1, 2, 3, 4, 5)
+        self.assertEqual((value.line, value.end_col, value.value), (1, 4, 5))
+        with self.assertRaises(AttributeError):
+            value.other = 1  # type: ignore
+
+    def test_pickle(self):
+        res, _ = parse("file { '/tmp/a': ensure => present }")
+        copy = pickle.loads(pickle.dumps(res))
+        self.assertEqual(copy[0].title, Value(1, 8, 1, 16, "/tmp/a"))
+        self.assertEqual(copy[0].title.end_col, 16)
+        self.assertEqual(copy[0].attributes[0].value.end_col, 35)
+
+    def test_pickle_old_format(self):
+        # The default state of slotted objects, as pickled before states
+        # became tuples of the slots
+        value = object.__new__(Value)
+        with self.assertRaises(TypeError):
+            value.__setstate__((None, {"line": 1, "_col": 2}))
+        with self.assertRaises(TypeError):
+            value.__setstate__((1, 2, 3))
@@ -0,0 +1,64 @@
+import unittest
+
+from puppetparser import parse_parallel
+from puppetparser.parser import InvalidPuppetScript, parse
+from puppetparser.skim import statement_starts
+from tests.utility import comments, tree
+
+
+class TestClass(unittest.TestCase):
+    code = """# header
+class a ($x = '}') {
+  file { '/tmp/a': content => "{${x}" }
+}
+node 'web' { include a }
+file { '/tmp/b': }
+-> service { 'b': }
+if $x { $y = 1 }
+else { $y = 2 }
+$z = @("END"/L)
+  }
+  class fake { }
+  |END
+/* class commented { } */
+define b () { }
+  package { 'c': } # trailing
+$w = 1
+"""
+
+    def test_statement_starts(self):
+        starts = statement_starts(self.code)
+        lines = [self.code.count("\n", 0, start) + 1 for start in starts]
+        self.assertEqual(lines, [2, 5, 6, 8, 10, 15, 16, 17])
+
+    def test_regex_over_lines(self):
+        code = "$a = 1\nclass a { }\n$b = $a =~ /x\ny/"
+        self.assertEqual(statement_starts(code), [])
+
+    def test_same_as_parse(self):
+        code = self.code * 20
+        elements, expected = parse(code)
+        result = parse_parallel(code, workers=2, chunk_size=100)
+        self.assertEqual(tree(result[0]), tree(elements))
+        self.assertEqual(comments(result[1]), comments(expected))
+        self.assertEqual(result[0][-1].line, 20 * self.code.count("\n"))
+
+    def test_deep(self):
+        # The piece with the deep tree cannot be pickled back from its worker
+        classes = "".join(f"class c{i} {{ }}\n" for i in range(50))
+        deep = "if $a { }" + "".join(f" elsif $a == {i} {{ }}" for i in range(600))
+        code = classes + deep + "\n" + classes.replace("class c", "class d")
+        elements, _ = parse_parallel(code, workers=2, chunk_size=200)
+        self.assertEqual(tree(elements), tree(parse(code)[0]))
+
+    def test_serial(self):
+        elements, _ = parse_parallel(self.code, workers=1, chunk_size=10)
+        self.assertEqual(tree(elements), tree(parse(self.code)[0]))
+
+    def test_error(self):
+        code = self.code * 3 + "file { 'x': ensure => }\n" + self.code
+        with self.assertRaises(InvalidPuppetScript) as expected:
+            parse(code)
+        with self.assertRaises(InvalidPuppetScript) as raised:
+            parse_parallel(code, workers=2, chunk_size=100)
+        self.assertEqual(str(raised.exception), str(expected.exception))
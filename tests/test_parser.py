@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import puppetparser.parser
+from puppetparser.parser import InvalidPuppetScript, Parser, grammar_signature
+from puppetparser.model import Resource, Comment
+
+
+class TestClass(unittest.TestCase):
+    def test_parser_reuse(self):
+        parser = Parser()
+        res, comments = parser.parse("# first\nfile { '/tmp/a': }")
+        self.assertIsInstance(res[0], Resource)
+        self.assertEqual(len(comments), 1)
+
+        res, comments = parser.parse("\n\npackage { 'apache2': ensure => present }")
+        self.assertIsInstance(res[0], Resource)
+        self.assertEqual(res[0].line, 3)
+        self.assertEqual(len(comments), 0)
+
+    def test_parser_reuse_after_error(self):
+        parser = Parser()
+        with self.assertRaises(InvalidPuppetScript):
+            parser.parse("file { '/tmp/a': ensure => }")
+        # Unterminated comments consume the rest of the script
+        parser.parse("/* unterminated comment\n")
+
+        res, comments = parser.parse("/* a */\nfile { '/tmp/a': }")
+        self.assertEqual(res[0].line, 2)
+        self.assertIsInstance(comments[0], Comment)
+        self.assertEqual(comments[0].line, 1)
+
+    def test_shipped_tables(self):
+        from puppetparser import parsetab
+
+        self.assertEqual(
+            parsetab._lr_signature,
+            grammar_signature(Parser()),
+            "Outdated tables, run python -m puppetparser._build_tables",
+        )
+
+    def test_tables_cache(self):
+        with tempfile.TemporaryDirectory() as cache, mock.patch.dict(
+            os.environ, {"XDG_CACHE_HOME": cache}
+        ), mock.patch.object(puppetparser.parser, "TABLES_MODULE", "missing"):
+            parser = Parser()
+            path = os.path.join(
+                cache, "puppetparser", f"parsetab_{parser.grammar_hash}.py"
+            )
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(
+                os.listdir(os.path.dirname(path)), [os.path.basename(path)]
+            )
+
+            res, _ = Parser().parse("file { '/tmp/a': }")
+            self.assertIsInstance(res[0], Resource)
+
+    def test_long_lists(self):
+        n = 3000
+        pairs = ", ".join(f"'k{i}' => {i}" for i in range(n))
+        body = "\n".join(f"file {{ '/tmp/{i}': }}" for i in range(n))
+        res, _ = Parser().parse(f"class a {{\n{body}\n$h = {{ {pairs}, }}\n}}")
+        block = res[0].block
+        self.assertEqual(len(block), n + 1)
+        self.assertEqual([r.line for r in block[:n]], list(range(2, n + 2)))
+        self.assertEqual(
+            [v.value for v in block[n].value.value.values()], list(range(n))
+        )
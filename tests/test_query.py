@@ -0,0 +1,103 @@
+import unittest
+
+import puppetparser
+from puppetparser.model import FunctionCall, Resource, Value
+from puppetparser.parser import parse
+from puppetparser.query import Index, compile
+
+
+class TestClass(unittest.TestCase):
+    code = """class a {
+  file { '/tmp/a': mode => 644, owner => 'root' }
+  file { '/tmp/b': mode => '0644' }
+  package { 'p': ensure => latest }
+  $x = lookup('k')
+}
+file { '/tmp/c': mode => "0${m}" }
+"""
+
+    def run_query(self, query, tree=None):
+        matches = compile(query).run(tree or parse(self.code)[0])
+        return [(type(e).__name__, e.line) for e in matches]
+
+    def test_paths(self):
+        query = "Resource[type=file]/Attribute[key=mode]/Value:str"
+        self.assertEqual(self.run_query(query), [("Value", 3), ("Value", 7)])
+        query = "Resource[type=file]/Attribute[key=mode]/Value:int"
+        self.assertEqual(self.run_query(query), [("Value", 2)])
+        query = "PuppetClass//FunctionCall[name=lookup]"
+        self.assertEqual(self.run_query(query), [("FunctionCall", 5)])
+        self.assertEqual(self.run_query("PuppetClass/FunctionCall"), [])
+        self.assertEqual(self.run_query("Resource[type!=file]"), [("Resource", 4)])
+        query = "Resource[type=file, title='/tmp/b']"
+        self.assertEqual(self.run_query(query), [("Resource", 3)])
+        query = "Attribute[key=owner]/Value[value=root]"
+        self.assertEqual(self.run_query(query), [("Value", 2)])
+        self.assertEqual(len(self.run_query("*/Id[value=mode]")), 3)
+        self.assertEqual(len(self.run_query("Resource[title]")), 4)
+
+    def test_exact_class(self):
+        values = compile("Value").run(parse(self.code)[0])
+        self.assertTrue(all(type(v) is Value for v in values))
+        self.assertEqual(len(self.run_query("Id[value=mode]")), 3)
+
+    def test_arena(self):
+        arena, _ = parse(self.code, representation="arena")
+        query = "Resource[type=file]/Attribute[key=mode]/Value:str"
+        matches = compile(query).run(arena)
+        self.assertEqual(
+            [(v.value, v.line) for v in matches], [("0644", 3), ("0${m}", 7)]
+        )
+
+    def test_shared_nodes(self):
+        # The type of a resource expression is under each of its resources
+        code = "file { 'a': mode => '1'; 'b': mode => '2'; 'c': }"
+        for tree in (parse(code)[0], parse(code, representation="arena")[0]):
+            with self.subTest(tree=type(tree).__name__):
+                self.assertEqual(len(compile("Id[value=file]").run(tree)), 1)
+                query = "ResourceExpression/Resource/Id"
+                self.assertEqual(len(compile(query).run(tree)), 1)
+                query = "ResourceExpression//Id[value=file]"
+                self.assertEqual(len(compile(query).run(tree)), 1)
+                self.assertEqual(len(compile("Resource").run(tree)), 3)
+
+    def test_index(self):
+        index = Index(parse(self.code)[0])
+        self.assertIsNone(index._by_class)
+        self.assertEqual(compile("FunctionCall").run(index)[0].line, 5)
+        self.assertIsNone(index._by_type)
+        self.assertEqual(len(compile("Resource[type=file]").run(index)), 3)
+        self.assertEqual(len(index.of_class(Resource)), 4)
+        self.assertEqual(len(index.resources_of_type("package")), 1)
+        self.assertIsInstance(index.of_class(FunctionCall)[0], FunctionCall)
+
+    def test_errors(self):
+        for query, message in [
+            ("Foo", "at 0: unknown class 'Foo'"),
+            ("Resource[x=1]", "at 9: Resource has no field 'x'"),
+            ("Resource[type=file", "at 18: unexpected end"),
+            ("Value:list", "at 6: unknown type 'list'"),
+            ("Resource:str", "at 9: Resource has no type, only Value does"),
+            ("Resource/", "at 9: unexpected end"),
+            ("Resource &", "at 9: unexpected '&'"),
+        ]:
+            with self.subTest(query=query):
+                with self.assertRaises(ValueError) as raised:
+                    compile(query)
+                self.assertIn(message, str(raised.exception))
+
+    def test_run_many(self):
+        sources = [
+            ("a.pp", self.code),
+            ("b.pp", "file { 'x': mode => }"),
+            ("c.pp", "package { 'c': }"),
+        ]
+        results = list(puppetparser.parse_many(sources, workers=1))
+        query = compile("Resource[type=file]/Attribute[key=mode]")
+        matches = list(query.run_many(results))
+        self.assertEqual([(path, len(m)) for path, m in matches], [("a.pp", 3)])
+        indexes = [Index(r.elements, r.path) for r in results if r.error is None]
+        self.assertEqual(
+            [path for path, _ in compile("Resource").run_many(indexes)],
+            ["a.pp", "c.pp"],
+        )
@@ -0,0 +1,63 @@
+import unittest
+
+from puppetparser.model import Assignment, PuppetClass
+from puppetparser.parser import InvalidPuppetScript, Parser
+
+
+class TestClass(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser()
+
+    def parse(self, code):
+        errors = []
+        elements, _ = self.parser.parse(code, errors=errors)
+        return elements, [(e.line, e.col) for e in errors]
+
+    def test_valid(self):
+        code = 'class a { $b = /x/ }\n$a = @("END"/L)\n  text\n  |END\nnotice($a)'
+        elements, errors = self.parse(code)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(elements), 3)
+
+    def test_statements(self):
+        code = "$a = 1\nfile { 'a': ensure => = }\n$b = 2\nclass c { $d = = 1 }\n"
+        elements, errors = self.parse(code)
+        self.assertEqual(errors, [(2, 23), (4, 16)])
+        self.assertEqual(
+            [type(e) for e in elements], [Assignment, Assignment, PuppetClass]
+        )
+        self.assertEqual(elements[2].block, [])
+
+    def test_closing_brace(self):
+        code = "class a { file { 'x': bad bad } $b = 1 }\nclass c { }"
+        elements, errors = self.parse(code)
+        self.assertEqual(errors, [(1, 27)])
+        self.assertEqual([e.name for e in elements], ["a", "c"])
+        self.assertEqual([type(e) for e in elements[0].block], [Assignment])
+
+    def test_keyword(self):
+        elements, errors = self.parse("$a = [1, 2\nclass b { }\n")
+        self.assertEqual(errors, [(2, 1)])
+        self.assertEqual([e.name for e in elements], ["b"])
+
+    def test_stray_brace(self):
+        elements, errors = self.parse("$a = }\n$b = 1")
+        self.assertEqual(errors, [(1, 6)])
+        self.assertEqual([e.name.value for e in elements], ["$b"])
+
+    def test_end_of_script(self):
+        elements, errors = self.parse("$a = 1\nclass a {\n $b = ")
+        self.assertEqual(errors, [(3, 7)])
+        self.assertEqual(len(elements), 1)
+
+    def test_lexer_error(self):
+        elements, errors = self.parse("$a = 1 ¤¤ 2\nclass b { }")
+        self.assertEqual(errors[0], (1, 8))
+        self.assertEqual(elements[-1].name, "b")
+
+    def test_raises(self):
+        with self.assertRaises(InvalidPuppetScript):
+            self.parser.parse("$a = = 1")
+        # The parser is left usable by a parse that recovered
+        self.parse("$a = = 1")
+        self.assertEqual(len(self.parser.parse("$a = 1")[0]), 1)
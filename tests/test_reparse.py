@@ -0,0 +1,105 @@
+import unittest
+
+from puppetparser.parser import InvalidPuppetScript, ParsedScript, Parser
+from tests.utility import comments, tree
+
+
+class TestClass(unittest.TestCase):
+    code = """# header
+$a = 1
+file { '/tmp/a': ensure => present }
+class b ($x = 1) {
+  $y = { 'key' => $x }
+}
+/* block
+   comment */
+@user { 'nginx': ensure => present }
+notice($a) # end
+"""
+
+    def setUp(self):
+        self.parser = Parser()
+        self.calls = 0
+        parse_region = self.parser._parse_region
+
+        def counted(*args):
+            self.calls += 1
+            return parse_region(*args)
+
+        self.parser._parse_region = counted
+
+    def reparse(self, code, edits):
+        previous = ParsedScript(code, *self.parser.parse(code))
+        result = self.parser.reparse(previous, edits)
+        elements, expected = self.parser.parse(result.script)
+        self.assertEqual(tree(result.elements), tree(elements))
+        self.assertEqual(comments(result.comments), comments(expected))
+        return result
+
+    def test_edits(self):
+        code = self.code
+        for pos, text in [
+            (code.index("present"), "absent"),
+            (code.index("$x }"), "\n\n  "),
+            (0, "$z = 2\n"),
+            (len(code), "include c\n"),
+            (code.index("notice"), "# comment\n"),
+            (code.index("class"), "\n"),
+        ]:
+            result = self.reparse(code, [(pos, pos, text)])
+            self.assertEqual(result.script, code[:pos] + text + code[pos:])
+
+    def test_replace(self):
+        start = self.code.index("'key'")
+        result = self.reparse(self.code, [(start, start + 5, "'other'")])
+        key = next(iter(result.elements[2].block[0].value.value))
+        self.assertEqual(key.value, "other")
+
+    def test_several_edits(self):
+        code = self.code
+        first, last = code.index("1"), code.index("'nginx'")
+        edits = [(last, last + 7, "'www'"), (first, first + 1, "22")]
+        result = self.reparse(code, edits)
+        self.assertEqual(result.script.count("'www'"), 1)
+
+    def test_region(self):
+        code = "".join(f"$a{i} = {i}\n" for i in range(100))
+        pos = code.index("$a50")
+        result = self.reparse(code, [(pos, pos, "\n")])
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(result.elements[50].line, 52)
+        self.assertEqual(result.elements[99].line, 101)
+
+    def test_reused(self):
+        code = "".join(f"$a{i} = {i}\n" for i in range(100))
+        previous = ParsedScript(code, *self.parser.parse(code))
+        first, last = previous.elements[0], previous.elements[-1]
+        pos = code.index("$a50")
+        result = self.parser.reparse(previous, [(pos, pos, " ")])
+        self.assertIs(result.elements[0], first)
+        self.assertIs(result.elements[-1], last)
+
+    def test_fallback(self):
+        # The comment swallows the rest of the script
+        pos = self.code.index("file")
+        self.reparse(self.code, [(pos, pos, "/* ")])
+        code = "$a = 1\n/* x */\n$b = 2\n"
+        pos = code.index("*/")
+        self.reparse(code, [(pos, pos + 2, "")])
+
+    def test_invalid_edits(self):
+        previous = ParsedScript(self.code, *self.parser.parse(self.code))
+        size = len(self.code)
+        for edits in [[(5, 3, "")], [(0, 4, ""), (2, 6, "")], [(0, size + 1, "")]]:
+            with self.assertRaises(ValueError):
+                self.parser.reparse(previous, edits)
+
+    def test_invalid_script(self):
+        previous = ParsedScript(self.code, *self.parser.parse(self.code))
+        pos = self.code.index("ensure")
+        with self.assertRaises(InvalidPuppetScript):
+            self.parser.reparse(previous, [(pos, pos, "= ")])
+
+    def test_no_edits(self):
+        previous = ParsedScript(self.code, *self.parser.parse(self.code))
+        self.assertIs(self.parser.reparse(previous, []), previous)
@@ -0,0 +1,116 @@
+import unittest
+
+from puppetparser.model import Id, Resource
+from puppetparser.parser import InvalidPuppetScript, parse
+from puppetparser.rules import Engine, Rule, check_many
+
+
+class FileMode(Rule):
+    def visit_Resource(self, node):
+        if node.type.value != "file":
+            return
+        for attribute in node.attributes:
+            if attribute.key.value == "mode" and not isinstance(
+                attribute.value.value, str
+            ):
+                self.report(attribute.value, "mode should be a string")
+
+
+class Passwords(Rule):
+    name = "hardcoded-password"
+
+    def visit_Assignment(self, node):
+        if "password" in node.name.value and isinstance(node.value.value, str):
+            self.report(node, "hardcoded password")
+
+
+class Strings(Rule):
+    def start(self, path):
+        self.count = 0
+
+    def visit_Value(self, node):
+        if isinstance(node.value, str) and not isinstance(node, Id):
+            self.count += 1
+
+    def visit_Id(self, node):
+        pass
+
+
+class Types(Rule):
+    def visit_Id(self, node):
+        self.report(node, node.value)
+
+
+class Failing(Rule):
+    def visit_FunctionCall(self, node):
+        raise ValueError(node.name)
+
+
+class TestClass(unittest.TestCase):
+    code = """class a {
+  $password = 'secret'
+  file { '/tmp/a': mode => 644 }
+  file { '/tmp/b': mode => '0644' }
+  package { 'p': mode => 1 }
+}
+"""
+
+    def test_run(self):
+        strings = Strings()
+        engine = Engine([FileMode(), Passwords(), strings])
+        findings = engine.run(parse(self.code)[0], "a.pp")
+        self.assertEqual(
+            [(f.path, f.rule, f.line, f.col) for f in findings],
+            [("a.pp", "hardcoded-password", 2, 3), ("a.pp", "FileMode", 3, 28)],
+        )
+        self.assertEqual(strings.count, 5)
+        self.assertEqual(engine.timings, {})
+        self.assertEqual(engine.run(parse("$a = 1")[0]), [])
+        self.assertEqual(strings.count, 0)
+
+    def test_dispatch(self):
+        engine = Engine([FileMode(), Passwords(), Strings()])
+        engine.run(parse(self.code)[0])
+        self.assertEqual(len(engine._calls[Resource]), 1)
+        self.assertEqual(engine._calls[Id][0].__func__, Strings.visit_Id)
+
+    def test_arena(self):
+        arena, _ = parse(self.code, representation="arena")
+        findings = Engine([FileMode(), Passwords()]).run(arena)
+        self.assertEqual([f.line for f in findings], [2, 3])
+
+    def test_shared_nodes(self):
+        # The type of a resource expression is under each of its resources
+        code = "file { 'a': mode => '1'; 'b': mode => '2'; 'c': }"
+        for tree in (parse(code)[0], parse(code, representation="arena")[0]):
+            with self.subTest(tree=type(tree).__name__):
+                findings = Engine([Types()]).run(tree)
+                self.assertEqual(
+                    [(f.message, f.line, f.col) for f in findings],
+                    [("file", 1, 1), ("mode", 1, 13), ("mode", 1, 31)],
+                )
+
+    def test_timing(self):
+        engine = Engine([FileMode(), Passwords(), Strings()], timing=True)
+        engine.run(parse(self.code)[0])
+        self.assertEqual(
+            list(engine.timings), ["FileMode", "hardcoded-password", "Strings"]
+        )
+        self.assertTrue(all(t > 0 for t in engine.timings.values()))
+
+    def check(self, results):
+        self.assertEqual([r.path for r in results], ["a.pp", "b.pp", "c.pp"])
+        self.assertEqual(len(results[0].findings), 2)
+        self.assertIsInstance(results[1].error, InvalidPuppetScript)
+        self.assertIsInstance(results[2].error, ValueError)
+        self.assertGreater(results[0].timings["FileMode"], 0)
+
+    def test_check_many(self):
+        sources = [
+            ("a.pp", self.code),
+            ("b.pp", "file { 'x': mode => }"),
+            ("c.pp", "$a = f(1)"),
+        ]
+        rules = [FileMode(), Passwords(), Failing()]
+        self.check(list(check_many(rules, sources, workers=1, timing=True)))
+        self.check(list(check_many(rules, sources, workers=2, timing=True)))
@@ -0,0 +1,65 @@
+import unittest
+
+from puppetparser.parser import InvalidPuppetScript, Parser
+from tests.utility import comments, tree
+
+SCRIPTS = [
+    "",
+    " \t\n\n",
+    "$a = 'x' # set a\nfile { $a: }",
+    "/* a\n b */ $x = 0x1F + 07 + 1.5e3 - 2",
+    'class ntp::config (String $s = "a\\"b\n c") inherits ntp { }',
+    "if $a =~ /fo\\/o/ and $b !~ /x y/ { notice($a / 2 / 3) }",
+    "$a = @(END)\n  text\n    more\n  | END\nnotice($a)",
+    "Package['a'] -> File['b'] ~> Service['c'] <- User['d'] <~ Exec['e']",
+    "@@file { 'x': } File <<| tag == 'x' |>> User <| |>",
+    "$h = {'a' => 1, b => [2, 3]} $h['a'] += 1 $s = Sensitive('x')",
+    "node default { include ::ntp require a::b contain c }",
+    "$x = 1  \n /* unterminated",
+]
+
+ERRORS = ["$a = 1\r\n", "$a = 'abc", "  \n  ^", "$a = (1"]
+
+
+class TestClass(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser()
+
+    def test_same_tokens(self):
+        for script in SCRIPTS:
+            with self.subTest(script=script):
+                self.assertEqual(
+                    list(self.parser.tokenize(script, "scanner")),
+                    list(self.parser.tokenize(script, "ply")),
+                )
+
+    def test_same_parse(self):
+        for script in SCRIPTS:
+            with self.subTest(script=script):
+                try:
+                    expected = self.parser.parse(script, lexer="ply")
+                except InvalidPuppetScript as e:
+                    with self.assertRaises(InvalidPuppetScript) as cm:
+                        self.parser.parse(script, lexer="scanner")
+                    self.assertEqual(str(cm.exception), str(e))
+                    continue
+                elements, found = self.parser.parse(script, lexer="scanner")
+                self.assertEqual(tree(elements), tree(expected[0]))
+                self.assertEqual(comments(found), comments(expected[1]))
+
+    def test_same_errors(self):
+        for script in ERRORS:
+            with self.subTest(script=script):
+                with self.assertRaises(InvalidPuppetScript) as ply:
+                    self.parser.parse(script, lexer="ply")
+                with self.assertRaises(InvalidPuppetScript) as scanner:
+                    self.parser.parse(script, lexer="scanner")
+                self.assertEqual(str(scanner.exception), str(ply.exception))
+
+    def test_lines(self):
+        tokens = list(self.parser.tokenize("$a = 'x\ny'\n\n$b = 1"))
+        self.assertEqual([t.line for t in tokens], [1, 1, 1, 4, 4, 4])
+
+    def test_unknown_lexer(self):
+        with self.assertRaises(ValueError):
+            self.parser.parse("$a = 1", lexer="other")
@@ -0,0 +1,47 @@
+import unittest
+
+from puppetparser.model import Resource
+from puppetparser.parser import parse
+
+
+class TestClass(unittest.TestCase):
+    code = """
+        file { '/tmp/a': ensure => present, owner => 'root' }
+        file { '/tmp/b': ensure => present, owner => 'root', mode => '0644' }
+        $x = { 'root' => ['root', 1, 1.0, true] }
+    """
+
+    def test_interning(self):
+        res, _ = parse(self.code)
+        a, b = res[0], res[1]
+        self.assertIsNot(a.type, b.type)
+        self.assertIs(a.type.value, b.type.value)
+        self.assertIs(a.attributes[0].value.value, b.attributes[0].value.value)
+        self.assertIs(a.attributes[1].value.value, b.attributes[1].value.value)
+
+    def test_shared_leaves(self):
+        res, _ = parse(self.code, share_leaves=True)
+        a, b = res[0], res[1]
+        self.assertIsInstance(a, Resource)
+        self.assertIs(a.type, b.type)
+        self.assertIs(a.attributes[0].key, b.attributes[0].key)
+        self.assertIs(a.attributes[1].value, b.attributes[1].value)
+        self.assertEqual((b.type.line, b.attributes[1].value.line), (2, 2))
+
+        # Values are only shared with leaves of the same class and type
+        hash = res[2].value.value
+        key, array = next(iter(hash.items()))
+        self.assertIs(key, array.value[0])
+        self.assertIs(key, a.attributes[1].value)
+        self.assertEqual([type(v.value) for v in array.value], [str, int, float, bool])
+
+    def test_same_values(self):
+        shared, _ = parse(self.code, share_leaves=True)
+        res, _ = parse(self.code)
+        for a, b in zip(shared[:2], res[:2]):
+            self.assertEqual(a.type, b.type)
+            self.assertEqual(a.title, b.title)
+            self.assertEqual(
+                [(x.key, x.value) for x in a.attributes],
+                [(x.key, x.value) for x in b.attributes],
+            )
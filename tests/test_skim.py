@@ -0,0 +1,85 @@
+import unittest
+
+from puppetparser.model import (
+    Include,
+    Node,
+    PuppetClass,
+    Require,
+    ResourceDeclaration,
+    Value,
+)
+from puppetparser.parser import parse
+from puppetparser.skim import Declaration, skim
+
+
+class TestClass(unittest.TestCase):
+    code = """
+        class apache (
+            String $content = '{',
+            Optional[Hash[String, Any]] $options = { 'a' => $b },
+            $port,
+        ) inherits apache::params {
+            include apache::mod, 'apache::ssl'
+            file { '/etc/motd': content => $content, require => Package['x'] }
+            if $name =~ /^{/ { contain(apache::service) }
+            class inner { include nested }
+        }
+        # class commented { }
+        define apache::vhost ($docroot = $x / 2) {
+            require ['apache', 'apache::vhosts']
+        }
+        node 'web.example.com' {
+            include apache
+        }
+    """
+
+    def test_skim(self):
+        result = skim(self.code)
+        self.assertEqual(
+            result.declarations,
+            [
+                Declaration("class", "apache", ["$content", "$options", "$port"], 2),
+                Declaration("define", "apache::vhost", ["$docroot"], 13),
+                Declaration("node", "web.example.com", [], 16),
+            ],
+        )
+        self.assertEqual(
+            result.includes, ["apache::mod", "apache::ssl", "nested", "apache"]
+        )
+        self.assertEqual(result.requires, ["apache", "apache::vhosts"])
+        self.assertEqual(result.contains, ["apache::service"])
+
+    def test_same_as_parse(self):
+        elements, _ = parse(self.code)
+        kinds = {PuppetClass: "class", ResourceDeclaration: "define", Node: "node"}
+        declarations = [
+            Declaration(
+                kinds[type(e)],
+                e.name,
+                [p.name for p in getattr(e, "parameters", [])],
+                e.line,
+            )
+            for e in elements
+        ]
+        result = skim(self.code)
+        self.assertEqual(result.declarations, declarations)
+
+        include = elements[0].block[0]
+        self.assertIsInstance(include, Include)
+        self.assertEqual(result.includes[:2], [v.value for v in include.inc])
+        require = elements[1].block[0]
+        self.assertIsInstance(require, Require)
+        self.assertEqual(
+            result.requires,
+            [v.value for v in require.req[0].value if isinstance(v, Value)],
+        )
+
+    def test_type_alias(self):
+        result = skim("type Port = Integer[1, 65535]\nfunction f($a) >> Port { $a }")
+        self.assertEqual(
+            result.declarations,
+            [
+                Declaration("type", "Port", [], 1),
+                Declaration("function", "f", ["$a"], 2),
+            ],
+        )
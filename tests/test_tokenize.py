@@ -0,0 +1,57 @@
+import unittest
+
+import puppetparser
+from puppetparser.parser import InvalidPuppetScript, Token
+
+
+class TestClass(unittest.TestCase):
+    def test_tokens(self):
+        code = "$a = 'x' # set a\nfile { $a: }"
+        self.assertEqual(
+            list(puppetparser.tokenize(code)),
+            [
+                Token("ID", "$a", 0, 2, 1),
+                Token("EQUAL", "=", 3, 4, 1),
+                Token("STRING", "x", 5, 8, 1),
+                Token("COMMENT", "# set a", 9, 16, 1),
+                Token("ID", "file", 17, 21, 2),
+                Token("LBRACKET", "{", 22, 23, 2),
+                Token("ID", "$a", 24, 26, 2),
+                Token("COLON", ":", 26, 27, 2),
+                Token("RBRACKET", "}", 28, 29, 2),
+            ],
+        )
+
+    def test_block_comment(self):
+        tokens = list(puppetparser.tokenize("/* a\n b */ $x"))
+        self.assertEqual(tokens[0], Token("COMMENT", "/* a\n b */", 0, 10, 1))
+        self.assertEqual(tokens[1], Token("ID", "$x", 11, 13, 2))
+
+    def test_regex(self):
+        types = [t.type for t in puppetparser.tokenize("$a = $b / 2 =~ /x y/")]
+        self.assertEqual(
+            types,
+            [
+                "ID",
+                "EQUAL",
+                "ID",
+                "ARITH_DIV",
+                "INTEGER",
+                "CMP_REGEX_MATCH",
+                "ARITH_DIV",
+                "REGEXPRESSION",
+                "ARITH_DIV",
+            ],
+        )
+
+    def test_heredoc(self):
+        code = '$a = @("END")\n  text\n  |END\n'
+        tokens = list(puppetparser.tokenize(code))
+        self.assertEqual(tokens[6], Token("STRING", "\n  text\n  ", 13, 23, 1))
+        self.assertEqual([t.type for t in tokens[7:]], ["BAR", "ID_TYPE"])
+
+    def test_lazy(self):
+        tokens = puppetparser.tokenize("$a = 1\n$b = ~")
+        self.assertEqual(next(tokens), Token("ID", "$a", 0, 2, 1))
+        with self.assertRaises(InvalidPuppetScript):
+            list(tokens)
@@ -0,0 +1,104 @@
+import unittest
+
+from puppetparser.arena import KINDS, Arena
+from puppetparser.model import (
+    Array,
+    Attribute,
+    Hash,
+    Id,
+    If,
+    PuppetClass,
+    Resource,
+    Value,
+)
+from puppetparser.parser import parse
+from puppetparser.visitor import CHILDREN, SKIP, Visitor, children, walk
+
+
+class TestClass(unittest.TestCase):
+    code = """
+class a ($x = 1) {
+  file { '/tmp/a': content => "${x}", mode => { 'a' => [1, $x] } }
+  if $x { $y = 1 } elsif $x == 2 { $y = 2 }
+}
+$z = a(1) |$v| { notice($v) }
+"""
+
+    def test_children(self):
+        self.assertEqual(CHILDREN[Id], ())
+        self.assertEqual(CHILDREN[Resource], ("type", "title", "attributes"))
+        self.assertIsNone(CHILDREN[str])
+        resource = parse(self.code)[0][0].block[0]
+        self.assertEqual(
+            [type(c) for c in children(resource)], [Id, Value, Attribute, Attribute]
+        )
+        hash = children(children(resource)[3])[1]
+        self.assertIsInstance(hash, Hash)
+        self.assertEqual([type(c) for c in children(hash)], [Value, Array])
+
+    def test_walk(self):
+        elements, _ = parse(self.code)
+        arena = Arena(elements)
+        self.assertEqual(
+            [type(e) for e in walk(elements)], [KINDS[k] for k in arena.kinds]
+        )
+        lines = [arena.span(i)[0] for i in range(arena.node_count)]
+        self.assertEqual([e.line for e in walk(arena)], lines)
+        first = elements[0]
+        self.assertEqual(list(walk(first))[:2], [first, first.block[0]])
+
+    def test_deep(self):
+        code = "if $a { }" + "".join(f" elsif $a == {i} {{ }}" for i in range(3000))
+        elements, _ = parse(code)
+        self.assertEqual(sum(isinstance(e, If) for e in walk(elements)), 3001)
+
+        class Count(Visitor):
+            count = 0
+
+            def visit_If(self, node):
+                self.count += 1
+
+        visitor = Count()
+        visitor.visit(elements)
+        self.assertEqual(visitor.count, 3001)
+
+    def test_visitor(self):
+        elements, _ = parse(self.code)
+        events = []
+
+        class Events(Visitor):
+            def visit_Value(self, node):
+                events.append(("value", type(node).__name__))
+
+            def visit_Id(self, node):
+                events.append(("id", node.value))
+
+            def visit_PuppetClass(self, node):
+                events.append(("class", node.name))
+
+            def leave_PuppetClass(self, node):
+                events.append(("leave", node.name))
+
+            def visit_If(self, node):
+                return SKIP
+
+        Events().visit(elements)
+        self.assertEqual(events[0], ("class", "a"))
+        self.assertIn(("id", "$x"), events)
+        self.assertIn(("value", "Hash"), events)
+        self.assertNotIn(("id", "$y"), events)
+        self.assertEqual(events.index(("leave", "a")), events.index(("id", "$z")) - 1)
+
+    def test_dispatch(self):
+        class Values(Visitor):
+            def visit_Value(self, node):
+                pass
+
+        class Resources(Visitor):
+            def visit_Resource(self, node):
+                pass
+
+        Values().visit(parse(self.code)[0])
+        self.assertIs(Values._dispatch[Id][0], Values.visit_Value)
+        self.assertIsNone(Resources._dispatch[Id][0])
+        self.assertIsNone(Resources._dispatch[PuppetClass][1])
@@ -1,3 +1,6 @@
+from puppetparser.arena import Arena
+
+
 def assertHash(test, hash_p, hash):
     for k, v in hash_p.items():
         test.assertTrue(k.value in hash)
@@ -10,3 +13,12 @@ def assertArray(test, array_p, array):
         test.assertEqual(array_p[i].value, array[i])
 
     test.assertEqual(len(array), len(array_p))
+
+
+def tree(elements):
+    arena = Arena(elements)
+    return list(arena.kinds), list(arena.spans), list(arena.fields), arena.constants
+
+
+def comments(parsed):
+    return [(c.line, c.col, c.end_line, c.end_col, c.content) for c in parsed]